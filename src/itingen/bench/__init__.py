@@ -0,0 +1,14 @@
+"""Synthetic trips and benchmarks for the itinerary pipeline."""
+from itingen.bench.fakes import FakeGeminiClient, FakeMapsClient, FakeWeatherClient
+from itingen.bench.runner import run_benchmark
+from itingen.bench.synthetic import SyntheticTripSpec, generate_trip
+
+
+__all__ = [
+    "SyntheticTripSpec",
+    "generate_trip",
+    "run_benchmark",
+    "FakeGeminiClient",
+    "FakeMapsClient",
+    "FakeWeatherClient",
+]
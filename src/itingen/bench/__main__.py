@@ -0,0 +1,52 @@
+"""Command-line entry point: ``python -m itingen.bench``."""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from itingen.bench.runner import DEFAULT_SIZES, format_entry, run_benchmark, write_report
+
+
+def _sizes(value: str) -> List[int]:
+    try:
+        sizes = [int(part.replace("_", "")) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sizes: {value!r}")
+    if not sizes or any(size <= 0 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive integers")
+    return sizes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m itingen.bench",
+        description="Benchmark the itinerary pipeline on synthetic trips",
+    )
+    parser.add_argument(
+        "--sizes", type=_sizes, default=DEFAULT_SIZES,
+        help="Comma-separated approximate event counts (default: 10,100,1000,10000)",
+    )
+    parser.add_argument("--output", default="bench.json", help="Where to write the JSON results")
+    parser.add_argument("--work-dir", help="Directory for generated trips and outputs (default: temp dir)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic trips")
+    parser.add_argument("--pdf", action="store_true", help="Also time the PDF emitter")
+    parser.add_argument("--memory", action="store_true", help="Record per-stage peak memory (slower)")
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary work directory")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        args.sizes,
+        work_dir=args.work_dir,
+        pdf=args.pdf,
+        memory=args.memory,
+        seed=args.seed,
+        keep=args.keep,
+        on_result=lambda entry: print(format_entry(entry), flush=True),
+    )
+    path = write_report(report, args.output)
+    print(f"Results written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
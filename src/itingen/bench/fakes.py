@@ -0,0 +1,74 @@
+"""Deterministic local stand-ins for the AI, Maps and Weather clients.
+
+AIDEV-NOTE: The fakes expose the same methods the hydrators call on the real
+clients and derive every answer from a hash of the request, so benchmark runs
+are reproducible, free and offline. They can optionally sleep per call to
+model network latency.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, Optional
+
+
+def _digest(*parts: str) -> int:
+    return int.from_bytes(hashlib.sha256("|".join(parts).encode()).digest()[:8], "big")
+
+
+class FakeGeminiClient:
+    """Stands in for GeminiClient.generate_text."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def generate_text(self, prompt: str) -> str:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return f"Synthetic narrative {_digest(prompt) % 100000:05d}."
+
+
+class FakeMapsClient:
+    """Stands in for GoogleMapsClient.get_directions."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def get_directions(self, origin: str, destination: str, mode: str = "driving") -> Optional[Dict[str, Any]]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        seconds = 300 + _digest(origin, destination, mode) % (4 * 3600)
+        km = seconds * 70 // 3600
+        return {
+            "duration_seconds": seconds,
+            "duration_text": f"{seconds // 3600} hours {seconds % 3600 // 60} mins",
+            "distance_text": f"{km} km",
+            "origin": origin,
+            "destination": destination,
+            "mode": mode,
+        }
+
+
+class FakeWeatherClient:
+    """Stands in for WeatherSparkClient.get_typical_weather."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def get_typical_weather(self, location: str, date: str) -> Optional[Dict[str, Any]]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        h = _digest(location, date)
+        low = 45 + h % 20
+        precip = h % 70
+        return {
+            "high_temp_f": low + 8 + h % 12,
+            "low_temp_f": low,
+            "conditions": "mostly sunny" if precip <= 15 else "partly cloudy" if precip <= 35 else "likely rain",
+            "precip_chance_pct": precip,
+        }
@@ -0,0 +1,151 @@
+"""Benchmark runner: times every pipeline stage on synthetic trips of growing size.
+
+AIDEV-NOTE: Each size gets its own generated trip and runs the generate
+pipeline (file parsing, sorting, wrap-up timing, annotations, transitions,
+maps, weather, narratives, Markdown and optionally PDF output) with the
+deterministic fakes from itingen.bench.fakes in place of the network clients.
+Per-stage measurements come from the orchestrator's own StageProfiler trace,
+so the numbers match what ``itingen generate --profile`` reports.
+"""
+
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from itingen.bench.fakes import FakeGeminiClient, FakeMapsClient, FakeWeatherClient
+from itingen.bench.synthetic import SyntheticTripSpec, generate_trip
+from itingen.hydrators.ai.narratives import NarrativeHydrator
+from itingen.hydrators.maps import MapsHydrator
+from itingen.hydrators.weather import WeatherHydrator
+from itingen.pipeline.annotations import EmotionalAnnotationHydrator
+from itingen.pipeline.normalization import TimeNormalizationHydrator
+from itingen.pipeline.nz_transitions import create_nz_transition_registry
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+from itingen.pipeline.sorting import ChronologicalSorter
+from itingen.pipeline.timing import WrapUpHydrator
+from itingen.pipeline.transitions_logic import TransitionHydrator
+from itingen.providers import FileProvider
+from itingen.rendering.markdown import MarkdownEmitter
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = [10, 100, 1_000, 10_000]
+
+
+def build_pipeline(trip_dir: Path, pdf: bool = False, memory: bool = False) -> PipelineOrchestrator:
+    """Assemble the generate pipeline with fake clients for trip_dir."""
+    orchestrator = PipelineOrchestrator(FileProvider(trip_dir=trip_dir), profile=True, profile_memory=memory)
+    orchestrator.add_hydrator(TimeNormalizationHydrator())
+    orchestrator.add_hydrator(ChronologicalSorter())
+    orchestrator.add_hydrator(WrapUpHydrator())
+    orchestrator.add_hydrator(EmotionalAnnotationHydrator())
+    orchestrator.add_hydrator(TransitionHydrator(create_nz_transition_registry()))
+    orchestrator.add_hydrator(MapsHydrator(client=FakeMapsClient()))
+    orchestrator.add_hydrator(WeatherHydrator(client=FakeWeatherClient()))
+    orchestrator.add_hydrator(NarrativeHydrator(client=FakeGeminiClient()))
+    orchestrator.add_emitter(MarkdownEmitter())
+    if pdf:
+        from itingen.rendering.pdf.renderer import PDFEmitter
+
+        orchestrator.add_emitter(PDFEmitter())
+    return orchestrator
+
+
+def run_size(size: int, work_dir: Path, pdf: bool = False, memory: bool = False, seed: int = 0) -> Dict[str, Any]:
+    """Generate a trip of about ``size`` events, run the pipeline and return its results entry."""
+    spec = SyntheticTripSpec.for_size(size, seed=seed, venues=max(5, min(size // 10, 2_000)))
+    trip_dir = work_dir / f"trip_{size}"
+    if trip_dir.exists():
+        shutil.rmtree(trip_dir)
+
+    start = time.perf_counter()
+    generate_trip(trip_dir, spec)
+    generate_seconds = time.perf_counter() - start
+
+    orchestrator = build_pipeline(trip_dir, pdf=pdf, memory=memory)
+    start = time.perf_counter()
+    result = orchestrator.execute(output_dir=work_dir / f"output_{size}")
+    total_seconds = time.perf_counter() - start
+
+    trace = orchestrator.trace.to_dict()
+    return {
+        "size": size,
+        "events": len(result),
+        "days": spec.days,
+        "events_per_day": spec.events_per_day,
+        "travelers": spec.travelers,
+        "venues": spec.venues,
+        "generate_seconds": generate_seconds,
+        "total_seconds": total_seconds,
+        "events_per_second": len(result) / total_seconds if total_seconds else None,
+        "stages": trace["stages"],
+    }
+
+
+def run_benchmark(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    work_dir: Optional[str | Path] = None,
+    pdf: bool = False,
+    memory: bool = False,
+    seed: int = 0,
+    keep: bool = False,
+    on_result=None,
+) -> Dict[str, Any]:
+    """Run the benchmark for every size and return the machine-readable report.
+
+    Args:
+        sizes: Approximate event counts to benchmark
+        work_dir: Where trips and outputs are written (a temp dir if omitted)
+        pdf: Also time the PDF emitter
+        memory: Record per-stage peak memory (slower)
+        seed: Seed for the synthetic trips
+        keep: Keep a temporary work_dir instead of deleting it
+        on_result: Optional callback receiving each size's entry as it finishes
+    """
+    temp = work_dir is None
+    root = Path(tempfile.mkdtemp(prefix="itingen-bench-")) if temp else Path(work_dir)
+    root.mkdir(parents=True, exist_ok=True)
+
+    report: Dict[str, Any] = {
+        "version": RESULTS_VERSION,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "options": {"pdf": pdf, "memory": memory, "seed": seed},
+        "results": [],
+    }
+    try:
+        for size in sizes:
+            entry = run_size(size, root, pdf=pdf, memory=memory, seed=seed)
+            report["results"].append(entry)
+            if on_result is not None:
+                on_result(entry)
+    finally:
+        if temp and not keep:
+            shutil.rmtree(root, ignore_errors=True)
+    return report
+
+
+def write_report(report: Dict[str, Any], path: str | Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def format_entry(entry: Dict[str, Any]) -> str:
+    """One summary block per size: total time plus the slowest stages."""
+    lines = [
+        f"{entry['events']:>9} events  {entry['total_seconds']:>9.3f}s  "
+        f"({entry['events_per_second'] or 0:,.0f} events/s)"
+    ]
+    stages: List[Dict[str, Any]] = sorted(entry["stages"], key=lambda s: s["wall_seconds"], reverse=True)
+    for stage in stages:
+        lines.append(f"    {stage['kind']:<9} {stage['name']:<40} {stage['wall_seconds']:>9.3f}s")
+    return "\n".join(lines)
@@ -0,0 +1,130 @@
+"""Synthetic trip generator for benchmarks and scale tests.
+
+AIDEV-NOTE: Trips are written in exactly the layout LocalFileProvider reads
+(config.yaml, events/<date>.md day files, venues/<venue_id>.json), so a
+synthetic trip exercises the same parsing and hydration code as a real one.
+Output is fully determined by the spec (including its seed).
+"""
+
+import datetime as dt
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+import yaml
+
+# (kind, share of events); drives, ferries and flights exercise travel fields
+EVENT_MIX = [
+    ("activity", 0.35),
+    ("meal", 0.25),
+    ("drive", 0.2),
+    ("lodging_checkin", 0.08),
+    ("ferry", 0.06),
+    ("flight_departure", 0.06),
+]
+
+CITIES = ["Auckland", "Rotorua", "Taupo", "Wellington", "Queenstown", "Te Anau", "Waiheke Island"]
+VENUE_KINDS = ["lodging", "restaurant", "attraction", "cafe", "transport"]
+
+
+@dataclass(frozen=True)
+class SyntheticTripSpec:
+    """Shape of a synthetic trip."""
+    days: int = 10
+    events_per_day: int = 8
+    travelers: int = 4
+    venues: int = 20
+    seed: int = 0
+    start_date: str = "2026-01-01"
+    timezone: str = "Pacific/Auckland"
+
+    @property
+    def total_events(self) -> int:
+        return self.days * self.events_per_day
+
+    @classmethod
+    def for_size(cls, events: int, events_per_day: int = 10, **kwargs) -> "SyntheticTripSpec":
+        """Spec with about ``events`` events spread over whole days."""
+        per_day = max(1, min(events, events_per_day))
+        days = max(1, -(-events // per_day))
+        return cls(days=days, events_per_day=per_day, **kwargs)
+
+
+def traveler_slugs(spec: SyntheticTripSpec) -> List[str]:
+    return [f"traveler{i + 1}" for i in range(spec.travelers)]
+
+
+def generate_trip(trip_dir: str | Path, spec: SyntheticTripSpec) -> Path:
+    """Write a synthetic trip to trip_dir and return its path."""
+    trip_dir = Path(trip_dir)
+    events_dir = trip_dir / "events"
+    venues_dir = trip_dir / "venues"
+    events_dir.mkdir(parents=True, exist_ok=True)
+    venues_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(spec.seed)
+    slugs = traveler_slugs(spec)
+
+    config = {
+        "trip_name": f"Synthetic trip ({spec.total_events} events)",
+        "timezone": spec.timezone,
+        "people": [{"name": slug.capitalize(), "slug": slug} for slug in slugs],
+    }
+    with open(trip_dir / "config.yaml", "w", encoding="utf-8") as f:
+        yaml.safe_dump(config, f, sort_keys=False)
+
+    venues = []
+    for i in range(spec.venues):
+        city = CITIES[i % len(CITIES)]
+        venue = {
+            "venue_id": f"venue-{i:05d}",
+            "canonical_name": f"{city} Venue {i}",
+            "aliases": [f"Venue {i}"],
+            "kind": VENUE_KINDS[i % len(VENUE_KINDS)],
+            "address": f"{i + 1} Example Street, {city}, New Zealand",
+            "latitude": round(-36.8 - rng.random() * 9, 5),
+            "longitude": round(168.3 + rng.random() * 7, 5),
+            "metadata": {"created_at": "2026-01-01T00:00:00Z", "updated_at": "2026-01-01T00:00:00Z"},
+        }
+        venues.append(venue)
+        with open(venues_dir / f"{venue['venue_id']}.json", "w", encoding="utf-8") as f:
+            json.dump(venue, f, indent=2)
+
+    kinds = [kind for kind, _ in EVENT_MIX]
+    weights = [weight for _, weight in EVENT_MIX]
+    start = dt.date.fromisoformat(spec.start_date)
+    # Spread a day's events between 07:00 and 22:00
+    step = max(1, (15 * 60) // spec.events_per_day)
+    for day in range(spec.days):
+        date = (start + dt.timedelta(days=day)).isoformat()
+        lines = [f"# Synthetic trip – {date}", f"- date: {date}", f"- timezone: {spec.timezone}", ""]
+        for n in range(spec.events_per_day):
+            minutes = 7 * 60 + n * step
+            hh, mm = divmod(minutes, 60)
+            kind = rng.choices(kinds, weights)[0]
+            venue = venues[rng.randrange(len(venues))] if venues else None
+            location = venue["canonical_name"] if venue else rng.choice(CITIES)
+            who = rng.sample(slugs, rng.randint(1, len(slugs))) if slugs and rng.random() < 0.3 else slugs
+            # Local times are written as UTC+13 (NZDT) for a deterministic time_utc
+            utc = dt.datetime.fromisoformat(f"{date}T{hh:02d}:{mm:02d}") - dt.timedelta(hours=13)
+
+            lines.append(f"### Event: {kind.replace('_', ' ').title()} {day + 1}.{n + 1} at {location}")
+            lines.append(f"- id: {date}T{hh:02d}{mm:02d}-{kind}-{n}")
+            lines.append(f"- kind: {kind}")
+            lines.append(f"- who: {', '.join(who)}")
+            lines.append(f"- time_local: {date} {hh:02d}:{mm:02d}")
+            lines.append(f"- time_utc: {utc.strftime('%Y-%m-%dT%H:%M:%SZ')}")
+            lines.append(f"- location: {location}")
+            if venue:
+                lines.append(f"- venue_id: {venue['venue_id']}")
+            if kind in {"drive", "ferry"}:
+                lines.append(f"- travel_from: {rng.choice(CITIES)}")
+                lines.append(f"- travel_to: {rng.choice(CITIES)}")
+            lines.append(f"- duration: {rng.randint(0, 2)}h{rng.choice([0, 15, 30, 45])}m")
+            lines.append(f"- description: Synthetic {kind.replace('_', ' ')} number {n + 1} on day {day + 1}.")
+            lines.append("")
+        with open(events_dir / f"{date}.md", "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+    return trip_dir
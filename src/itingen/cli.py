@@ -5,12 +5,24 @@ It supports generating itineraries and managing venues.
 """
 
 import argparse
+import io
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from itingen.core.base import BaseEmitter, BaseHydrator, BaseProvider
 from itingen.pipeline.orchestrator import PipelineOrchestrator
-from itingen.providers import FileProvider
+from itingen.pipeline.batch import FanOutPipeline, PipelineBranch, people_slugs
+from itingen.pipeline.profiling import PipelineTrace
+from itingen.pipeline.watch import WatchSession, WatchUpdate
+from itingen.providers import BundleProvider, FileProvider, SqliteProvider
+from itingen.providers.bundle import BUNDLE_SUFFIX, compile_trip
+from itingen.providers.sqlite_provider import export_trip, import_trip
+from itingen.providers.parse_cache import PARSE_CACHE_DIR_NAME
+from itingen.pipeline.normalization import TimeNormalizationHydrator
 from itingen.pipeline.sorting import ChronologicalSorter
 from itingen.pipeline.filtering import PersonFilter
 from itingen.pipeline.timing import WrapUpHydrator
@@ -19,15 +31,80 @@ from itingen.pipeline.transitions_logic import TransitionHydrator
 from itingen.pipeline.nz_transitions import create_nz_transition_registry
 from itingen.rendering.markdown import MarkdownEmitter
 from itingen.rendering.pdf.renderer import PDFEmitter
+from itingen.rendering.pdf.fonts import register_fonts
 from itingen.integrations.ai.gemini import GeminiClient
 from itingen.integrations.ai.transition_prompts import TRANSITION_STYLE_TEMPLATE
 from itingen.hydrators.ai.banner import BannerImageHydrator
 from itingen.hydrators.ai.cache import AiCache
 from itingen.hydrators.ai.transitions import GeminiTransitionHydrator
+from itingen.hydrators.venues import VenueResolutionHydrator
 
 DayBannerGenerator = BannerImageHydrator
 
 
+def _add_output_options(parser: argparse.ArgumentParser) -> None:
+    """Add the output and enrichment options shared by generate and generate-all."""
+    parser.add_argument(
+        "--format", 
+        choices=["markdown", "pdf", "both"], 
+        default="both", 
+        help="Output format (default: both)"
+    )
+    parser.add_argument("--output-dir", type=Path, default=Path("output"), help="Directory to write output files")
+    parser.add_argument(
+        "--pdf-banners",
+        action="store_true",
+        help="Enable AI-generated day banner images in the PDF (requires API key; may incur costs)",
+    )
+    parser.add_argument(
+        "--banner-model",
+        choices=["gemini-3-pro-image-preview", "gemini-2.5-flash-image"],
+        default="gemini-2.5-flash-image",
+        help="Model for banner generation (default: gemini-2.5-flash-image for free tier)",
+    )
+    parser.add_argument(
+        "--ai-transitions",
+        action="store_true",
+        help="Use AI-powered transition generation via Gemini API (requires API key; may incur costs)",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        metavar="N",
+        help="Parse event day files on N processes (0 = one per CPU; default: serial)",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="Cache parsed events and venues under the output directory and re-parse only changed files",
+    )
+    parser.add_argument(
+        "--lazy-venues",
+        action="store_true",
+        help="Index venue files and parse each venue only when a stage first looks it up",
+    )
+    parser.add_argument(
+        "--resolve-venues",
+        action="store_true",
+        help="Resolve free-text locations and travel endpoints to venue ids",
+    )
+    parser.add_argument(
+        "--memoize",
+        action="store_true",
+        help="Reuse hydrator outputs from previous runs when their inputs are unchanged",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Save the hydrated events after every pipeline stage so a failed run can be resumed",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume from the last checkpoint that matches the current inputs (implies --checkpoint)",
+    )
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """Main entry point for the itingen CLI."""
     if args is None:
@@ -42,31 +119,113 @@ def main(args: Optional[List[str]] = None) -> int:
     # Generate command
     generate_parser = subparsers.add_parser("generate", help="Generate a trip itinerary")
     generate_parser.add_argument("--trip", required=True, help="Name of the trip (directory in trips/)")
-    generate_parser.add_argument("--person", help="Filter for a specific person's slug")
+    person_group = generate_parser.add_mutually_exclusive_group()
+    person_group.add_argument("--person", help="Filter for a specific person's slug")
+    person_group.add_argument(
+        "--all-people",
+        action="store_true",
+        help="Generate an itinerary for every person in config.yaml from a single load",
+    )
     generate_parser.add_argument(
-        "--format", 
-        choices=["markdown", "pdf", "both"], 
-        default="both", 
-        help="Output format (default: both)"
+        "--workers",
+        type=int,
+        help="Worker pool size for --all-people (default: one per person)",
     )
-    generate_parser.add_argument("--output-dir", type=Path, default=Path("output"), help="Directory to write output files")
+    _add_output_options(generate_parser)
     generate_parser.add_argument(
-        "--pdf-banners",
+        "--parallel-emitters",
         action="store_true",
-        help="Enable AI-generated day banner images in the PDF (requires API key; may incur costs)",
+        help="Run output emitters concurrently (PDF builds in a separate process)",
+    )
+    trip_source_group = generate_parser.add_mutually_exclusive_group()
+    trip_source_group.add_argument(
+        "--db",
+        type=Path,
+        help="Read the trip from a SQLite database made by 'itingen db import' instead of trips/",
+    )
+    trip_source_group.add_argument(
+        "--bundle",
+        type=Path,
+        help="Read the trip from a bundle made by 'itingen compile' instead of trips/",
     )
     generate_parser.add_argument(
-        "--banner-model",
-        choices=["gemini-3-pro-image-preview", "gemini-2.5-flash-image"],
-        default="gemini-2.5-flash-image",
-        help="Model for banner generation (default: gemini-2.5-flash-image for free tier)",
+        "--stream",
+        action="store_true",
+        help="Load, hydrate and write one day at a time so memory stays bounded by a day's events",
+    )
+    generate_parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="TRACE_JSON",
+        help="Record per-stage timing, item counts and peak memory and write the trace as JSON",
     )
     generate_parser.add_argument(
+        "--cprofile-dir",
+        type=Path,
+        help="With --profile, also dump cProfile stats for each stage into this directory",
+    )
+
+    # Generate-all command
+    generate_all_parser = subparsers.add_parser(
+        "generate-all", help="Generate itineraries for every trip in a trips directory"
+    )
+    generate_all_parser.add_argument(
+        "--trips-dir", type=Path, default=Path("trips"), help="Directory containing trips (default: trips)"
+    )
+    generate_all_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximum number of trips built in parallel (default: number of CPUs)",
+    )
+    generate_all_parser.add_argument(
+        "--all-people",
+        action="store_true",
+        help="Also generate an itinerary for every person in each trip's config.yaml",
+    )
+    _add_output_options(generate_all_parser)
+
+    # Watch command
+    watch_parser = subparsers.add_parser(
+        "watch", help="Regenerate a trip itinerary incrementally whenever its files change"
+    )
+    watch_parser.add_argument("--trip", required=True, help="Name of the trip (directory in trips/)")
+    watch_parser.add_argument("--person", help="Filter for a specific person's slug")
+    watch_parser.add_argument(
+        "--format",
+        choices=["markdown", "pdf", "both"],
+        default="markdown",
+        help="Output format (default: markdown, for fast feedback)",
+    )
+    watch_parser.add_argument("--output-dir", type=Path, default=Path("output"), help="Directory to write output files")
+    watch_parser.add_argument(
         "--ai-transitions",
         action="store_true",
-        help="Use AI-powered transition generation via Gemini API (requires API key; may incur costs)",
+        help="Use AI-powered transition generation via Gemini API",
+    )
+    watch_parser.add_argument(
+        "--interval", type=float, default=0.5, help="Seconds between file change checks (default: 0.5)"
+    )
+
+    # Compile command
+    compile_parser = subparsers.add_parser(
+        "compile", help="Compile a trip into a single binary bundle for fast loading"
+    )
+    compile_parser.add_argument("--trip", required=True, help="Name of the trip (directory in trips/)")
+    compile_parser.add_argument(
+        "--output", type=Path, help="Bundle file to write (default: output/<trip>.itb)"
     )
 
+    # Trip database command
+    db_parser = subparsers.add_parser("db", help="Import or export a trip as a SQLite database")
+    db_subparsers = db_parser.add_subparsers(dest="subcommand", help="Database subcommand")
+    db_import_parser = db_subparsers.add_parser("import", help="Load a trip directory into a SQLite database")
+    db_import_parser.add_argument("--trip", required=True, help="Name of the trip (directory in trips/)")
+    db_import_parser.add_argument("--db", type=Path, required=True, help="SQLite file to write")
+    db_export_parser = db_subparsers.add_parser("export", help="Write a trip database back to the file layout")
+    db_export_parser.add_argument("--db", type=Path, required=True, help="SQLite file to read")
+    db_export_parser.add_argument("--output", type=Path, required=True, help="Trip directory to write")
+
     # Venues command
     venues_parser = subparsers.add_parser("venues", help="Manage trip venues")
     venues_subparsers = venues_parser.add_subparsers(dest="subcommand", help="Venue subcommand")
@@ -85,93 +244,187 @@ def main(args: Optional[List[str]] = None) -> int:
 
     if parsed_args.command == "generate":
         return _handle_generate(parsed_args)
+    elif parsed_args.command == "generate-all":
+        return _handle_generate_all(parsed_args)
+    elif parsed_args.command == "watch":
+        return _handle_watch(parsed_args)
+    elif parsed_args.command == "compile":
+        return _handle_compile(parsed_args)
+    elif parsed_args.command == "db":
+        return _handle_db(parsed_args)
     elif parsed_args.command == "venues":
         return _handle_venues(parsed_args)
 
     return 0
 
 
-def _handle_generate(args: argparse.Namespace) -> int:
-    """Handle the 'generate' command."""
+def _resolve_trip_path(trip: str) -> Path:
+    """Search for trip in trips/ or use the given path."""
+    trip_path = Path("trips") / trip
+    if not trip_path.exists():
+        trip_path = Path(trip)
+    return trip_path
+
+
+def _file_provider(args: argparse.Namespace, trip_path: Path) -> FileProvider:
+    """FileProvider for trip_path honouring --parse-workers, --parse-cache and --lazy-venues."""
+    cache_dir = None
+    if getattr(args, "parse_cache", False):
+        cache_dir = args.output_dir / args.trip / PARSE_CACHE_DIR_NAME
+    return FileProvider(
+        trip_dir=trip_path,
+        workers=getattr(args, "parse_workers", None),
+        cache_dir=cache_dir,
+        lazy_venues=getattr(args, "lazy_venues", False),
+    )
+
+
+def _provider(args: argparse.Namespace, trip_path: Path, person: Optional[str] = None) -> BaseProvider:
+    """Trip provider for args: the --db database (filtered in SQL), the --bundle or the trip files."""
+    if getattr(args, "db", None):
+        return SqliteProvider(args.db, person=person)
+    if getattr(args, "bundle", None):
+        return BundleProvider(args.bundle)
+    return _file_provider(args, trip_path)
+
+
+def _orchestrator_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """PipelineOrchestrator keyword arguments shared by all generate modes."""
+    return {
+        "memoize": getattr(args, "memoize", False),
+        "emitter_mode": "parallel" if getattr(args, "parallel_emitters", False) else "sequential",
+        "profile": getattr(args, "profile", None) is not None,
+        "cprofile_dir": getattr(args, "cprofile_dir", None),
+        "checkpoint": getattr(args, "checkpoint", False),
+        "resume": getattr(args, "resume", False),
+    }
+
+
+def _ai_resources(cache_dir: Path, shared: Dict[str, Any]) -> Tuple[GeminiClient, AiCache]:
+    """Return a Gemini client and the AI cache for cache_dir.
+    
+    The client is created once per `shared` dict and caches once per directory,
+    so batch modes reuse warm handles across people and trips.
+    """
+    if "client" not in shared:
+        shared["client"] = GeminiClient()
+    caches = shared.setdefault("caches", {})
+    if str(cache_dir) not in caches:
+        caches[str(cache_dir)] = AiCache(cache_dir)
+    return shared["client"], caches[str(cache_dir)]
+
+
+def _hydrator_chain(args: argparse.Namespace, cache_dir: Path, shared: Dict[str, Any]) -> List[BaseHydrator]:
+    """Build the hydrator chain shared by 'generate' and 'watch'."""
+    hydrators: List[BaseHydrator] = [TimeNormalizationHydrator(), ChronologicalSorter()]
+    if getattr(args, "person", None):
+        hydrators.append(PersonFilter(person_slug=args.person))
+    if getattr(args, "resolve_venues", False):
+        hydrators.append(VenueResolutionHydrator())
+    hydrators.extend([
+        WrapUpHydrator(),
+        EmotionalAnnotationHydrator(),
+        _transition_hydrator(args, cache_dir, shared),
+    ])
+    return hydrators
+
+
+def _transition_hydrator(args: argparse.Namespace, cache_dir: Path, shared: Dict[str, Any]) -> BaseHydrator:
+    """Build the transition hydrator selected by --ai-transitions."""
+    if getattr(args, "ai_transitions", False):
+        # Use AI-powered transitions
+        gemini_client, ai_cache = _ai_resources(cache_dir, shared)
+        return GeminiTransitionHydrator(
+            client=gemini_client,
+            cache=ai_cache,
+            style_template=TRANSITION_STYLE_TEMPLATE
+        )
+    # Use traditional registry-based transitions
+    transition_registry = create_nz_transition_registry()
+    return TransitionHydrator(transition_registry)
+
+
+def _build_emitters(args: argparse.Namespace, cache_dir: Path, shared: Dict[str, Any]) -> List[BaseEmitter]:
+    """Build the emitters selected by --format and --pdf-banners."""
+    emitters: List[BaseEmitter] = []
+    if args.format in ["markdown", "both"]:
+        emitters.append(MarkdownEmitter())
+    if args.format in ["pdf", "both"]:
+        banner_generator = None
+        if getattr(args, "pdf_banners", False):
+            client, ai_cache = _ai_resources(cache_dir, shared)
+            banner_generator = DayBannerGenerator(
+                client=client, 
+                cache=ai_cache,
+                cache_policy="stable_date",  # Stable during development
+                model=getattr(args, "banner_model", "gemini-2.5-flash-image")
+            )
+
+        emitters.append(PDFEmitter(banner_generator=banner_generator))
+    return emitters
+
+
+def _report_profile(args: argparse.Namespace, trace: Optional[PipelineTrace]) -> None:
+    """Write and print the profiling trace when --profile is set."""
+    if getattr(args, "profile", None) is not None and trace is not None:
+        trace_path = trace.write_json(args.profile)
+        print(trace.format_table())
+        print(f"Profile trace written to {trace_path}")
+
+
+def _handle_generate(args: argparse.Namespace, shared: Optional[Dict[str, Any]] = None) -> int:
+    """Handle the 'generate' command.
+    
+    Args:
+        args: Parsed generate arguments
+        shared: Optional dict of warm clients/caches reused across calls
+    """
     print(f"Generating itinerary for trip: {args.trip}...")
+    if shared is None:
+        shared = {}
     
     try:
-        # Initialize Provider
-        # Search for trip in trips/ or use absolute path
-        trip_path = Path("trips") / args.trip
-        if not trip_path.exists():
-             trip_path = Path(args.trip)
+        trip_path = getattr(args, "trip_path", None) or _resolve_trip_path(args.trip)
+        if getattr(args, "all_people", False):
+            if getattr(args, "stream", False):
+                raise ValueError("--stream cannot be combined with --all-people")
+            return _generate_all_people(args, trip_path, shared)
              
-        provider = FileProvider(trip_dir=trip_path)
+        provider = _provider(args, trip_path, person=args.person)
         
         # Initialize Orchestrator
-        orchestrator = PipelineOrchestrator(provider)
+        orchestrator = PipelineOrchestrator(provider, **_orchestrator_options(args))
         
-        # Add Hydrators
-        orchestrator.add_hydrator(ChronologicalSorter())
+        output_dir = args.output_dir / args.trip
         if args.person:
-            orchestrator.add_hydrator(PersonFilter(person_slug=args.person))
-        
-        # Add Wrap-up timing logic
-        orchestrator.add_hydrator(WrapUpHydrator())
+            output_dir = output_dir / args.person
+        cache_dir = output_dir / ".ai_cache"
         
-        # Add Emotional annotations
-        orchestrator.add_hydrator(EmotionalAnnotationHydrator())
-
-        # Add Transition descriptions
+        # Add Hydrators
+        for hydrator in _hydrator_chain(args, cache_dir, shared):
+            orchestrator.add_hydrator(hydrator)
         if getattr(args, "ai_transitions", False):
-            # Use AI-powered transitions
-            gemini_client = GeminiClient()
-            output_dir = args.output_dir / args.trip
-            if args.person:
-                output_dir = output_dir / args.person
-            cache_dir = output_dir / ".ai_cache"
-            ai_cache = AiCache(cache_dir)
-            
-            orchestrator.add_hydrator(
-                GeminiTransitionHydrator(
-                    client=gemini_client,
-                    cache=ai_cache,
-                    style_template=TRANSITION_STYLE_TEMPLATE
-                )
-            )
             print("Using AI-powered transition generation via Gemini API")
-        else:
-            # Use traditional registry-based transitions
-            transition_registry = create_nz_transition_registry()
-            orchestrator.add_hydrator(TransitionHydrator(transition_registry))
             
         # Add Emitters
-        if args.format in ["markdown", "both"]:
-            orchestrator.add_emitter(MarkdownEmitter())
-        if args.format in ["pdf", "both"]:
-            banner_generator = None
-            if getattr(args, "pdf_banners", False):
-                output_dir = args.output_dir / args.trip
-                if args.person:
-                    output_dir = output_dir / args.person
-                cache_dir = output_dir / ".ai_cache"
-                client = GeminiClient()
-                ai_cache = AiCache(cache_dir)
-                banner_generator = DayBannerGenerator(
-                    client=client, 
-                    cache=ai_cache,
-                    cache_policy="stable_date",  # Stable during development
-                    model=getattr(args, "banner_model", "gemini-2.5-flash-image")
-                )
-
-            orchestrator.add_emitter(PDFEmitter(banner_generator=banner_generator))
+        for emitter in _build_emitters(args, cache_dir, shared):
+            orchestrator.add_emitter(emitter)
             
         # Validate and Execute
         issues = orchestrator.validate()
         for issue in issues:
             print(f"Warning: {issue}")
             
-        output_dir = args.output_dir / args.trip
-        if args.person:
-            output_dir = output_dir / args.person
-            
-        orchestrator.execute(output_dir=output_dir)
+        try:
+            if getattr(args, "stream", False):
+                orchestrator.execute_streaming(output_dir=output_dir)
+            else:
+                orchestrator.execute(output_dir=output_dir)
+        finally:
+            _report_profile(args, orchestrator.trace)
+        if orchestrator.resumed_after is not None:
+            resumed = orchestrator.hydrators[orchestrator.resumed_after]
+            print(f"Resumed after stage {orchestrator.resumed_after} ({type(resumed).__name__})")
         print(f"Success! Output written to {output_dir}")
         return 0
         
@@ -180,6 +433,201 @@ def _handle_generate(args: argparse.Namespace) -> int:
         return 1
 
 
+def _generate_all_people(args: argparse.Namespace, trip_path: Path, shared: Dict[str, Any]) -> int:
+    """Generate one itinerary per traveler in config.yaml from a single load.
+    
+    Events are parsed, sorted and annotated once; PersonFilter and the
+    neighbour-dependent hydrators and emitters then run per person on a thread
+    pool. AI clients and the AI cache are shared at the trip level.
+    """
+    provider = _provider(args, trip_path)
+    trip_output_dir = args.output_dir / args.trip
+    cache_dir = trip_output_dir / ".ai_cache"
+    
+    # Shared stages: their per-event output does not depend on the person
+    base = PipelineOrchestrator(provider, **_orchestrator_options(args))
+    base.add_hydrator(TimeNormalizationHydrator())
+    base.add_hydrator(ChronologicalSorter())
+    if getattr(args, "resolve_venues", False):
+        base.add_hydrator(VenueResolutionHydrator())
+    base.add_hydrator(EmotionalAnnotationHydrator())
+    
+    fanout = FanOutPipeline(base, max_workers=getattr(args, "workers", None))
+    try:
+        fanout.load(trip_output_dir)
+        slugs = people_slugs(fanout.config)
+        if not slugs:
+            print("Error: No people listed in config.yaml", file=sys.stderr)
+            return 1
+        
+        branches = []
+        for slug in slugs:
+            branches.append(PipelineBranch(
+                name=slug,
+                output_dir=trip_output_dir / slug,
+                hydrators=[
+                    PersonFilter(person_slug=slug),
+                    WrapUpHydrator(),
+                    _transition_hydrator(args, cache_dir, shared),
+                ],
+                emitters=_build_emitters(args, cache_dir, shared),
+            ))
+        print(f"Generating for {len(branches)} people: {', '.join(slugs)}")
+        fanout.run(branches)
+    finally:
+        _report_profile(args, fanout.trace)
+    print(f"Success! Output written to {trip_output_dir}")
+    return 0
+
+
+def discover_trips(trips_dir: Path) -> List[Path]:
+    """Return trip directories (containing events/ or config.yaml), sorted by name."""
+    if not trips_dir.is_dir():
+        return []
+    return sorted(
+        path for path in trips_dir.iterdir()
+        if path.is_dir() and ((path / "events").is_dir() or (path / "config.yaml").exists())
+    )
+
+
+# Warm state kept for the lifetime of a generate-all worker process and reused
+# by every trip it builds (Gemini client, AI cache handles).
+_WORKER_SHARED: Dict[str, Any] = {}
+
+
+def _init_generate_worker() -> None:
+    """Warm per-process state before the first trip is built."""
+    register_fonts()
+
+
+def _generate_trip_worker(args: argparse.Namespace) -> Tuple[str, int, float, str]:
+    """Build one trip in a worker process.
+    
+    Returns:
+        (trip name, exit code, wall seconds, captured output)
+    """
+    start = time.perf_counter()
+    log = io.StringIO()
+    with redirect_stdout(log), redirect_stderr(log):
+        code = _handle_generate(args, shared=_WORKER_SHARED)
+    return args.trip, code, time.perf_counter() - start, log.getvalue()
+
+
+def _handle_generate_all(args: argparse.Namespace) -> int:
+    """Handle the 'generate-all' command."""
+    trips = discover_trips(args.trips_dir)
+    if not trips:
+        print(f"Error: No trips found in {args.trips_dir}", file=sys.stderr)
+        return 1
+    
+    print(f"Generating {len(trips)} trips from {args.trips_dir}...")
+    jobs = []
+    for trip_path in trips:
+        trip_args = argparse.Namespace(**vars(args))
+        trip_args.trip = trip_path.name
+        trip_args.trip_path = trip_path
+        trip_args.person = None
+        jobs.append(trip_args)
+    
+    results: List[Tuple[str, int, float, str]] = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_generate_worker) as pool:
+        futures = [pool.submit(_generate_trip_worker, trip_args) for trip_args in jobs]
+        for trip_args, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append((trip_args.trip, 1, 0.0, f"Error: {e}"))
+    total = time.perf_counter() - start
+    
+    failed = [r for r in results if r[1] != 0]
+    print(f"{'trip':<32} {'status':<8} {'seconds':>9}")
+    for trip, code, seconds, log in results:
+        print(f"{trip:<32} {'ok' if code == 0 else 'FAILED':<8} {seconds:>9.2f}")
+    print(f"{'total (wall)':<32} {'':<8} {total:>9.2f}")
+    for trip, _, _, log in failed:
+        errors = [line for line in log.splitlines() if line.startswith("Error:")]
+        print(f"{trip}: {errors[-1] if errors else 'failed'}", file=sys.stderr)
+    
+    return 1 if failed else 0
+
+
+def _handle_watch(args: argparse.Namespace) -> int:
+    """Handle the 'watch' command: rebuild on every save until interrupted."""
+    trip_path = _resolve_trip_path(args.trip)
+    output_dir = args.output_dir / args.trip
+    if args.person:
+        output_dir = output_dir / args.person
+    cache_dir = output_dir / ".ai_cache"
+    shared: Dict[str, Any] = {}
+
+    try:
+        provider = _file_provider(args, trip_path)
+        hydrators = _hydrator_chain(args, cache_dir, shared)
+        session = WatchSession(provider, hydrators, _build_emitters(args, cache_dir, shared), output_dir)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    def report(update: WatchUpdate) -> None:
+        if update.changed_files:
+            print(f"Changed: {', '.join(Path(p).name for p in update.changed_files)}")
+        dates = ", ".join(update.affected_dates) or "none"
+        print(
+            f"Rebuilt in {update.seconds:.2f}s (days recomputed {update.days_recomputed}, "
+            f"reused {update.days_reused}; affected: {dates})"
+        )
+
+    def report_error(error: Exception) -> None:
+        print(f"Error: {error}", file=sys.stderr)
+
+    print(f"Watching {trip_path} (Ctrl+C to stop); output in {output_dir}")
+    try:
+        session.watch(interval=args.interval, on_update=report, on_error=report_error)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    return 0
+
+
+def _handle_compile(args: argparse.Namespace) -> int:
+    """Handle the 'compile' command."""
+    trip_path = _resolve_trip_path(args.trip)
+    output = args.output or Path("output") / f"{trip_path.name}{BUNDLE_SUFFIX}"
+    try:
+        stats = compile_trip(trip_path, output)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(
+        f"Compiled {stats['events']} events and {stats['venues']} venues "
+        f"({stats['strings']} strings, {stats['bytes']} bytes) into {output}"
+    )
+    return 0
+
+
+def _handle_db(args: argparse.Namespace) -> int:
+    """Handle the 'db' command."""
+    try:
+        if args.subcommand == "import":
+            trip_path = _resolve_trip_path(args.trip)
+            args.db.parent.mkdir(parents=True, exist_ok=True)
+            counts = import_trip(trip_path, args.db)
+            print(
+                f"Imported {counts['events']} events, {counts['venues']} venues "
+                f"and {counts['files']} files from {trip_path} into {args.db}"
+            )
+            return 0
+        if args.subcommand == "export":
+            written = export_trip(args.db, args.output)
+            print(f"Wrote {written} files to {args.output}")
+            return 0
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print("Error: expected 'import' or 'export'", file=sys.stderr)
+    return 1
+
+
 def _handle_venues(args: argparse.Namespace) -> int:
     """Handle the 'venues' command."""
     if args.subcommand == "list":
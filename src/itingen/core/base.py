@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Generic, TypeVar, Optional
+from typing import Any, Dict, Iterator, List, Generic, Mapping, TypeVar, Optional
 from dataclasses import dataclass
 
 from itingen.core.domain.venues import Venue
@@ -11,9 +12,10 @@ class PipelineContext:
     """Context data passed to hydrators containing venues and configuration.
     
     This provides access to venue information and trip-level configuration
-    that hydrators may need for enrichment operations.
+    that hydrators may need for enrichment operations. ``venues`` may be a
+    lazy mapping that loads each venue on first lookup.
     """
-    venues: Dict[str, Venue]
+    venues: Mapping[str, Venue]
     config: Dict[str, Any]
 
 class BaseProvider(ABC, Generic[T]):
@@ -28,9 +30,19 @@ class BaseProvider(ABC, Generic[T]):
         """Load and return trip events."""
         raise NotImplementedError
 
+    def iter_events(self) -> Iterator[T]:
+        """Yield trip events in day order, one day at a time where possible.
+
+        Optional streaming contract used by PipelineOrchestrator.execute_streaming:
+        events of the same day must be yielded contiguously and days in date
+        order. Providers that can load a day at a time should override this so
+        memory stays bounded by one day; the default materializes get_events().
+        """
+        yield from self.get_events()
+
     @abstractmethod
-    def get_venues(self) -> Dict[str, Venue]:
-        """Load and return venue information."""
+    def get_venues(self) -> Mapping[str, Venue]:
+        """Load and return venue information (a dict or a lazy mapping)."""
         raise NotImplementedError
 
     @abstractmethod
@@ -43,8 +55,35 @@ class BaseHydrator(ABC, Generic[T]):
     
     AIDEV-NOTE: Hydrators (Pipeline) enrich domain models with external data 
     (Maps, Weather, AI) in a sequential, deterministic flow.
+
+    Memoization hints (used by the orchestrator when memoization is enabled):
+    - ``memoizable``: False for stages that are cheaper to rerun than to load.
+    - ``memo_scope``: "list" when an item's output depends on its neighbours
+      (sorting, look-ahead/look-behind), "item" when each item is enriched
+      independently and the output has the same length and order as the input.
+
+    ``neighbour_window`` declares, for hydrators that keep length and order,
+    how many items on each side an item's output may depend on (1 for
+    look-ahead/look-behind stages such as wrap-up timing and transitions).
+    None means the output may depend on the whole list (sorting, filtering).
+    Incremental and streaming runs use it to recompute only a bounded window.
+
+    ``day_local`` marks list-level hydrators (no neighbour window) whose result
+    on a whole trip equals their results on each day concatenated, such as
+    per-person filtering. Streaming runs apply them one day at a time; any
+    other list-level hydrator cannot be streamed.
+
+    ``reorders_items`` marks hydrators that keep the same items but may return
+    them in a different order (sorting). Positional merges such as
+    ParallelHydrators reject them.
     """
 
+    memoizable: bool = True
+    memo_scope: str = "list"
+    neighbour_window: Optional[int] = None
+    day_local: bool = False
+    reorders_items: bool = False
+
     @abstractmethod
     def hydrate(self, items: List[T], context: Optional[PipelineContext] = None) -> List[T]:
         """Enrich the given items with additional data.
@@ -59,13 +98,111 @@ class BaseHydrator(ABC, Generic[T]):
         """
         raise NotImplementedError
 
+    def run_stats(self) -> Optional[Dict[str, Any]]:
+        """Return statistics about this hydrator's work so far, or None.
+
+        Profiled runs record them on the hydrator's stage (e.g. cache hit
+        rates), so they appear in the ``--profile`` trace.
+        """
+        return None
+
+    def cache_config(self) -> Dict[str, Any]:
+        """Return the configuration that determines this hydrator's output.
+
+        Used to fingerprint the stage for memoization. The default captures the
+        class name plus any attributes holding plain JSON values (prompts,
+        model names, person slugs). Hydrators whose output depends on richer
+        state should override this.
+        """
+        config: Dict[str, Any] = {"hydrator": f"{type(self).__module__}.{type(self).__qualname__}"}
+        for name, value in sorted(vars(self).items()):
+            if not name.startswith("_") and _is_plain_json(value):
+                config[name] = value
+        return config
+
+class PatchHydrator(BaseHydrator[T]):
+    """Base class for hydrators that describe their output as sparse field patches.
+    
+    AIDEV-NOTE: compute_patches() returns one dict of field updates (or None
+    for "unchanged") per input item, in input order, and must not add, drop or
+    reorder items. hydrate() applies the patches with model_copy, so a
+    PatchHydrator behaves like any other hydrator on its own. The orchestrator
+    instead coalesces consecutive PatchHydrators (see pipeline.patches): later
+    members read earlier patches through lightweight overlay views, and each
+    event is copied once for the whole run of stages rather than once per stage.
+    Implementations must therefore read items through attribute access only.
+    """
+
+    @abstractmethod
+    def compute_patches(self, items: List[T], context: Optional[PipelineContext] = None) -> List[Optional[Dict[str, Any]]]:
+        """Return the field updates for each item (None or {} when unchanged)."""
+        raise NotImplementedError
+
+    def hydrate(self, items: List[T], context: Optional[PipelineContext] = None) -> List[T]:
+        """Apply compute_patches() to copies of the items."""
+        patches = self.compute_patches(items, context)
+        if len(patches) != len(items):
+            raise ValueError(f"{type(self).__name__} returned {len(patches)} patches for {len(items)} items")
+        return [item.model_copy(update=patch) if patch else item for item, patch in zip(items, patches)]
+
+class AsyncBaseHydrator(BaseHydrator[T]):
+    """Base class for hydrators that enrich items with concurrent async I/O.
+    
+    AIDEV-NOTE: Subclasses implement hydrate_async(), typically gathering one
+    client call per event instead of looping over blocking calls.
+    PipelineOrchestrator.execute_async awaits hydrate_async() on its event
+    loop; hydrate() runs it on a fresh loop so async hydrators also work in
+    sync pipelines. Sync hydrators need no changes.
+    """
+
+    @abstractmethod
+    async def hydrate_async(self, items: List[T], context: Optional[PipelineContext] = None) -> List[T]:
+        """Asynchronously enrich the given items (same contract as hydrate())."""
+        raise NotImplementedError
+
+    def hydrate(self, items: List[T], context: Optional[PipelineContext] = None) -> List[T]:
+        """Run hydrate_async() to completion.
+
+        Must not be called from a running event loop; await hydrate_async() there.
+        """
+        return asyncio.run(self.hydrate_async(items, context))
+
+def effective_window(hydrator: "BaseHydrator") -> Optional[int]:
+    """Return how many neighbours on each side a hydrator's per-item output depends on.
+
+    Item-scoped hydrators depend on no neighbours; None means the whole list.
+    """
+    window = getattr(hydrator, "neighbour_window", None)
+    if window is not None:
+        return window
+    if getattr(hydrator, "memo_scope", "list") == "item":
+        return 0
+    return None
+
+def _is_plain_json(value: Any) -> bool:
+    """Return True if value is built only from JSON primitives, lists and dicts."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain_json(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_plain_json(v) for k, v in value.items())
+    return False
+
 class BaseEmitter(ABC, Generic[T]):
     """Abstract base class for itinerary output generators.
     
     AIDEV-NOTE: Emitters (Targets) transform hydrated domain models into 
     final artifacts like Markdown, PDFs, or calendars.
+
+    ``execution`` tells the orchestrator's parallel emitter mode where to run
+    the emitter: "thread" for light I/O-bound writers, "process" for CPU-heavy
+    builds (the emitter and its inputs must then be picklable; otherwise it
+    falls back to a thread).
     """
 
+    execution: str = "thread"
+
     @abstractmethod
     def emit(self, itinerary: List[T], output_path: str) -> str:
         """Write the itinerary to the specified output format/path.
@@ -74,3 +211,39 @@ class BaseEmitter(ABC, Generic[T]):
             The path to the generated artifact.
         """
         raise NotImplementedError
+
+    def open_stream(self, output_path: str) -> "DayStreamWriter[T]":
+        """Return a writer that receives the itinerary one day at a time.
+
+        Emitters that can write incrementally (Markdown, JSON) override this so
+        streaming runs never hold more than a day; the default buffers every
+        day and calls emit() on close.
+        """
+        return BufferedDayStreamWriter(self, output_path)
+
+class DayStreamWriter(ABC, Generic[T]):
+    """Incremental emitter output fed one day of items at a time, in date order."""
+
+    @abstractmethod
+    def write_day(self, items: List[T]) -> None:
+        """Append one day's items to the output."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> str:
+        """Finish the output and return the path to the generated artifact."""
+        raise NotImplementedError
+
+class BufferedDayStreamWriter(DayStreamWriter[T]):
+    """Collects every day and hands the whole itinerary to emit() on close."""
+
+    def __init__(self, emitter: BaseEmitter[T], output_path: str):
+        self.emitter = emitter
+        self.output_path = output_path
+        self.items: List[T] = []
+
+    def write_day(self, items: List[T]) -> None:
+        self.items.extend(items)
+
+    def close(self) -> str:
+        return self.emitter.emit(self.items, self.output_path)
@@ -4,6 +4,7 @@ AIDEV-NOTE: Events represent time-bound activities in a trip itinerary.
 They are parsed from Markdown files and enriched through the pipeline.
 """
 
+from datetime import datetime
 from typing import List, Optional
 from pydantic import Field, ConfigDict
 from itingen.core.domain.base import StrictBaseModel
@@ -45,6 +46,12 @@ class Event(StrictBaseModel):
     time_local: Optional[str] = Field(None, description="Event time in local timezone")
     no_later_than: Optional[str] = Field(None, description="Latest possible start time for this event")
     duration: Optional[str] = Field(None, description="Duration of the event (e.g. '1h30m')")
+
+    # Normalized timing, derived from the strings above by TimeNormalizationHydrator.
+    # Excluded from serialization: they are caches of source fields, not data.
+    time_epoch: Optional[int] = Field(None, exclude=True, description="UTC epoch seconds of the event's time")
+    time_local_dt: Optional[datetime] = Field(None, exclude=True, description="time_local as a naive local datetime")
+    no_later_than_dt: Optional[datetime] = Field(None, exclude=True, description="no_later_than as a naive local datetime")
     
     # Scheduling constraints
     coordination_point: Optional[bool] = Field(None, description="Marks events requiring traveler coordination")
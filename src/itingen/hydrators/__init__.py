@@ -1,16 +1,23 @@
 """Data enrichment and hydration logic for trip venues."""
-from itingen.hydrators.maps import MapsHydrator
+from itingen.hydrators.maps import AsyncMapsHydrator, MapsHydrator
+from itingen.hydrators.weather import AsyncWeatherHydrator, WeatherHydrator
+from itingen.hydrators.venues import VenueResolutionHydrator
 from itingen.hydrators.ai.banner import BannerImageHydrator, BannerCachePolicy
 from itingen.hydrators.ai.images import ImageHydrator
-from itingen.hydrators.ai.narratives import NarrativeHydrator
+from itingen.hydrators.ai.narratives import AsyncNarrativeHydrator, NarrativeHydrator
 from itingen.hydrators.ai.cache import AiCache
 
 
 __all__ = [
     "MapsHydrator",
+    "AsyncMapsHydrator",
+    "WeatherHydrator",
+    "AsyncWeatherHydrator",
+    "VenueResolutionHydrator",
     "BannerImageHydrator", 
     "BannerCachePolicy",
     "ImageHydrator",
     "NarrativeHydrator",
+    "AsyncNarrativeHydrator",
     "AiCache",
 ]
@@ -13,6 +13,8 @@ class ImageHydrator(BaseHydrator[Event]):
     For day banner images (16:9), use BannerImageHydrator instead.
     """
 
+    memo_scope = "item"
+
     def __init__(
         self,
         client: GeminiClient,
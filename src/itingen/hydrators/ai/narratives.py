@@ -1,13 +1,16 @@
-from typing import List, Optional
-from itingen.core.base import BaseHydrator
+import asyncio
+from typing import Any, Dict, List, Optional
+from itingen.core.base import AsyncBaseHydrator, BaseHydrator
 from itingen.core.domain.events import Event
-from itingen.integrations.ai.gemini import GeminiClient
+from itingen.integrations.ai.gemini import AsyncGeminiClient, GeminiClient
 from itingen.integrations.ai.narrative_prompts import NARRATIVE_STYLE_TEMPLATE, NARRATIVE_PROMPT_TEMPLATE
 from itingen.hydrators.ai.cache import AiCache
 
 class NarrativeHydrator(BaseHydrator[Event]):
     """Hydrator that generates AI narratives for events."""
 
+    memo_scope = "item"
+
     def __init__(self, client: GeminiClient, cache: Optional[AiCache] = None, prompt_template: Optional[str] = None, style_template: Optional[str] = None):
         self.client = client
         self.cache = cache
@@ -21,33 +24,67 @@ class NarrativeHydrator(BaseHydrator[Event]):
                 new_items.append(event)
                 continue
 
-            payload = {
-                "task": "narrative",
-                "heading": event.event_heading,
-                "kind": event.kind,
-                "location": event.location,
-                "description": event.description,
-                "who": event.who,
-                "prompt_template": self.prompt_template
-            }
-
+            payload = self._payload(event)
             narrative = None
             if self.cache:
                 narrative = self.cache.get_text(payload)
 
             if not narrative:
-                prompt = self.prompt_template.format(
-                    style_guidance=self.style_template,
-                    heading=event.event_heading,
-                    kind=event.kind or "N/A",
-                    location=event.location or "N/A",
-                    description=event.description or "N/A",
-                    who=", ".join(event.who) if event.who else "N/A"
-                )
-                narrative = self.client.generate_text(prompt)
+                narrative = self.client.generate_text(self._prompt(event))
                 if self.cache:
                     self.cache.set_text(payload, narrative)
 
             new_items.append(event.model_copy(update={"narrative": narrative}))
             
         return new_items
+
+    def _payload(self, event: Event) -> Dict[str, Any]:
+        """Cache key payload for an event's narrative."""
+        return {
+            "task": "narrative",
+            "heading": event.event_heading,
+            "kind": event.kind,
+            "location": event.location,
+            "description": event.description,
+            "who": event.who,
+            "prompt_template": self.prompt_template
+        }
+
+    def _prompt(self, event: Event) -> str:
+        return self.prompt_template.format(
+            style_guidance=self.style_template,
+            heading=event.event_heading,
+            kind=event.kind or "N/A",
+            location=event.location or "N/A",
+            description=event.description or "N/A",
+            who=", ".join(event.who) if event.who else "N/A"
+        )
+
+
+class AsyncNarrativeHydrator(AsyncBaseHydrator[Event], NarrativeHydrator):
+    """NarrativeHydrator that generates all uncached narratives concurrently.
+
+    Takes an AsyncGeminiClient, whose concurrency limit caps requests in flight.
+    """
+
+    def __init__(self, client: AsyncGeminiClient, cache: Optional[AiCache] = None, prompt_template: Optional[str] = None, style_template: Optional[str] = None):
+        super().__init__(client=client, cache=cache, prompt_template=prompt_template, style_template=style_template)
+
+    async def hydrate_async(self, items: List[Event], context=None) -> List[Event]:
+        async def enrich(event: Event) -> Event:
+            if not event.event_heading:
+                return event
+
+            payload = self._payload(event)
+            narrative = None
+            if self.cache:
+                narrative = self.cache.get_text(payload)
+
+            if not narrative:
+                narrative = await self.client.generate_text(self._prompt(event))
+                if self.cache:
+                    self.cache.set_text(payload, narrative)
+
+            return event.model_copy(update={"narrative": narrative})
+
+        return list(await asyncio.gather(*(enrich(event) for event in items)))
@@ -24,6 +24,8 @@ class GeminiTransitionHydrator(BaseHydrator[Event]):
     This replaces hardcoded pattern-matching with dynamic AI generation,
     enabling trip-agnostic transitions that adapt to any event combination.
     """
+
+    neighbour_window = 1
     
     def __init__(
         self, 
@@ -1,68 +1,231 @@
-from typing import List, Optional
-from itingen.core.base import BaseHydrator
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from itingen.core.base import AsyncBaseHydrator, PatchHydrator
 from itingen.core.domain.events import Event
-from itingen.integrations.maps.google_maps import GoogleMapsClient
+from itingen.integrations.maps.canonical import AddressCanonicalizer
+from itingen.integrations.maps.google_maps import AsyncGoogleMapsClient, GoogleMapsClient
+from itingen.integrations.maps.offline import OfflineTravelEstimator
+from itingen.integrations.maps.route_cache import open_route_cache
 
-class MapsHydrator(BaseHydrator[Event]):
+BACKENDS = ("google", "offline", "auto")
+
+class MapsHydrator(PatchHydrator[Event]):
     """Hydrator that enriches events with Google Maps data (duration, distance).
     
     AIDEV-NOTE: Uses GoogleMapsClient with local caching to minimize API calls 
-    and ensure deterministic builds when keys are missing.
+    and ensure deterministic builds when keys are missing. In batch mode the
+    unique routes of the whole list are collected first and resolved with one
+    get_routes() call (batched Distance Matrix requests), then fanned back to
+    the events, so a repeated leg costs one element rather than one request
+    per drive.
+
+    With ``backend="offline"`` durations come from an OfflineTravelEstimator
+    built from the context's venues (and calibrated from the route cache in
+    cache_dir, if there is one) instead of the API; ``"auto"`` picks it
+    when no API key is available. The offline backend always resolves the
+    whole list at once.
+
+    With ``canonicalize`` (the default), a client without its own
+    AddressCanonicalizer gets one built from the context's venues, so
+    spellings of one place ("SJC", "San Jose Airport (SJC)") share a route
+    cache entry; its hit rates are reported through run_stats().
     """
 
-    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[str] = None):
+    memo_scope = "item"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        client: Optional[GoogleMapsClient] = None,
+        batch: bool = False,
+        backend: str = "google",
+        canonicalize: bool = True,
+    ):
         """Initialize with Google Maps API key and optional cache directory.
         
         Args:
             api_key: Google Maps API key (defaults to GOOGLE_MAPS_API_KEY env var)
             cache_dir: Optional cache directory for route caching
+            client: Pre-built client exposing get_directions (overrides api_key/cache_dir)
+            batch: Resolve all routes with the client's get_routes() (Distance
+                Matrix) instead of one get_directions() call per event
+            backend: "google", "offline" (estimate from venue coordinates) or
+                "auto" (offline when no API key is available); ignored when
+                client is given
+            canonicalize: Give the client an AddressCanonicalizer over the
+                context's venues unless it already has one
         """
-        self.client = GoogleMapsClient(api_key=api_key, cache_dir=cache_dir)
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown maps backend '{backend}'; expected one of {', '.join(BACKENDS)}")
+        if client is not None:
+            backend = "google"
+        elif backend == "auto":
+            backend = "google" if api_key or os.environ.get("GOOGLE_MAPS_API_KEY") else "offline"
+        self.backend = backend
+        self._cache_dir = cache_dir
+        if client is None and backend == "google":
+            client = GoogleMapsClient(api_key=api_key, cache_dir=cache_dir)
+        self.client = client
+        self.batch = batch
+        self.canonicalize = canonicalize
+        self._estimator: Optional[OfflineTravelEstimator] = None
+        self._canonicalizer: Optional[AddressCanonicalizer] = None
 
-    def hydrate(self, items: List[Event], context=None) -> List[Event]:
-        """Enrich drive events with duration and distance from Google Maps."""
-        new_items = []
+    def estimator(self, context=None) -> OfflineTravelEstimator:
+        """Offline estimator for the context's venues, built and calibrated once per venue mapping."""
+        venues = context.venues if context is not None else {}
+        if self._estimator is None or self._estimator.venues is not venues:
+            estimator = OfflineTravelEstimator(venues)
+            if self._cache_dir and os.path.exists(self._cache_dir):
+                cache = open_route_cache(self._cache_dir)
+                try:
+                    estimator.calibrate(data for _, data in cache.items())
+                finally:
+                    cache.close()
+            self._estimator = estimator
+        return self._estimator
+
+    def canonicalizer(self, context=None) -> Optional[AddressCanonicalizer]:
+        """The client's AddressCanonicalizer, attaching one over the context's venues if needed."""
+        current = getattr(self.client, "canonicalizer", False)
+        if not self.canonicalize or not isinstance(current, (AddressCanonicalizer, type(None))):
+            return None  # offline backend, or a client that does not key by canonical text
+        if current is not None and current is not self._canonicalizer:
+            return current  # configured by the caller
+        venues = context.venues if context is not None else {}
+        if current is None or (venues and current.venues is not venues):
+            self._canonicalizer = AddressCanonicalizer(venues)
+            self.client.canonicalizer = self._canonicalizer
+        return self.client.canonicalizer
+
+    def run_stats(self) -> Optional[Dict[str, Any]]:
+        """Hit rates of the route canonicalizer, if the client has one."""
+        canonicalizer = getattr(self.client, "canonicalizer", None)
+        if not isinstance(canonicalizer, AddressCanonicalizer):
+            return None
+        return {"route_canonicalization": canonicalizer.stats.to_dict()}
+
+    def compute_patches(self, items: List[Event], context=None) -> List[Optional[Dict[str, Any]]]:
+        """Look up duration and distance from Google Maps for drive events."""
+        if self.backend == "offline":
+            return self._batch_patches(items, self.estimator(context))
+        self.canonicalizer(context)
+        if self.batch and hasattr(self.client, "get_routes"):
+            return self._batch_patches(items, self.client)
+        patches: List[Optional[Dict[str, Any]]] = []
         for event in items:
-            # Only hydrate drive events that don't have locked duration
-            if event.kind != "drive" or getattr(event, "lock_duration", False):
-                new_items.append(event)
-                continue
-            
-            origin = event.travel_from
-            destination = event.travel_to
-            
-            if not origin or not destination:
-                # If travel fields are missing, try to use location
-                # This is a bit brittle, but matches expected behavior for drives
-                new_items.append(event)
+            route = self._route(event)
+            if route is None:
+                patches.append(None)
                 continue
 
+            origin, destination = route
             try:
                 result = self.client.get_directions(
                     origin=origin,
                     destination=destination,
                     mode="driving"
                 )
-                
-                if result:
-                    updates = {
-                        "duration_seconds": result.get("duration_seconds"),
-                        "duration_text": result.get("duration_text"),
-                        "distance_text": result.get("distance_text"),
-                    }
-                    
-                    # Also update description if travel_to is used
-                    if event.travel_to and not event.description:
-                        updates["description"] = f"Drive from {origin} to {destination}"
-                    
-                    new_items.append(event.model_copy(update=updates))
-                else:
-                    new_items.append(event)
-                        
+                patches.append(self._patch(event, result))
             except Exception:
                 # Fail-fast is preferred, but for external APIs we might want 
                 # to log and continue or raise depending on config.
                 # For now, we'll let exceptions bubble up as per PipelineOrchestrator's design.
                 raise
                 
-        return new_items
+        return patches
+
+    def _batch_patches(self, items: List[Event], client: Any) -> List[Optional[Dict[str, Any]]]:
+        """Resolve every unique route in one get_routes() call and fan results back."""
+        routes = [self._route(event) for event in items]
+        unique = list(dict.fromkeys(route for route in routes if route is not None))
+        results = client.get_routes(unique, mode="driving") if unique else {}
+        return [
+            None if route is None else self._patch(event, results.get(route))
+            for event, route in zip(items, routes)
+        ]
+
+    def _route(self, event: Event) -> Optional[Tuple[str, str]]:
+        """Return (origin, destination) if the event needs a directions lookup."""
+        # Only hydrate drive events that don't have locked duration
+        if event.kind != "drive" or getattr(event, "lock_duration", False):
+            return None
+
+        # If travel fields are missing, try to use location
+        # This is a bit brittle, but matches expected behavior for drives
+        if not event.travel_from or not event.travel_to:
+            return None
+        return event.travel_from, event.travel_to
+
+    def _patch(self, event: Event, result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Field updates for a directions result."""
+        if not result:
+            return None
+
+        updates = {
+            "duration_seconds": result.get("duration_seconds"),
+            "duration_text": result.get("duration_text"),
+            "distance_text": result.get("distance_text"),
+        }
+
+        # Also update description if travel_to is used
+        if event.travel_to and not event.description:
+            updates["description"] = f"Drive from {event.travel_from} to {event.travel_to}"
+
+        return updates
+
+
+class AsyncMapsHydrator(AsyncBaseHydrator[Event], MapsHydrator):
+    """MapsHydrator that looks up all drive routes concurrently.
+
+    AIDEV-NOTE: Same output as MapsHydrator; lookups are gathered, with at
+    most ``max_concurrency`` in flight.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        client: Optional[GoogleMapsClient] = None,
+        max_concurrency: int = 10,
+        batch: bool = False,
+        backend: str = "google",
+        canonicalize: bool = True,
+    ):
+        super().__init__(
+            api_key=api_key, cache_dir=cache_dir, client=client, batch=batch, backend=backend,
+            canonicalize=canonicalize,
+        )
+        self.async_client = (
+            AsyncGoogleMapsClient(self.client, max_concurrency=max_concurrency) if self.client is not None else None
+        )
+
+    async def hydrate_async(self, items: List[Event], context=None) -> List[Event]:
+        """Enrich drive events with duration and distance from Google Maps."""
+        if self.backend == "offline":
+            # Pure computation; nothing to await (and self.hydrate would
+            # start a nested event loop)
+            return MapsHydrator.hydrate(self, items, context)
+        if self.batch and hasattr(self.client, "get_routes"):
+            # A handful of matrix requests; no per-event fan-out to gather.
+            # MapsHydrator.hydrate, not self.hydrate: the latter is
+            # AsyncBaseHydrator.hydrate and would re-enter this coroutine.
+            return await asyncio.to_thread(MapsHydrator.hydrate, self, items, context)
+        self.canonicalizer(context)
+
+        async def enrich(event: Event) -> Event:
+            route = self._route(event)
+            if route is None:
+                return event
+            origin, destination = route
+            result = await self.async_client.get_directions(
+                origin=origin,
+                destination=destination,
+                mode="driving"
+            )
+            patch = self._patch(event, result)
+            return event.model_copy(update=patch) if patch else event
+
+        return list(await asyncio.gather(*(enrich(event) for event in items)))
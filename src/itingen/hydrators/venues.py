@@ -0,0 +1,59 @@
+from typing import Any, Dict, List, Mapping, Optional
+from itingen.core.base import PatchHydrator, PipelineContext
+from itingen.core.domain.events import Event
+from itingen.core.domain.venues import Venue
+from itingen.utils.venue_lookup import VenueLookup
+
+
+class VenueResolutionHydrator(PatchHydrator[Event]):
+    """Hydrator that resolves free-text places to venue ids.
+
+    AIDEV-NOTE: Sets ``venue_id`` from ``location`` when the event has none,
+    and ``travel_from_venue_id`` / ``travel_to_venue_id`` from the travel
+    fields, using a VenueLookup over the context's venues. The lookup is built
+    once per venue mapping and memoizes each distinct string, so a trip costs
+    one resolution per unique place name. Unresolved fields are left unset.
+    """
+
+    memo_scope = "item"
+
+    def __init__(self, venues: Optional[Mapping[str, Venue]] = None, min_score: float = 0.7):
+        """Initialize with optional venues overriding the pipeline context's.
+
+        Args:
+            venues: Venue mapping to resolve against (defaults to context.venues)
+            min_score: Lowest trigram similarity accepted for a fuzzy match
+        """
+        self.venues = venues
+        self.min_score = min_score
+        self._lookup: Optional[VenueLookup] = None
+        self._lookup_venues: Optional[Mapping[str, Venue]] = None
+
+    def lookup(self, context: Optional[PipelineContext] = None) -> Optional[VenueLookup]:
+        """Return the lookup for the venues in use, building it on first call."""
+        venues = self.venues if self.venues is not None else (context.venues if context else None)
+        if not venues:
+            return None
+        if self._lookup is None or self._lookup_venues is not venues:
+            self._lookup = VenueLookup.from_venues(venues, min_score=self.min_score)
+            self._lookup_venues = venues
+        return self._lookup
+
+    def compute_patches(self, items: List[Event], context=None) -> List[Optional[Dict[str, Any]]]:
+        """Attach resolved venue ids to each event."""
+        lookup = self.lookup(context)
+        if lookup is None:
+            return [None] * len(items)
+        patches: List[Optional[Dict[str, Any]]] = []
+        for event in items:
+            patch: Dict[str, Any] = {}
+            if not event.venue_id:
+                venue_id = lookup.resolve(event.location)
+                if venue_id:
+                    patch["venue_id"] = venue_id
+            for field in ("travel_from", "travel_to"):
+                venue_id = lookup.resolve(getattr(event, field))
+                if venue_id:
+                    patch[f"{field}_venue_id"] = venue_id
+            patches.append(patch or None)
+        return patches
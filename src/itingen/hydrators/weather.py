@@ -1,7 +1,8 @@
-from typing import List, Optional
-from itingen.core.base import BaseHydrator
+import asyncio
+from typing import Any, Dict, List, Optional
+from itingen.core.base import AsyncBaseHydrator, BaseHydrator
 from itingen.core.domain.events import Event
-from itingen.integrations.weather.weatherspark import WeatherSparkClient
+from itingen.integrations.weather.weatherspark import AsyncWeatherSparkClient, WeatherSparkClient
 
 class WeatherHydrator(BaseHydrator[Event]):
     """Hydrator that enriches events with typical weather data.
@@ -10,9 +11,11 @@ class WeatherHydrator(BaseHydrator[Event]):
     but should eventually handle transient provider failures gracefully.
     """
 
-    def __init__(self, cache_dir: Optional[str] = None):
-        """Initialize with optional cache directory."""
-        self.client = WeatherSparkClient(cache_dir=cache_dir)
+    memo_scope = "item"
+
+    def __init__(self, cache_dir: Optional[str] = None, client: Optional[WeatherSparkClient] = None):
+        """Initialize with optional cache directory or a pre-built client."""
+        self.client = client or WeatherSparkClient(cache_dir=cache_dir)
 
     def hydrate(self, items: List[Event], context=None) -> List[Event]:
         """Enrich events with weather data based on location and date."""
@@ -26,17 +29,7 @@ class WeatherHydrator(BaseHydrator[Event]):
             try:
                 date_str = event.time_utc.split("T")[0]
                 weather_data = self.client.get_typical_weather(event.location, date_str)
-                
-                if weather_data:
-                    # Enrich event with weather fields
-                    updates = {
-                        "weather_temp_high": weather_data.get("high_temp_f"),
-                        "weather_temp_low": weather_data.get("low_temp_f"),
-                        "weather_conditions": weather_data.get("conditions")
-                    }
-                    new_items.append(event.model_copy(update=updates))
-                else:
-                    new_items.append(event)
+                new_items.append(self._apply(event, weather_data))
             except Exception:
                 # We follow the fail-fast principle for data integrity, 
                 # but might allow weather to be missing if the provider is down.
@@ -44,3 +37,39 @@ class WeatherHydrator(BaseHydrator[Event]):
                 raise
                 
         return new_items
+
+    def _apply(self, event: Event, weather_data: Optional[Dict[str, Any]]) -> Event:
+        """Copy typical weather onto the event."""
+        if not weather_data:
+            return event
+        # Enrich event with weather fields
+        updates = {
+            "weather_temp_high": weather_data.get("high_temp_f"),
+            "weather_temp_low": weather_data.get("low_temp_f"),
+            "weather_conditions": weather_data.get("conditions")
+        }
+        return event.model_copy(update=updates)
+
+
+class AsyncWeatherHydrator(AsyncBaseHydrator[Event], WeatherHydrator):
+    """WeatherHydrator that fetches all locations and dates concurrently."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        client: Optional[WeatherSparkClient] = None,
+        max_concurrency: int = 4,
+    ):
+        super().__init__(cache_dir=cache_dir, client=client)
+        self.async_client = AsyncWeatherSparkClient(self.client, max_concurrency=max_concurrency)
+
+    async def hydrate_async(self, items: List[Event], context=None) -> List[Event]:
+        """Enrich events with weather data based on location and date."""
+        async def enrich(event: Event) -> Event:
+            if not event.location or not event.time_utc:
+                return event
+            date_str = event.time_utc.split("T")[0]
+            weather_data = await self.async_client.get_typical_weather(event.location, date_str)
+            return self._apply(event, weather_data)
+
+        return list(await asyncio.gather(*(enrich(event) for event in items)))
@@ -9,6 +9,8 @@ except ImportError:
 from google import genai
 from google.genai import types
 
+from itingen.integrations.concurrency import ServiceLimit
+
 class GeminiClient:
     """Client for interacting with Google Gemini AI."""
 
@@ -152,3 +154,25 @@ class GeminiClient:
         """
         # Default to Gemini image generation for thumbnails
         return self.generate_image_with_gemini(prompt, aspect_ratio="1:1")
+
+
+class AsyncGeminiClient:
+    """Async counterpart of GeminiClient for concurrent text generation.
+
+    Wraps a GeminiClient and uses the SDK's native async API (``client.aio``),
+    with at most ``max_concurrency`` requests in flight.
+    """
+
+    def __init__(self, client: Optional[GeminiClient] = None, max_concurrency: int = 4):
+        self.sync_client = client or GeminiClient()
+        self.model = self.sync_client.model
+        self.limit = ServiceLimit("gemini", max_concurrency)
+
+    async def generate_text(self, prompt: str) -> str:
+        """Generate text using Gemini."""
+        async with self.limit:
+            response = await self.sync_client.client.aio.models.generate_content(
+                model=self.model,
+                contents=prompt
+            )
+        return response.text
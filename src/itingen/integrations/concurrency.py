@@ -0,0 +1,208 @@
+"""Concurrency and rate limits for service clients.
+
+AIDEV-NOTE: Each async client owns a ServiceLimit; hydrators that share a
+client (the CLI shares one Gemini client per run) therefore share the limit,
+which is what caps concurrent requests per external service. asyncio
+semaphores are bound to the loop they are first used on, so ServiceLimit
+keeps one semaphore per running loop; the same client can then be used from
+PipelineOrchestrator.execute_async and from sync hydrate() calls, which run
+each async hydrator on a fresh loop.
+
+Blocking clients that fan out over worker threads (GoogleMapsClient) use the
+thread-safe helpers below instead:
+- RateLimiter: token bucket for a per-second quota plus an optional daily cap;
+  one instance can be shared by every client drawing on the same API key.
+- SingleFlight: concurrent callers asking for the same key share one call.
+- call_with_backoff: retries transient failures with jittered exponential
+  backoff.
+
+AIDEV-DECISION: RateLimiter reserves a token under its lock and sleeps
+outside it, so waiting threads queue in arrival order without blocking each
+other's bookkeeping. The daily cap raises QuotaExceededError instead of
+waiting: sleeping until the quota window reopens would stall a build for
+hours.
+"""
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future
+from types import TracebackType
+from typing import Callable, Deque, Dict, Hashable, List, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+DAY_SECONDS = 86400
+# Granularity of RateLimiter's rolling daily count
+DAY_BUCKET_SECONDS = 60
+
+
+class ServiceLimit:
+    """Caps the number of in-flight calls to one service per event loop."""
+
+    def __init__(self, service: str, max_concurrency: int):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency for {service} must be at least 1")
+        self.service = service
+        self.max_concurrency = max_concurrency
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def __aenter__(self) -> "ServiceLimit":
+        await self._semaphore().acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self._semaphore().release()
+
+
+class QuotaExceededError(RuntimeError):
+    """Raised when a RateLimiter's daily cap is used up."""
+
+
+class RateLimiter:
+    """Token bucket limiting calls per second, with an optional daily cap.
+
+    Args:
+        service: Service name, for error messages
+        qps: Sustained calls per second
+        burst: Calls allowed back to back after an idle period (defaults to qps)
+        daily_cap: Maximum calls in any rolling 24 hours, counted in one-minute
+            buckets (None = unlimited)
+        clock: Monotonic time source, for tests
+        sleep: Sleep function, for tests
+    """
+
+    def __init__(
+        self,
+        service: str,
+        qps: float,
+        burst: Optional[int] = None,
+        daily_cap: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if qps <= 0:
+            raise ValueError(f"qps for {service} must be positive")
+        self.service = service
+        self.qps = qps
+        self.burst = max(1, burst if burst is not None else int(qps))
+        self.daily_cap = daily_cap
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        # [bucket start, calls] per minute with calls in the last 24 hours
+        self._buckets: Deque[List[float]] = deque()
+        self._used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def used_today(self) -> int:
+        """Calls admitted in the last 24 hours."""
+        with self._lock:
+            self._expire(self.clock())
+            return self._used
+
+    def _expire(self, now: float) -> None:
+        # A bucket leaves the window once its last possible call is a day
+        # old, so the cap is never exceeded within any 24 hours
+        while self._buckets and now - self._buckets[0][0] - DAY_BUCKET_SECONDS >= DAY_SECONDS:
+            self._used -= int(self._buckets.popleft()[1])
+
+    def acquire(self) -> None:
+        """Block until a call may be made; raises QuotaExceededError past the daily cap."""
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            if self.daily_cap is not None and self._used >= self.daily_cap:
+                raise QuotaExceededError(f"Daily quota of {self.daily_cap} calls to {self.service} used up")
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.qps)
+            self._updated = now
+            self._tokens -= 1
+            self._used += 1
+            bucket = now - now % DAY_BUCKET_SECONDS
+            if self._buckets and self._buckets[-1][0] == bucket:
+                self._buckets[-1][1] += 1
+            else:
+                self._buckets.append([bucket, 1])
+            wait = -self._tokens / self.qps if self._tokens < 0 else 0.0
+        if wait > 0:
+            self.sleep(wait)
+
+
+class SingleFlight:
+    """Collapses concurrent calls for the same key into one."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run fn for key, or wait for the call already in flight for key.
+
+        Followers receive the leader's result or exception. Once the call
+        finishes the key is forgotten, so later callers run fn again (callers
+        are expected to consult their cache first).
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+def call_with_backoff(
+    fn: Callable[[], T],
+    is_transient: Callable[[BaseException], bool],
+    max_retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """Call fn, retrying transient failures with jittered exponential backoff.
+
+    Retry n waits base_delay * 2**n, capped at max_delay and scaled by a
+    random factor in [0.5, 1.5) so clients that failed together do not retry
+    together. Other exceptions, and the last transient one, propagate.
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except Exception as exc:
+            if attempt >= max_retries or not is_transient(exc):
+                raise
+        sleep(min(max_delay, base_delay * 2 ** attempt) * (0.5 + random.random()))
+        attempt += 1
@@ -0,0 +1,183 @@
+"""Canonical place text for route cache keys.
+
+AIDEV-NOTE: GoogleMapsClient keys routes by "origin|destination|mode". Keyed
+on raw text, "SJC", "San Jose Airport (SJC)" and "San Jose International
+Airport" are three cache entries (and three API calls) for one place. With
+an AddressCanonicalizer configured, each endpoint is first reduced to:
+1. "iata:<code>" when the text names a known airport, by code or by name;
+2. otherwise the address of the venue the text resolves to (VenueLookup);
+3. then casefolded ASCII word tokens (punctuation and filler words dropped,
+   the same normalization VenueLookup uses).
+Results are memoized per raw text, and stats records how often each rule
+fired and how many distinct texts collapsed onto an existing key.
+
+AIDEV-DECISION: Airports are checked before venues: a code identifies the
+place better than whichever venue record or address happens to mention it.
+Text that names an airport plus something else ("AKL Airport rental car
+center") is a different place and is only normalized. Configuring a
+canonicalizer changes cache keys, so an existing cache is cold once.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple, Union
+
+from itingen.core.domain.venues import VenueAddress
+from itingen.utils.venue_lookup import VenueLookup, normalize_tokens
+
+# IATA code -> names the airport goes by (besides its code)
+AIRPORTS: Dict[str, Iterable[str]] = {
+    "AKL": ("Auckland",),
+    "WLG": ("Wellington",),
+    "ZQN": ("Queenstown",),
+    "CHC": ("Christchurch",),
+    "ROT": ("Rotorua",),
+    "TUO": ("Taupo",),
+    "SFO": ("San Francisco",),
+    "SJC": ("San Jose", "Norman Y. Mineta San Jose", "Mineta San Jose"),
+    "OAK": ("Oakland",),
+    "LAX": ("Los Angeles",),
+}
+
+# Words that qualify an airport name without changing which airport it is
+AIRPORT_WORDS = frozenset({"airport", "international", "intl", "domestic", "terminal"})
+
+_CODE = re.compile(r"\b[A-Z]{3}\b")
+
+# (canonical text, rule that produced it: "airport", "venue" or None)
+Canonical = Tuple[str, Optional[str]]
+
+
+def format_address(address: Union[str, VenueAddress, None]) -> Optional[str]:
+    """One-line text of a venue address."""
+    if address is None or isinstance(address, str):
+        return address or None
+    parts = [address.street, address.city, address.region, address.postcode, address.country]
+    return ", ".join(part for part in parts if part) or None
+
+
+def normalize_place(text: str) -> str:
+    """Casefolded ASCII word tokens of text, without punctuation or filler words."""
+    return " ".join(normalize_tokens(text))
+
+
+@dataclass
+class CanonicalizationStats:
+    """How often each canonicalization rule fired."""
+    lookups: int = 0
+    airport_hits: int = 0
+    venue_hits: int = 0
+    distinct_texts: int = 0
+    distinct_keys: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups resolved to an airport or venue."""
+        if not self.lookups:
+            return 0.0
+        return (self.airport_hits + self.venue_hits) / self.lookups
+
+    @property
+    def keys_saved(self) -> int:
+        """Distinct texts that shared a key with another text."""
+        return self.distinct_texts - self.distinct_keys
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "airport_hits": self.airport_hits,
+            "venue_hits": self.venue_hits,
+            "hit_rate": self.hit_rate,
+            "distinct_texts": self.distinct_texts,
+            "distinct_keys": self.distinct_keys,
+            "keys_saved": self.keys_saved,
+        }
+
+
+class AddressCanonicalizer:
+    """Maps free-text origins and destinations to canonical cache-key text.
+
+    Args:
+        venues: Venue mapping to resolve names against (optional)
+        lookup: Prebuilt VenueLookup over venues (built from venues if omitted)
+        airports: IATA code -> airport names (defaults to AIRPORTS)
+    """
+
+    def __init__(
+        self,
+        venues: Optional[Mapping[str, Any]] = None,
+        lookup: Optional[VenueLookup] = None,
+        airports: Optional[Mapping[str, Iterable[str]]] = None,
+    ):
+        self.venues = venues if venues is not None else {}
+        self.lookup = lookup if lookup is not None or venues is None else VenueLookup.from_venues(venues)
+        airports = AIRPORTS if airports is None else airports
+        self._codes = {code.upper() for code in airports}
+        self._airport_names: Dict[FrozenSet[str], str] = {}
+        for code, names in airports.items():
+            for name in names:
+                tokens = frozenset(normalize_tokens(name)) - AIRPORT_WORDS
+                if tokens:
+                    self._airport_names[tokens] = code.upper()
+        self._memo: Dict[str, Canonical] = {}
+        self._counts = {"lookups": 0, "airport": 0, "venue": 0}
+        self._lock = threading.Lock()
+
+    def canonicalize(self, text: str) -> str:
+        """Return the canonical key text for a place."""
+        entry = self._memo.get(text)
+        computed = self._compute(text) if entry is None else None
+        with self._lock:
+            if computed is not None:
+                entry = self._memo.setdefault(text, computed)
+            self._counts["lookups"] += 1
+            if entry[1] is not None:
+                self._counts[entry[1]] += 1
+        return entry[0]
+
+    def _compute(self, text: str) -> Canonical:
+        code = self.airport_code(text)
+        if code is not None:
+            return f"iata:{code.lower()}", "airport"
+        venue_id = self.lookup.resolve(text) if self.lookup is not None else None
+        if venue_id is not None and venue_id in self.venues:
+            address = format_address(self.venues[venue_id].address)
+            if address:
+                return normalize_place(address) or address, "venue"
+        return normalize_place(text) or " ".join(text.split()), None
+
+    def airport_code(self, text: str) -> Optional[str]:
+        """IATA code of the airport text names, or None.
+
+        Matches a code ("SJC", "AKL Airport"), a name with an airport word
+        ("San Jose International Airport") or both ("San Jose Airport (SJC)"),
+        as long as nothing else is left in the text.
+        """
+        if text.strip().upper() in self._codes:
+            return text.strip().upper()
+        codes = {code for code in _CODE.findall(text) if code in self._codes}
+        if len(codes) > 1:
+            return None
+        tokens = set(normalize_tokens(text))
+        rest = frozenset(tokens - AIRPORT_WORDS - {code.lower() for code in codes})
+        if codes:
+            (code,) = codes
+            return code if not rest or self._airport_names.get(rest) == code else None
+        if "airport" in tokens:
+            return self._airport_names.get(rest)
+        return None
+
+    @property
+    def stats(self) -> CanonicalizationStats:
+        """Snapshot of the hit-rate statistics so far."""
+        with self._lock:
+            counts = dict(self._counts)
+            keys = [entry[0] for entry in self._memo.values()]
+        return CanonicalizationStats(
+            lookups=counts["lookups"],
+            airport_hits=counts["airport"],
+            venue_hits=counts["venue"],
+            distinct_texts=len(keys),
+            distinct_keys=len(set(keys)),
+        )
@@ -1,52 +1,262 @@
-import json
+import asyncio
 import hashlib
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterable, List, Sequence, Tuple, TypeVar
 import googlemaps
+
+from itingen.integrations.concurrency import RateLimiter, ServiceLimit, SingleFlight, call_with_backoff
+from itingen.integrations.maps.canonical import AddressCanonicalizer
+from itingen.integrations.maps.route_cache import JsonDirRouteCache, RouteCache
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
 except ImportError:
     pass  # python-dotenv not installed, fallback to environment variables only
 
+# Distance Matrix request limits (standard plan)
+MAX_MATRIX_ORIGINS = 25
+MAX_MATRIX_DESTINATIONS = 25
+MAX_MATRIX_ELEMENTS = 100
+
+Route = Tuple[str, str]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# API statuses worth retrying; anything else (NOT_FOUND, REQUEST_DENIED...) is final
+TRANSIENT_API_STATUSES = {"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"}
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether a googlemaps failure may succeed if the request is retried."""
+    if isinstance(exc, googlemaps.exceptions.HTTPError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    if isinstance(exc, (googlemaps.exceptions.TransportError, googlemaps.exceptions.Timeout)):
+        return True
+    if isinstance(exc, googlemaps.exceptions.ApiError):
+        return exc.status in TRANSIENT_API_STATUSES
+    return False
+
+
+def plan_matrix_batches(
+    routes: Iterable[Route],
+    max_origins: int = MAX_MATRIX_ORIGINS,
+    max_destinations: int = MAX_MATRIX_DESTINATIONS,
+    max_elements: int = MAX_MATRIX_ELEMENTS,
+) -> List[Tuple[List[str], List[str]]]:
+    """Pack (origin, destination) routes into Distance Matrix requests.
+
+    Returns (origins, destinations) pairs whose cross product covers every
+    route while staying within the per-request limits. Origins are packed
+    greedily in first-seen order, so routes sharing endpoints (an airport, a
+    hotel) land in the same request.
+    """
+    by_origin: Dict[str, List[str]] = {}
+    for origin, destination in routes:
+        destinations = by_origin.setdefault(origin, [])
+        if destination not in destinations:
+            destinations.append(destination)
+
+    chunk = max(1, min(max_destinations, max_elements))
+    batches: List[Tuple[List[str], List[str]]] = []
+    origins: List[str] = []
+    targets: List[str] = []
+    for origin, destinations in by_origin.items():
+        for start in range(0, len(destinations), chunk):
+            part = destinations[start:start + chunk]
+            merged = targets + [d for d in part if d not in targets]
+            if origins and (
+                len(origins) + 1 > max_origins
+                or len(merged) > max_destinations
+                or (len(origins) + 1) * len(merged) > max_elements
+            ):
+                batches.append((origins, targets))
+                origins, merged = [], list(part)
+            origins.append(origin)
+            targets = merged
+    if origins:
+        batches.append((origins, targets))
+    return batches
+
+
 class GoogleMapsClient:
-    """Client for Google Maps API with local caching."""
+    """Client for Google Maps API with local caching.
 
-    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[str] = None):
+    AIDEV-NOTE: Every API request goes through _call(): it takes a token from
+    the optional shared RateLimiter and retries transient failures
+    (is_transient_error) with jittered exponential backoff. The SDK's own
+    OVER_QUERY_LIMIT retry loop is switched off so those retries also pass
+    through the limiter. Directions lookups for the same route are collapsed
+    in flight (SingleFlight), so concurrent callers on a cold cache make one
+    request per route. get_directions_many() and get_routes() fan requests
+    out over a pool of ``max_workers`` threads.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        cache: Optional[RouteCache] = None,
+        limiter: Optional[RateLimiter] = None,
+        max_workers: int = 8,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        base_url: Optional[str] = None,
+        canonicalizer: Optional[AddressCanonicalizer] = None,
+    ):
         """Initialize with API key and optional cache directory.
         
         Args:
             api_key: Google Maps API key (defaults to GOOGLE_MAPS_API_KEY env var)
-            cache_dir: Optional cache directory for route caching
+            cache_dir: Optional cache directory for route caching (one JSON file per route)
+            cache: Route cache backend (e.g. SqliteRouteCache); overrides cache_dir
+            limiter: Rate limiter for the API key's quota, shareable between clients
+            max_workers: Threads used by get_directions_many() and get_routes()
+            max_retries: Retries of a request after a transient error
+            backoff_base: Delay before the first retry in seconds (doubles per retry)
+            base_url: API server URL (e.g. a local fake server in tests)
+            canonicalizer: Reduces origins and destinations to canonical text
+                before cache keys are built, so spellings of one place share
+                a cache entry
         """
         self.api_key = api_key or os.environ.get("GOOGLE_MAPS_API_KEY")
         if not self.api_key:
             raise ValueError("GOOGLE_MAPS_API_KEY not found in environment or provided to client")
-        
-        self.client = googlemaps.Client(key=self.api_key)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        options: Dict[str, Any] = {"retry_over_query_limit": False}
+        if base_url:
+            options["base_url"] = base_url
+        self.client = googlemaps.Client(key=self.api_key, **options)
+        self.limiter = limiter
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.canonicalizer = canonicalizer
+        self._in_flight = SingleFlight()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         self.cache_dir = Path(cache_dir) if cache_dir else None
-        if self.cache_dir:
+        if cache is None and self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache = JsonDirRouteCache(self.cache_dir)
+        self.cache = cache
 
     def _get_cache_key(self, origin: str, destination: str, mode: str) -> str:
         """Generate a stable cache key for a route."""
+        if self.canonicalizer is not None:
+            origin = self.canonicalizer.canonicalize(origin)
+            destination = self.canonicalizer.canonicalize(destination)
         content = f"{origin}|{destination}|{mode}"
         return hashlib.sha256(content.encode()).hexdigest()
 
+    def _read_cache(self, origin: str, destination: str, mode: str) -> Optional[Dict[str, Any]]:
+        if self.cache is None:
+            return None
+        return self.cache.get(self._get_cache_key(origin, destination, mode))
+
+    def _write_cache(self, data: Dict[str, Any]) -> None:
+        if self.cache is not None:
+            self.cache.put(self._get_cache_key(data["origin"], data["destination"], data["mode"]), data)
+
+    def _call(self, fn: Callable[..., T], **kwargs: Any) -> T:
+        """Make one API request under the rate limiter, retrying transient errors."""
+        def attempt() -> T:
+            if self.limiter is not None:
+                self.limiter.acquire()
+            return fn(**kwargs)
+
+        return call_with_backoff(
+            attempt, is_transient_error, max_retries=self.max_retries, base_delay=self.backoff_base
+        )
+
+    def _map(self, fn: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        """Apply fn to items on the worker pool (inline for a single item)."""
+        if self.max_workers == 1 or len(items) < 2:
+            return [fn(item) for item in items]
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="google-maps")
+        return list(self._executor.map(fn, items))
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
     def get_directions(self, origin: str, destination: str, mode: str = "driving") -> Optional[Dict[str, Any]]:
         """Get directions between two points, checking cache first."""
-        cache_key = self._get_cache_key(origin, destination, mode)
-        
-        if self.cache_dir:
-            cache_file = self.cache_dir / f"{cache_key}.json"
-            if cache_file.exists():
-                with open(cache_file, "r") as f:
-                    return json.load(f)
+        cached = self._read_cache(origin, destination, mode)
+        if cached is not None:
+            return cached
+        return self._in_flight.do(
+            self._get_cache_key(origin, destination, mode),
+            lambda: self._fetch_directions(origin, destination, mode),
+        )
+
+    def get_directions_many(self, routes: Sequence[Route], mode: str = "driving") -> Dict[Route, Optional[Dict[str, Any]]]:
+        """Look up many routes with the Directions API, fetching cache misses concurrently.
+
+        Cached routes are read in one bulk lookup; each distinct miss is
+        fetched once on the worker pool, subject to the rate limiter, and the
+        fetched routes are written back with one put_many() on the calling
+        thread. Results use the same shape as get_directions().
+        """
+        keys, results, missing = self._lookup_cached(routes, mode)
+        fetched = self._map(
+            lambda route: self._in_flight.do(keys[route], lambda: self._request_directions(route[0], route[1], mode)),
+            missing,
+        )
+        by_key = {keys[route]: data for route, data in zip(missing, fetched)}
+        if self.cache is not None:
+            self.cache.put_many({key: data for key, data in by_key.items() if data is not None})
+        return self._fill(results, keys, by_key)
+
+    def _lookup_cached(
+        self, routes: Sequence[Route], mode: str
+    ) -> Tuple[Dict[Route, str], Dict[Route, Optional[Dict[str, Any]]], List[Route]]:
+        """Cache keys, cached results and the routes to fetch (one per missing key)."""
+        keys = {route: self._get_cache_key(route[0], route[1], mode) for route in routes}
+        cached = self.cache.get_many(keys.values()) if self.cache is not None else {}
+        results: Dict[Route, Optional[Dict[str, Any]]] = {route: cached.get(key) for route, key in keys.items()}
+        # Routes that canonicalize to the same key are fetched once
+        missing: Dict[str, Route] = {}
+        for route, data in results.items():
+            if data is None:
+                missing.setdefault(keys[route], route)
+        return keys, results, list(missing.values())
+
+    @staticmethod
+    def _fill(
+        results: Dict[Route, Optional[Dict[str, Any]]],
+        keys: Dict[Route, str],
+        fetched: Dict[str, Optional[Dict[str, Any]]],
+    ) -> Dict[Route, Optional[Dict[str, Any]]]:
+        """Answer every missing route from the results fetched for its key."""
+        for route, key in keys.items():
+            if results[route] is None:
+                results[route] = fetched.get(key)
+        return results
 
-        # Call Google Maps API
+    def _fetch_directions(self, origin: str, destination: str, mode: str) -> Optional[Dict[str, Any]]:
+        """Request directions from the API and cache the result."""
+        data = self._request_directions(origin, destination, mode)
+        if data is not None:
+            self._write_cache(data)
+        return data
+
+    def _request_directions(self, origin: str, destination: str, mode: str) -> Optional[Dict[str, Any]]:
+        """Request directions from the API."""
         try:
-            result = self.client.directions(
+            result = self._call(
+                self.client.directions,
                 origin=origin,
                 destination=destination,
                 mode=mode
@@ -65,13 +275,60 @@ class GoogleMapsClient:
                 "destination": destination,
                 "mode": mode
             }
-            
-            # Save to cache
-            if self.cache_dir:
-                cache_file = self.cache_dir / f"{cache_key}.json"
-                with open(cache_file, "w") as f:
-                    json.dump(data, f)
-                    
             return data
         except Exception:
             raise
+
+    def get_routes(self, routes: Sequence[Route], mode: str = "driving") -> Dict[Route, Optional[Dict[str, Any]]]:
+        """Look up many routes, fetching cache misses with batched Distance Matrix calls.
+
+        Each distinct route (cache key) is answered once; cached routes
+        cost nothing, and the rest are packed into as few Distance Matrix
+        requests as the per-request limits allow. Results use the same shape
+        as get_directions() and are written to the same per-route cache.
+        Routes the API cannot resolve map to None.
+        """
+        keys, results, missing = self._lookup_cached(routes, mode)
+
+        wanted = set(missing)
+        fetched: Dict[str, Dict[str, Any]] = {}
+        batches = plan_matrix_batches(missing)
+        responses = self._map(
+            lambda batch: self._call(self.client.distance_matrix, origins=batch[0], destinations=batch[1], mode=mode),
+            batches,
+        )
+        for (origins, destinations), response in zip(batches, responses):
+            for origin, row in zip(origins, response.get("rows", [])):
+                for destination, element in zip(destinations, row.get("elements", [])):
+                    if (origin, destination) not in wanted or element.get("status") != "OK":
+                        continue
+                    data = {
+                        "duration_seconds": element["duration"]["value"],
+                        "duration_text": element["duration"]["text"],
+                        "distance_text": element["distance"]["text"],
+                        "origin": origin,
+                        "destination": destination,
+                        "mode": mode,
+                    }
+                    fetched[keys[(origin, destination)]] = data
+        if fetched and self.cache is not None:
+            self.cache.put_many(fetched)
+        return self._fill(results, keys, fetched)
+
+
+class AsyncGoogleMapsClient:
+    """Async wrapper around GoogleMapsClient.
+
+    The googlemaps SDK is blocking, so each lookup runs in a worker thread;
+    at most ``max_concurrency`` lookups are in flight. Cached routes are
+    served by the wrapped client as before.
+    """
+
+    def __init__(self, client: GoogleMapsClient, max_concurrency: int = 10):
+        self.client = client
+        self.limit = ServiceLimit("google_maps", max_concurrency)
+
+    async def get_directions(self, origin: str, destination: str, mode: str = "driving") -> Optional[Dict[str, Any]]:
+        """Get directions between two points, checking cache first."""
+        async with self.limit:
+            return await asyncio.to_thread(self.client.get_directions, origin, destination, mode)
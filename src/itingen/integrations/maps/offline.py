@@ -0,0 +1,279 @@
+"""Offline travel-time estimates from coordinates.
+
+AIDEV-NOTE: OfflineTravelEstimator answers get_directions()/get_routes() with
+the same result shape as GoogleMapsClient, without a key or a network call:
+duration = overhead + geodesic distance * detour factor / speed, with the
+SpeedProfile chosen by (region, mode) and falling back to the mode's default.
+Endpoints are located through the trip's venues (``location.coordinates``
+or ``coordinates``, via VenueLookup), known airports (AIRPORT_COORDINATES)
+and an optional caller-supplied places mapping. get_routes() geocodes each
+distinct endpoint once and computes the whole origins x destinations distance
+table in one pass over precomputed radians and cosines. Results carry
+``"estimated": True``.
+
+calibrate() fits the profiles to routes Google has already answered (any
+RouteCache.items()): the detour factor is the median ratio of road to
+geodesic distance, and speed and overhead come from a least-squares line
+through (road km, seconds).
+
+AIDEV-DECISION: Endpoints without coordinates give no estimate (None), so a
+draft build leaves those durations unset rather than inventing them.
+"""
+
+import math
+import re
+import statistics
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from itingen.integrations.maps.canonical import AddressCanonicalizer
+from itingen.integrations.maps.google_maps import Route
+from itingen.utils.venue_lookup import VenueLookup, exact_key
+
+EARTH_RADIUS_KM = 6371.0088
+
+LatLon = Tuple[float, float]
+
+AIRPORT_COORDINATES: Dict[str, LatLon] = {
+    "AKL": (-37.0082, 174.7850),
+    "WLG": (-41.3272, 174.8053),
+    "ZQN": (-45.0211, 168.7392),
+    "CHC": (-43.4894, 172.5322),
+    "ROT": (-38.1092, 176.3172),
+    "TUO": (-38.7397, 176.0842),
+    "SFO": (37.6213, -122.3790),
+    "SJC": (37.3626, -121.9290),
+    "OAK": (37.7126, -122.2197),
+    "LAX": (33.9416, -118.4085),
+}
+
+_DISTANCE = re.compile(r"([\d.,]+)\s*(km|mi|m|ft)\b")
+_UNIT_KM = {"km": 1.0, "m": 0.001, "mi": 1.609344, "ft": 0.0003048}
+
+
+@dataclass(frozen=True)
+class SpeedProfile:
+    """How road travel relates to straight-line distance for one mode."""
+    detour_factor: float
+    speed_kmh: float
+    overhead_seconds: float = 0.0
+
+    def seconds(self, geodesic_km: float) -> float:
+        return self.overhead_seconds + geodesic_km * self.detour_factor / self.speed_kmh * 3600
+
+
+DEFAULT_PROFILES: Dict[str, SpeedProfile] = {
+    "driving": SpeedProfile(detour_factor=1.3, speed_kmh=60.0, overhead_seconds=120.0),
+    "walking": SpeedProfile(detour_factor=1.25, speed_kmh=4.8),
+    "bicycling": SpeedProfile(detour_factor=1.25, speed_kmh=15.0),
+    "transit": SpeedProfile(detour_factor=1.4, speed_kmh=25.0, overhead_seconds=300.0),
+}
+
+
+def haversine_km(a: LatLon, b: LatLon) -> float:
+    """Great-circle distance between two (lat, lon) points in kilometres."""
+    return distance_matrix([a], [b])[0][0]
+
+
+def distance_matrix(origins: Sequence[LatLon], destinations: Sequence[LatLon]) -> List[List[float]]:
+    """Great-circle distances in km for every origin x destination pair.
+
+    Radians and cosines are computed once per point, so each pair costs two
+    sines and an arcsine.
+    """
+    def prepare(points: Sequence[LatLon]) -> List[Tuple[float, float, float]]:
+        return [(math.radians(lat), math.radians(lon), math.cos(math.radians(lat))) for lat, lon in points]
+
+    targets = prepare(destinations)
+    rows: List[List[float]] = []
+    for lat1, lon1, cos1 in prepare(origins):
+        row = []
+        for lat2, lon2, cos2 in targets:
+            h = math.sin((lat2 - lat1) / 2) ** 2 + cos1 * cos2 * math.sin((lon2 - lon1) / 2) ** 2
+            row.append(2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h))))
+        rows.append(row)
+    return rows
+
+
+def parse_coordinates(value: Any) -> Optional[LatLon]:
+    """(lat, lon) from a {"lat", "lng"/"lon"} dict, a [lat, lon] pair or "lat,lon" text."""
+    if isinstance(value, str):
+        value = value.split(",")
+    if isinstance(value, Mapping):
+        value = (value.get("lat", value.get("latitude")),
+                 value.get("lng", value.get("lon", value.get("longitude"))))
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        return None
+    try:
+        lat, lon = float(value[0]), float(value[1])
+    except (TypeError, ValueError):
+        return None
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return lat, lon
+
+
+def parse_distance_km(text: Optional[str]) -> Optional[float]:
+    """Kilometres in a Maps distance text such as '15.2 km', '1,204 km' or '9.4 mi'."""
+    match = _DISTANCE.search(text or "")
+    if match is None:
+        return None
+    try:
+        return float(match.group(1).replace(",", "")) * _UNIT_KM[match.group(2)]
+    except ValueError:
+        return None
+
+
+def format_duration(seconds: float) -> str:
+    """Maps-style duration text: '1 min', '25 mins', '1 hour 5 mins'."""
+    minutes = max(1, round(seconds / 60))
+    hours, minutes = divmod(minutes, 60)
+    parts = []
+    if hours:
+        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+    if minutes:
+        parts.append(f"{minutes} min{'s' if minutes != 1 else ''}")
+    return " ".join(parts)
+
+
+def format_distance(km: float) -> str:
+    """Maps-style distance text: '350 m', '15.2 km', '123 km'."""
+    if km < 1:
+        return f"{round(km * 1000, -1):.0f} m"
+    if km < 100:
+        return f"{km:.1f} km"
+    return f"{km:,.0f} km"
+
+
+class OfflineTravelEstimator:
+    """Drop-in replacement for GoogleMapsClient that estimates routes offline.
+
+    Args:
+        venues: Venue mapping used to locate endpoints
+        places: Extra place name -> coordinates (any form parse_coordinates accepts)
+        profiles: Speed profiles keyed by mode or by (region, mode)
+    """
+
+    def __init__(
+        self,
+        venues: Optional[Mapping[str, Any]] = None,
+        places: Optional[Mapping[str, Any]] = None,
+        profiles: Optional[Mapping[Any, SpeedProfile]] = None,
+    ):
+        self.venues = venues if venues is not None else {}
+        self.lookup = VenueLookup.from_venues(self.venues) if self.venues else None
+        self.places = {exact_key(name): value for name, value in (places or {}).items()}
+        self.profiles: Dict[Tuple[Optional[str], str], SpeedProfile] = {
+            (None, mode): profile for mode, profile in DEFAULT_PROFILES.items()
+        }
+        for key, profile in (profiles or {}).items():
+            self.profiles[key if isinstance(key, tuple) else (None, key)] = profile
+        self._airports = AddressCanonicalizer()
+        self._located: Dict[str, Optional[Tuple[LatLon, Optional[str]]]] = {}
+
+    def locate(self, text: str) -> Optional[Tuple[LatLon, Optional[str]]]:
+        """Return ((lat, lon), region) for a place name, or None if it cannot be placed."""
+        if text not in self._located:
+            self._located[text] = self._locate(text)
+        return self._located[text]
+
+    def _locate(self, text: str) -> Optional[Tuple[LatLon, Optional[str]]]:
+        venue_id = self.lookup.resolve(text) if self.lookup is not None else None
+        if venue_id is not None and venue_id in self.venues:
+            venue = self.venues[venue_id]
+            location = getattr(venue, "location", None)
+            location = location if isinstance(location, Mapping) else {}
+            point = parse_coordinates(getattr(venue, "coordinates", None) or location.get("coordinates"))
+            if point is not None:
+                address = getattr(venue, "address", None)
+                region = location.get("region") or getattr(address, "region", None)
+                return point, region
+        code = self._airports.airport_code(text)
+        if code in AIRPORT_COORDINATES:
+            return AIRPORT_COORDINATES[code], None
+        point = parse_coordinates(self.places.get(exact_key(text)))
+        return (point, None) if point is not None else None
+
+    def profile(self, region: Optional[str], mode: str) -> Optional[SpeedProfile]:
+        return self.profiles.get((region, mode)) or self.profiles.get((None, mode))
+
+    def get_directions(self, origin: str, destination: str, mode: str = "driving") -> Optional[Dict[str, Any]]:
+        """Estimate one route; None if either endpoint has no coordinates."""
+        return self.get_routes([(origin, destination)], mode=mode)[(origin, destination)]
+
+    def get_routes(self, routes: Sequence[Route], mode: str = "driving") -> Dict[Route, Optional[Dict[str, Any]]]:
+        """Estimate many routes from one distance table over their distinct endpoints."""
+        results: Dict[Route, Optional[Dict[str, Any]]] = {route: None for route in routes}
+        placed = [route for route in results if self.locate(route[0]) and self.locate(route[1])]
+        origins = list(dict.fromkeys(origin for origin, _ in placed))
+        destinations = list(dict.fromkeys(destination for _, destination in placed))
+        table = distance_matrix(
+            [self.locate(origin)[0] for origin in origins],
+            [self.locate(destination)[0] for destination in destinations],
+        )
+        row_of = {origin: i for i, origin in enumerate(origins)}
+        column_of = {destination: j for j, destination in enumerate(destinations)}
+        for origin, destination in placed:
+            profile = self.profile(self.locate(origin)[1] or self.locate(destination)[1], mode)
+            if profile is None:
+                continue
+            geodesic = table[row_of[origin]][column_of[destination]]
+            seconds = profile.seconds(geodesic)
+            results[(origin, destination)] = {
+                "duration_seconds": int(round(seconds)),
+                "duration_text": format_duration(seconds),
+                "distance_text": format_distance(geodesic * profile.detour_factor),
+                "origin": origin,
+                "destination": destination,
+                "mode": mode,
+                "estimated": True,
+            }
+        return results
+
+    def calibrate(self, records: Iterable[Dict[str, Any]], min_samples: int = 3) -> int:
+        """Fit speed profiles to known routes; returns the number of routes used.
+
+        Each record needs origin, destination, mode, duration_seconds and
+        distance_text (the shape GoogleMapsClient caches). Profiles are fitted
+        per (region, mode) and per mode; groups with fewer than min_samples
+        routes keep their current profile.
+        """
+        samples: Dict[Tuple[Optional[str], str], List[Tuple[float, float, float]]] = {}
+        used = 0
+        for record in records:
+            if record.get("estimated"):
+                continue
+            origin, destination = self.locate(record.get("origin") or ""), self.locate(record.get("destination") or "")
+            road_km = parse_distance_km(record.get("distance_text"))
+            seconds = record.get("duration_seconds")
+            if not origin or not destination or not road_km or not seconds:
+                continue
+            geodesic = distance_matrix([origin[0]], [destination[0]])[0][0]
+            if geodesic < 0.1:
+                continue
+            mode = record.get("mode") or "driving"
+            region = origin[1] or destination[1]
+            sample = (geodesic, road_km, float(seconds))
+            samples.setdefault((None, mode), []).append(sample)
+            if region is not None:
+                samples.setdefault((region, mode), []).append(sample)
+            used += 1
+        for key, group in samples.items():
+            if len(group) >= min_samples:
+                self.profiles[key] = _fit(group)
+        return used
+
+
+def _fit(samples: List[Tuple[float, float, float]]) -> SpeedProfile:
+    """SpeedProfile for (geodesic km, road km, seconds) samples."""
+    detour = statistics.median(road / geodesic for geodesic, road, _ in samples)
+    roads = [road for _, road, _ in samples]
+    seconds = [duration for _, _, duration in samples]
+    mean_road, mean_seconds = statistics.fmean(roads), statistics.fmean(seconds)
+    spread = sum((road - mean_road) ** 2 for road in roads)
+    if spread > 0:
+        slope = sum((road - mean_road) * (duration - mean_seconds) for road, duration in zip(roads, seconds)) / spread
+        overhead = mean_seconds - slope * mean_road
+        if slope > 0 and overhead >= 0:
+            return SpeedProfile(detour_factor=detour, speed_kmh=3600 / slope, overhead_seconds=overhead)
+    return SpeedProfile(detour_factor=detour, speed_kmh=3600 * sum(roads) / sum(seconds))
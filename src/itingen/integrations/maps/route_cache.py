@@ -0,0 +1,234 @@
+"""Pluggable route cache backends for GoogleMapsClient.
+
+AIDEV-NOTE: GoogleMapsClient keys routes by the sha256 of
+"origin|destination|mode" and hands the key to a RouteCache:
+- JsonDirRouteCache keeps the original layout, one <key>.json per route;
+- SqliteRouteCache stores every route in one SQLite file with per-entry
+  expiry, bulk get_many/put_many and LRU eviction above ``max_entries``.
+A cold run against SqliteRouteCache opens one file and answers all of a
+trip's routes with a single query instead of a stat and a read per route.
+migrate_json_dir() copies an existing JSON cache directory into any backend;
+items() also feeds OfflineTravelEstimator.calibrate().
+
+AIDEV-DECISION: Expired entries are treated as misses on read and are
+physically removed by compact() (or by eviction), so reads never write
+beyond the LRU access stamp.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+class RouteCache(ABC):
+    """Key-value store for route lookups."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached route for key, or None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: str, data: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store a route; ttl (seconds) overrides the backend's default expiry."""
+        raise NotImplementedError
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the cached routes among keys (misses are omitted)."""
+        found = {}
+        for key in keys:
+            data = self.get(key)
+            if data is not None:
+                found[key] = data
+        return found
+
+    def put_many(self, items: Dict[str, Dict[str, Any]], ttl: Optional[float] = None) -> None:
+        """Store several routes."""
+        for key, data in items.items():
+            self.put(key, data, ttl=ttl)
+
+    @abstractmethod
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield every live (key, route) pair, e.g. for migration or calibration."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any open resources."""
+
+
+class JsonDirRouteCache(RouteCache):
+    """One JSON file per route under a directory (the original cache layout).
+
+    Entries never expire; ``ttl`` is accepted for interface compatibility.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        cache_file = self.cache_dir / f"{key}.json"
+        if cache_file.exists():
+            with open(cache_file, "r") as f:
+                return json.load(f)
+        return None
+
+    def put(self, key: str, data: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        with open(self.cache_dir / f"{key}.json", "w") as f:
+            json.dump(data, f)
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield every readable route; unreadable files are skipped."""
+        for path in sorted(self.cache_dir.glob("*.json")):
+            try:
+                with open(path, "r") as f:
+                    yield path.stem, json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+
+
+class SqliteRouteCache(RouteCache):
+    """All routes in one SQLite file, with expiry and LRU eviction.
+
+    Safe to share between threads: every use of the single connection holds
+    a lock, so each transaction runs alone.
+
+    Args:
+        path: SQLite database file (created if missing)
+        ttl: Default lifetime of new entries in seconds (None = never expire)
+        max_entries: Evict least recently used entries beyond this many
+        clock: Time source, for tests
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS routes (
+        key TEXT PRIMARY KEY,
+        data TEXT NOT NULL,
+        expires_at REAL,
+        accessed_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS routes_accessed ON routes(accessed_at);
+    """
+
+    # SQLite's default limit on bound parameters per statement is 999
+    _CHUNK = 500
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.RLock()
+        with self._lock:
+            self.conn.executescript(self.SCHEMA)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        keys = list(dict.fromkeys(keys))
+        now = self.clock()
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock, self.conn:
+            for start in range(0, len(keys), self._CHUNK):
+                chunk = keys[start:start + self._CHUNK]
+                marks = ", ".join("?" for _ in chunk)
+                rows = self.conn.execute(
+                    f"SELECT key, data FROM routes WHERE key IN ({marks}) "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    [*chunk, now],
+                ).fetchall()
+                for key, data in rows:
+                    found[key] = json.loads(data)
+                if rows:
+                    hit_marks = ", ".join("?" for _ in rows)
+                    self.conn.execute(
+                        f"UPDATE routes SET accessed_at = ? WHERE key IN ({hit_marks})",
+                        [now, *(key for key, _ in rows)],
+                    )
+        return found
+
+    def put(self, key: str, data: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        self.put_many({key: data}, ttl=ttl)
+
+    def put_many(self, items: Dict[str, Dict[str, Any]], ttl: Optional[float] = None) -> None:
+        if not items:
+            return
+        now = self.clock()
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else now + ttl
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO routes (key, data, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                [(key, json.dumps(data), expires_at, now) for key, data in items.items()],
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        if self.max_entries is None:
+            return
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM routes").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                "DELETE FROM routes WHERE key IN (SELECT key FROM routes ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT key, data FROM routes WHERE expires_at IS NULL OR expires_at > ?", (self.clock(),)
+            ).fetchall()
+        for key, data in rows:
+            yield key, json.loads(data)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM routes").fetchone()[0]
+
+    def compact(self) -> int:
+        """Delete expired entries and reclaim their space; returns the number deleted."""
+        with self._lock:
+            with self.conn:
+                deleted = self.conn.execute(
+                    "DELETE FROM routes WHERE expires_at IS NOT NULL AND expires_at <= ?", (self.clock(),)
+                ).rowcount
+            self.conn.execute("VACUUM")
+        return deleted
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+def open_route_cache(path: str | Path, ttl: Optional[float] = None, max_entries: Optional[int] = None) -> RouteCache:
+    """SqliteRouteCache for a .db/.sqlite path, otherwise a JSON directory cache."""
+    path = Path(path)
+    if path.suffix in SQLITE_SUFFIXES:
+        return SqliteRouteCache(path, ttl=ttl, max_entries=max_entries)
+    path.mkdir(parents=True, exist_ok=True)
+    return JsonDirRouteCache(path)
+
+
+def migrate_json_dir(json_dir: str | Path, cache: RouteCache, ttl: Optional[float] = None) -> int:
+    """Copy every <key>.json route in json_dir into cache; returns the number copied.
+
+    Unreadable files are skipped. The JSON directory is left untouched.
+    """
+    items = dict(JsonDirRouteCache(json_dir).items())
+    cache.put_many(items, ttl=ttl)
+    return len(items)
@@ -6,6 +6,7 @@ locations and dates. It includes aggressive caching to minimize requests.
 Attribution: Include "Typical weather © WeatherSpark.com" near displayed data.
 """
 
+import asyncio
 import json
 import hashlib
 import re
@@ -16,6 +17,8 @@ from dataclasses import dataclass
 
 import requests
 
+from itingen.integrations.concurrency import ServiceLimit
+
 
 @dataclass(frozen=True)
 class WeatherSparkPlace:
@@ -271,3 +274,20 @@ class WeatherSparkClient:
 
         except Exception:
             return None
+
+
+class AsyncWeatherSparkClient:
+    """Async wrapper around WeatherSparkClient.
+
+    Page fetches run in worker threads, at most ``max_concurrency`` at a time
+    to stay polite to weatherspark.com.
+    """
+
+    def __init__(self, client: WeatherSparkClient, max_concurrency: int = 4):
+        self.client = client
+        self.limit = ServiceLimit("weatherspark", max_concurrency)
+
+    async def get_typical_weather(self, location: str, date: str) -> Optional[Dict[str, Any]]:
+        """Get typical weather for a location and date, checking cache first."""
+        async with self.limit:
+            return await asyncio.to_thread(self.client.get_typical_weather, location, date)
@@ -1,8 +1,20 @@
 """Pipeline orchestration and execution flow logic."""
 from .orchestrator import PipelineOrchestrator
+from .normalization import TimeNormalizationHydrator
 from .sorting import ChronologicalSorter
 from .filtering import PersonFilter
 from .transitions import TransitionRegistry
+from .parallel import ParallelHydrators
+from .batch import FanOutPipeline, PipelineBranch
 
 
-__all__ = ["PipelineOrchestrator", "ChronologicalSorter", "PersonFilter", "TransitionRegistry"]
+__all__ = [
+    "PipelineOrchestrator",
+    "TimeNormalizationHydrator",
+    "ChronologicalSorter",
+    "PersonFilter",
+    "TransitionRegistry",
+    "ParallelHydrators",
+    "FanOutPipeline",
+    "PipelineBranch",
+]
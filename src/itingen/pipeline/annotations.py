@@ -5,52 +5,53 @@ to events based on their kind and metadata, following the patterns from
 the original NZ trip system.
 """
 
-from typing import List, Tuple, TypeVar
-from itingen.core.base import BaseHydrator
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
+from itingen.core.base import PatchHydrator
 from itingen.core.domain.events import Event
 
 T = TypeVar('T')
 
-class EmotionalAnnotationHydrator(BaseHydrator[Event]):
+class EmotionalAnnotationHydrator(PatchHydrator[Event]):
     """Adds emotional annotations to stress-heavy event types."""
 
-    def hydrate(self, items: List[T], context=None) -> List[T]:
-        """Enrich events with emotional metadata."""
-        new_items = []
+    memo_scope = "item"
+
+    # Stressy kinds from original script
+    STRESSY_KINDS = frozenset({
+        "flight_departure",
+        "flight_arrival",
+        "airport_buffer",
+        "drive",
+        "ferry",
+        "lodging_checkin",
+        "lodging_checkout",
+        "decision",
+    })
+
+    def compute_patches(self, items: List[T], context=None) -> List[Optional[Dict[str, Any]]]:
+        """Compute emotional metadata for events."""
+        patches: List[Optional[Dict[str, Any]]] = []
         for event in items:
             kind = (event.kind or "").strip().lower()
             travel_mode = (getattr(event, "travel_mode", None) or "").strip().lower()
             heading = (event.event_heading or "").lower()
             
-            # Stressy kinds from original script
-            stressy_kinds = {
-                "flight_departure",
-                "flight_arrival",
-                "airport_buffer",
-                "drive",
-                "ferry",
-                "lodging_checkin",
-                "lodging_checkout",
-                "decision",
-            }
-            
             # Skip short drives (< 20m) if duration is available
-            is_stressy = kind in stressy_kinds
+            is_stressy = kind in self.STRESSY_KINDS
             if kind == "drive" and hasattr(event, "duration"):
                 # Simple duration check if possible
                 pass # For now, keep it simple
 
             if is_stressy:
                 triggers, high_point = self._get_annotations(kind, travel_mode, heading)
-                updates = {
+                patches.append({
                     "emotional_triggers": triggers,
                     "emotional_high_point": high_point
-                }
-                new_items.append(event.model_copy(update=updates))
+                })
             else:
-                new_items.append(event)
+                patches.append(None)
 
-        return new_items
+        return patches
 
     def _get_annotations(self, kind: str, travel_mode: str, heading: str) -> Tuple[str, str]:
         """Logic extracted from the original NZ trip system."""
@@ -0,0 +1,167 @@
+"""Fan-out execution: load and hydrate once, then run many output branches.
+
+AIDEV-NOTE: Generating one itinerary per traveler used to mean one full
+pipeline run per person, re-parsing every event file and reloading venues,
+fonts and AI caches each time. FanOutPipeline runs the provider and the
+person-independent hydrators once through a base orchestrator, then runs each
+branch (PersonFilter, neighbour-dependent hydrators and emitters) as its own
+PipelineOrchestrator over an InMemoryProvider on a thread pool.
+
+AIDEV-DECISION: Only hydrators whose per-event output does not depend on which
+other events are present may go in the shared stage (sorting, per-event
+annotations). Look-ahead/look-behind hydrators such as WrapUpHydrator and
+TransitionHydrator must run after PersonFilter, inside each branch.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Generic, List, Optional, TypeVar
+
+from itingen.core.base import BaseEmitter, BaseHydrator
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+from itingen.pipeline.profiling import PipelineTrace, StageRecord
+from itingen.providers.memory import InMemoryProvider
+
+T = TypeVar("T")
+
+
+@dataclass
+class PipelineBranch(Generic[T]):
+    """Per-branch stages run on top of the shared hydrated data."""
+    name: str
+    output_dir: Path
+    hydrators: List[BaseHydrator[T]] = field(default_factory=list)
+    emitters: List[BaseEmitter[T]] = field(default_factory=list)
+
+
+def people_slugs(config: Dict[str, Any]) -> List[str]:
+    """Return traveler slugs from a trip config's ``people`` list.
+
+    Entries may be mappings with a ``slug`` key or plain slug strings.
+    """
+    slugs = []
+    for person in config.get("people") or []:
+        slug = person.get("slug") if isinstance(person, dict) else person
+        if slug:
+            slugs.append(str(slug))
+    return slugs
+
+
+class FanOutPipeline(Generic[T]):
+    """Runs a base orchestrator once and fans its output out to branches.
+
+    Branch orchestrators inherit the base orchestrator's memoization, emitter
+    mode, profiling and checkpoint settings. With a cProfile directory set,
+    branches run one at a time.
+    """
+
+    def __init__(self, base: PipelineOrchestrator[T], max_workers: Optional[int] = None):
+        """Initialize the fan-out.
+
+        Args:
+            base: Orchestrator holding the provider and shared hydrators; its
+                emitters are ignored
+            max_workers: Thread pool size for branches (defaults to one per branch)
+        """
+        self.base = base
+        self.max_workers = max_workers
+        self.shared: Optional[List[T]] = None
+        self.branch_orchestrators: Dict[str, PipelineOrchestrator[T]] = {}
+        # Elapsed time of load() plus run(); branches overlap, so their
+        # traces' times cannot simply be added
+        self.wall_seconds = 0.0
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Trip configuration loaded by the base orchestrator."""
+        return self.base.config
+
+    def load(self, output_dir: Optional[Path] = None) -> List[T]:
+        """Run the provider and shared hydrators once.
+
+        Args:
+            output_dir: Directory for the shared stage cache when memoizing
+        """
+        start = time.perf_counter()
+        try:
+            self.shared = self.base.hydrate(output_dir)
+        finally:
+            self.wall_seconds += time.perf_counter() - start
+        return self.shared
+
+    def run(self, branches: List[PipelineBranch[T]]) -> Dict[str, List[T]]:
+        """Run every branch concurrently on the shared data.
+
+        Returns:
+            Mapping of branch name to that branch's hydrated data
+
+        Raises:
+            RuntimeError: Listing every branch that failed (all branches are
+                run to completion first)
+        """
+        if self.shared is None:
+            raise RuntimeError("FanOutPipeline.load() must be called before run()")
+        if not branches:
+            return {}
+
+        provider = InMemoryProvider(self.shared, self.base.venues, self.base.config)
+        for branch in branches:
+            cprofile_dir = None
+            if self.base.cprofile_dir is not None:
+                cprofile_dir = Path(self.base.cprofile_dir) / branch.name
+            self.branch_orchestrators[branch.name] = PipelineOrchestrator(
+                provider,
+                hydrators=list(branch.hydrators),
+                emitters=list(branch.emitters),
+                memoize=self.base.memoize,
+                emitter_mode=self.base.emitter_mode,
+                profile=self.base.profile,
+                # tracemalloc is process-global; per-branch peaks would overlap
+                profile_memory=False,
+                cprofile_dir=cprofile_dir,
+                checkpoint=self.base.checkpoint,
+                resume=self.base.resume,
+                coalesce_patches=self.base.coalesce_patches,
+            )
+
+        results: Dict[str, List[T]] = {}
+        failures: List[str] = []
+        first_error: Optional[Exception] = None
+        workers = self.max_workers or len(branches)
+        if self.base.cprofile_dir is not None:
+            # Only one cProfile profiler may be active per process (an error
+            # on Python 3.12+), so profiled branches run one at a time
+            workers = 1
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                branch.name: pool.submit(self.branch_orchestrators[branch.name].execute, branch.output_dir)
+                for branch in branches
+            }
+            for branch in branches:
+                try:
+                    results[branch.name] = futures[branch.name].result()
+                except Exception as e:
+                    failures.append(f"{branch.name}: {e}")
+                    first_error = first_error or e
+        self.wall_seconds += time.perf_counter() - start
+
+        if failures:
+            raise RuntimeError("Branches failed: " + "; ".join(failures)) from first_error
+        return results
+
+    @property
+    def trace(self) -> Optional[PipelineTrace]:
+        """Combined trace: shared stages, then each branch's stages prefixed with its name."""
+        if self.base.trace is None:
+            return None
+        combined = PipelineTrace(started_at=self.base.trace.started_at, wall_seconds=self.wall_seconds)
+        combined.stages.extend(self.base.trace.stages)
+        for name, orchestrator in self.branch_orchestrators.items():
+            if orchestrator.trace is None:
+                continue
+            for stage in orchestrator.trace.stages:
+                combined.stages.append(StageRecord(**{**vars(stage), "name": f"{name}/{stage.name}"}))
+        return combined
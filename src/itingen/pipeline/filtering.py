@@ -14,6 +14,9 @@ T = TypeVar("T")
 class PersonFilter(BaseHydrator[Event]):
     """Filters events to show only those relevant to a specific person."""
 
+    memoizable = False
+    day_local = True
+
     def __init__(self, person_slug: Optional[str] = None):
         """Initialize with a person slug.
         
@@ -0,0 +1,177 @@
+"""Day-windowed incremental hydration.
+
+AIDEV-NOTE: Most of the hydrator chain is local: per-event annotations depend
+on nothing but the event, and wrap-up timing and transitions look one event
+ahead or behind (see BaseHydrator.neighbour_window). IncrementalHydration
+exploits this for long-running sessions such as watch mode: the list-level
+prefix of the chain (sorting, filtering) runs over the whole list, and the
+windowed remainder runs per contiguous same-day segment with a halo of
+neighbouring events, reusing the previous result for every segment whose
+window is unchanged. Editing one day therefore recomputes that day plus the
+segments whose halo crosses into it.
+
+Item-scoped hydrators ahead of the list-level stages (TimeNormalizationHydrator
+runs first in the CLI chain) belong to the prefix, but run per item: only
+items that are new since the last run are hydrated, and every other item maps
+to its previous output object, so the sorter and the windowed stages still
+see unchanged days object-for-object.
+
+AIDEV-DECISION: Windows are keyed by the identity of their input objects
+(which are immutable pydantic models handed through unchanged by the provider
+cache and list-level hydrators), not by content fingerprints, so a reuse
+check costs O(window) pointer comparisons instead of serializing events.
+The cache holds references to its inputs, so ids cannot be recycled.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from itingen.core.base import BaseHydrator, PipelineContext, effective_window
+from itingen.utils.grouping import event_date
+
+
+@dataclass
+class _WindowEntry:
+    inputs: List[Any]
+    outputs: List[Any]
+
+
+def split_chain(
+    hydrators: List[BaseHydrator],
+) -> Tuple[List[BaseHydrator], List[BaseHydrator], List[BaseHydrator]]:
+    """Split a chain into (list-level prefix, windowed middle, list-level suffix).
+
+    The prefix runs up to the last list-level hydrator among the leading
+    list-level and item-scoped ones, so a leading item-scoped hydrator does not
+    push the sorter and everything after it into the suffix. The windowed
+    middle is the longest run of hydrators with a bounded neighbour window
+    that follows the prefix.
+    """
+    start = 0
+    for i, hydrator in enumerate(hydrators):
+        window = effective_window(hydrator)
+        if window is None:
+            start = i + 1
+        elif window:
+            break
+    end = start
+    while end < len(hydrators) and effective_window(hydrators[end]) is not None:
+        end += 1
+    return hydrators[:start], hydrators[start:end], hydrators[end:]
+
+
+def segment_bounds(items: List[Any], key: Callable[[Any], str]) -> List[Tuple[int, int]]:
+    """Return [start, end) bounds of contiguous runs of items with the same key."""
+    bounds: List[Tuple[int, int]] = []
+    start = 0
+    for i in range(1, len(items) + 1):
+        if i == len(items) or key(items[i]) != key(items[start]):
+            bounds.append((start, i))
+            start = i
+    return bounds
+
+
+class IncrementalHydration:
+    """Runs a hydrator chain, reusing per-day results across calls.
+
+    Args:
+        hydrators: The full hydrator chain, in pipeline order
+        key: Segment key for an item (defaults to the event's date)
+    """
+
+    def __init__(self, hydrators: List[BaseHydrator], key: Callable[[Any], str] = event_date):
+        self.hydrators = list(hydrators)
+        self.prefix, self.windowed, self.suffix = split_chain(self.hydrators)
+        # Composed dependency radius of the windowed hydrators
+        self.halo = sum(effective_window(h) for h in self.windowed)
+        self.key = key
+        self._windows: Dict[Tuple[int, ...], _WindowEntry] = {}
+        # Per item-scoped prefix hydrator: id(input) -> (input, output)
+        self._items: Dict[int, Dict[int, Tuple[Any, Any]]] = {}
+        self._context_id: Optional[int] = None
+        self.segments_reused = 0
+        self.segments_recomputed = 0
+
+    def invalidate(self) -> None:
+        """Drop all cached windows (e.g. after the venues or config changed)."""
+        self._windows = {}
+        self._items = {}
+
+    def run(self, items: List[Any], context: Optional[PipelineContext] = None) -> List[Any]:
+        """Hydrate items, recomputing only segments whose window changed."""
+        if context is not None and id(context) != self._context_id:
+            self.invalidate()
+            self._context_id = id(context)
+        self.segments_reused = 0
+        self.segments_recomputed = 0
+
+        data = items
+        for i, hydrator in enumerate(self.prefix):
+            if effective_window(hydrator) == 0:
+                data = self._run_items(i, hydrator, data, context)
+            else:
+                data = hydrator.hydrate(data, context)
+
+        if self.windowed and data:
+            data = self._run_windowed(data, context)
+
+        for hydrator in self.suffix:
+            data = hydrator.hydrate(data, context)
+        return data
+
+    def _run_items(
+        self,
+        index: int,
+        hydrator: BaseHydrator,
+        data: List[Any],
+        context: Optional[PipelineContext],
+    ) -> List[Any]:
+        previous = self._items.get(index, {})
+        cache = {
+            id(item): previous[id(item)] for item in data
+            if id(item) in previous and previous[id(item)][0] is item
+        }
+        # New items are hydrated in one call so bulk passes stay bulk
+        missing = list({id(item): item for item in data if id(item) not in cache}.values())
+        if missing:
+            outputs = hydrator.hydrate(missing, context)
+            if len(outputs) != len(missing):
+                raise ValueError(
+                    f"{type(hydrator).__name__} declares memo_scope='item' but changed "
+                    "the number of items"
+                )
+            for item, output in zip(missing, outputs):
+                cache[id(item)] = (item, output)
+        self._items[index] = cache
+        return [cache[id(item)][1] for item in data]
+
+    def _run_windowed(self, data: List[Any], context: Optional[PipelineContext]) -> List[Any]:
+        windows: Dict[Tuple[int, ...], _WindowEntry] = {}
+        result: List[Any] = []
+        for start, end in segment_bounds(data, self.key):
+            lo = max(0, start - self.halo)
+            hi = min(len(data), end + self.halo)
+            window_inputs = data[lo:hi]
+            window_key = tuple(id(item) for item in window_inputs)
+
+            entry = self._windows.get(window_key)
+            if entry is not None and all(a is b for a, b in zip(entry.inputs, window_inputs)):
+                self.segments_reused += 1
+            else:
+                outputs = window_inputs
+                for hydrator in self.windowed:
+                    outputs = hydrator.hydrate(outputs, context)
+                    if len(outputs) != len(window_inputs):
+                        raise ValueError(
+                            f"{type(hydrator).__name__} declares a neighbour window but changed "
+                            "the number of items"
+                        )
+                entry = _WindowEntry(inputs=window_inputs, outputs=outputs)
+                self.segments_recomputed += 1
+
+            windows[window_key] = entry
+            result.extend(entry.outputs[start - lo:end - lo])
+
+        # Keep only windows used by this run so memory tracks the current trip
+        self._windows = windows
+        return result
@@ -0,0 +1,148 @@
+"""Stage-level memoization for the SPE pipeline.
+
+AIDEV-NOTE: The StageCache lets the orchestrator skip hydrators whose inputs
+and configuration have not changed since a previous run. Outputs are persisted
+as JSON under the output directory and keyed with compute_fingerprint.
+
+Two granularities are supported, selected by ``BaseHydrator.memo_scope``:
+- "list": the whole input list is fingerprinted; any change reruns the stage.
+- "item": each item is fingerprinted on its own and only changed items are
+  passed to the hydrator, so editing one event reruns the stage for one event.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from itingen.core.base import BaseHydrator, PipelineContext
+from itingen.utils.fingerprint import compute_fingerprint
+
+CACHE_DIR_NAME = ".stage_cache"
+
+
+def dump_item(item: Any) -> Any:
+    """Serialize a domain object to JSON-compatible data."""
+    return item.model_dump(mode="json")
+
+
+def fingerprint_context(context: Optional[PipelineContext]) -> str:
+    """Fingerprint the venues and trip configuration shared by all stages.
+
+    Venue metadata timestamps default to "now" when absent from source files,
+    so they are excluded to keep the fingerprint stable across runs. Lazy venue
+    mappings fingerprint their index instead, so no venue has to be parsed.
+    """
+    if context is None:
+        return compute_fingerprint(None)
+    if hasattr(context.venues, "fingerprint"):
+        return compute_fingerprint({"venues": context.venues.fingerprint(), "config": context.config})
+    venues = {}
+    for venue_id, venue in context.venues.items():
+        if hasattr(venue, "model_dump"):
+            venues[venue_id] = venue.model_dump(mode="json", exclude={"metadata"})
+        else:
+            venues[venue_id] = venue
+    return compute_fingerprint({"venues": venues, "config": context.config})
+
+
+class StageCache:
+    """Disk-backed cache of hydrator outputs keyed on input fingerprints."""
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def supports(hydrator: BaseHydrator, items: List[Any]) -> bool:
+        """Return True if the stage can be memoized for these items.
+
+        Only pydantic models can be round-tripped, and an empty input gives no
+        item type to restore outputs into.
+        """
+        if not getattr(hydrator, "memoizable", True) or not items:
+            return False
+        return all(hasattr(item, "model_dump") for item in items)
+
+    def run(
+        self,
+        index: int,
+        hydrator: BaseHydrator,
+        items: List[Any],
+        context: Optional[PipelineContext],
+        context_fp: str,
+    ) -> List[Any]:
+        """Run a hydrator through the cache, recomputing only what changed."""
+        stage_key = compute_fingerprint({
+            "index": index,
+            "config": hydrator.cache_config(),
+            "context": context_fp,
+        })
+        if getattr(hydrator, "memo_scope", "list") == "item":
+            return self._run_items(stage_key, hydrator, items, context)
+        return self._run_list(stage_key, hydrator, items, context)
+
+    def _run_list(self, stage_key: str, hydrator: BaseHydrator, items: List[Any], context) -> List[Any]:
+        item_type = type(items[0])
+        input_fp = compute_fingerprint([dump_item(item) for item in items])
+        cache_file = self.cache_dir / f"{stage_key}.json"
+
+        entry = self._read(cache_file)
+        if entry is not None and entry.get("input") == input_fp:
+            self.hits += 1
+            return [item_type.model_validate(data) for data in entry["output"]]
+
+        self.misses += 1
+        result = hydrator.hydrate(items, context)
+        if all(hasattr(item, "model_dump") for item in result):
+            self._write(cache_file, {"input": input_fp, "output": [dump_item(item) for item in result]})
+        return result
+
+    def _run_items(self, stage_key: str, hydrator: BaseHydrator, items: List[Any], context) -> List[Any]:
+        item_type = type(items[0])
+        cache_file = self.cache_dir / f"{stage_key}.items.json"
+        cached: Dict[str, Any] = (self._read(cache_file) or {}).get("items", {})
+
+        fingerprints = [compute_fingerprint(dump_item(item)) for item in items]
+        results: List[Any] = [None] * len(items)
+        missing: List[int] = []
+        for i, fp in enumerate(fingerprints):
+            if fp in cached:
+                results[i] = item_type.model_validate(cached[fp])
+                self.hits += 1
+            else:
+                missing.append(i)
+                self.misses += 1
+
+        if missing:
+            computed = hydrator.hydrate([items[i] for i in missing], context)
+            if len(computed) != len(missing):
+                raise ValueError(
+                    f"{type(hydrator).__name__} declares memo_scope='item' but returned "
+                    f"{len(computed)} items for {len(missing)} inputs"
+                )
+            for i, item in zip(missing, computed):
+                results[i] = item
+
+        # Rewrite with only the entries used by this run so stale items are pruned
+        self._write(cache_file, {
+            "items": {fp: dump_item(item) for fp, item in zip(fingerprints, results)}
+        })
+        return results
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            # A corrupt entry is a cache miss, not a pipeline failure
+            return None
+
+    def _write(self, path: Path, data: Dict[str, Any]) -> None:
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        tmp_path.replace(path)
@@ -0,0 +1,74 @@
+"""Hydrator that parses event time strings into typed fields.
+
+AIDEV-NOTE: Runs first in the chain so the sorter, WrapUpHydrator and the
+emitters read time_epoch / time_local_dt / no_later_than_dt instead of
+re-splitting and re-parsing the same strings at every step. Local times are
+resolved in the event's timezone, falling back to the trip config's
+``timezone``, and are converted for the whole list in one bulk pass
+(utils.times.localize_many).
+
+With ``fill_utc`` (the default), events that give time_local and their own
+``timezone`` but no time_utc also get time_utc filled in. Events relying on
+the trip's default timezone only get time_epoch: their zone is a guess, and
+writing it into a source field would present the guess as data. Date grouping
+(utils.grouping.event_date) uses the local date before time_utc, so a filled
+time_utc never moves an event east of UTC onto the previous day.
+
+AIDEV-DECISION: Not memoizable. The typed fields are excluded from
+serialization, so a memoized output would come back without them; parsing
+is cheaper than the cache lookup anyway.
+"""
+
+from typing import Any, Dict, List, Optional
+from itingen.core.base import PatchHydrator
+from itingen.core.domain.events import Event
+from itingen.utils.times import format_utc, localize_many, parse_local, utc_epoch
+
+
+class TimeNormalizationHydrator(PatchHydrator[Event]):
+    """Sets time_epoch, time_local_dt and no_later_than_dt on each event."""
+
+    memoizable = False
+    memo_scope = "item"
+
+    def __init__(self, default_timezone: Optional[str] = None, fill_utc: bool = True):
+        """Initialize with the timezone for events that declare none.
+
+        Args:
+            default_timezone: IANA timezone name (defaults to the trip config's
+                ``timezone`` when a pipeline context is given)
+            fill_utc: Set time_utc on events with time_local and a timezone
+        """
+        self.default_timezone = default_timezone
+        self.fill_utc = fill_utc
+
+    def compute_patches(self, items: List[Event], context=None) -> List[Optional[Dict[str, Any]]]:
+        """Parse each event's time fields once and convert local times in bulk."""
+        default_timezone = self.default_timezone
+        if default_timezone is None and context is not None:
+            default_timezone = context.config.get("timezone")
+
+        locals_ = [parse_local(event.time_local) for event in items]
+        deadlines = [parse_local(event.no_later_than) for event in items]
+        epochs = [utc_epoch(event.time_utc) for event in items]
+        pending = [i for i, epoch in enumerate(epochs) if epoch is None and (locals_[i] or deadlines[i])]
+        converted = localize_many(
+            [locals_[i] or deadlines[i] for i in pending],
+            [items[i].timezone or default_timezone for i in pending],
+        )
+        for i, epoch in zip(pending, converted):
+            epochs[i] = epoch
+
+        patches: List[Optional[Dict[str, Any]]] = []
+        for event, local, deadline, epoch in zip(items, locals_, deadlines, epochs):
+            updates: Dict[str, Any] = {}
+            if local is not None:
+                updates["time_local_dt"] = local
+            if deadline is not None:
+                updates["no_later_than_dt"] = deadline
+            if epoch is not None:
+                updates["time_epoch"] = epoch
+                if self.fill_utc and local is not None and event.timezone and not event.time_utc:
+                    updates["time_utc"] = format_utc(epoch)
+            patches.append(updates or None)
+        return patches
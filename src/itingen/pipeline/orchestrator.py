@@ -4,15 +4,53 @@ AIDEV-NOTE: This is the central coordinator that manages the flow from Provider
 through a sequence of Hydrators to Emitters. It implements the SPE lifecycle.
 """
 
-from typing import List, Generic, TypeVar, Optional, Dict, Any
+import asyncio
+import pickle
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator, List, Generic, Mapping, TypeVar, Optional, Dict, Any, Tuple
 from pathlib import Path
 
-from itingen.core.base import BaseProvider, BaseHydrator, BaseEmitter, PipelineContext
+from itingen.core.base import AsyncBaseHydrator, BaseProvider, BaseHydrator, BaseEmitter, PipelineContext
 from itingen.core.domain.venues import Venue
+from itingen.pipeline.checkpoints import CHECKPOINT_DIR_NAME, CheckpointStore, chain_keys, source_key
+from itingen.pipeline.memoization import CACHE_DIR_NAME, StageCache, fingerprint_context
+from itingen.pipeline.parallel import ParallelHydrators
+from itingen.pipeline.patches import PatchSegment, coalesce
+from itingen.pipeline.profiling import PipelineTrace, StageProfiler, StageRecord, count_items
+from itingen.pipeline.streaming import StreamingHydration, iter_days
 from itingen.pipeline.transitions import TransitionRegistry
 
 T = TypeVar("T")  # The domain model type (e.g., Event or Itinerary)
 
+EMITTER_MODES = ("sequential", "parallel")
+
+
+def _emit(emitter: BaseEmitter, itinerary: List[Any], output_path: str) -> Tuple[str, float, float]:
+    """Run a single emitter; module-level so it can be sent to a worker process.
+    
+    Returns:
+        The emitted path plus wall and CPU seconds measured in the worker
+    """
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    path = emitter.emit(itinerary, output_path)
+    return path, time.perf_counter() - wall_start, time.thread_time() - cpu_start
+
+
+def _stage_name(hydrator: BaseHydrator) -> str:
+    if isinstance(hydrator, PatchSegment):
+        return hydrator.name
+    return type(hydrator).__name__
+
+
+def _is_picklable(obj: Any) -> bool:
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
 
 class PipelineOrchestrator(Generic[T]):
     """Orchestrates the flow of data through the SPE pipeline.
@@ -29,6 +67,14 @@ class PipelineOrchestrator(Generic[T]):
         hydrators: Optional[List[BaseHydrator[T]]] = None,
         emitters: Optional[List[BaseEmitter[T]]] = None,
         transition_registry: Optional[TransitionRegistry] = None,
+        memoize: bool = False,
+        emitter_mode: str = "sequential",
+        profile: bool = False,
+        profile_memory: bool = True,
+        cprofile_dir: Optional[Path] = None,
+        checkpoint: bool = False,
+        resume: bool = False,
+        coalesce_patches: bool = True,
     ):
         """Initialize the orchestrator with components.
         
@@ -37,12 +83,44 @@ class PipelineOrchestrator(Generic[T]):
             hydrators: List of hydrators to apply in order (Pipeline)
             emitters: List of emitters to generate output (Target)
             transition_registry: Optional registry for event transitions
+            memoize: Reuse hydrator outputs from previous runs when their inputs
+                and configuration are unchanged (stored under the output directory)
+            emitter_mode: "sequential" runs emitters one after another and stops
+                at the first failure; "parallel" runs them concurrently (see
+                BaseEmitter.execution) and reports every failure
+            profile: Record per-stage wall/CPU time, item counts and peak memory
+                into ``self.trace`` (a PipelineTrace)
+            profile_memory: Track peak memory with tracemalloc while profiling
+            cprofile_dir: If set while profiling, dump cProfile stats per stage here
+            checkpoint: Save the hydrated list after every hydrator under
+                ``<output_dir>/.checkpoints`` (see pipeline.checkpoints)
+            resume: Restore the last checkpoint that still matches the current
+                inputs and hydrator chain, and continue after it (implies checkpoint)
+            coalesce_patches: Run consecutive PatchHydrators as one stage that
+                copies each event once (profiling, memoization and checkpoints
+                then see the group as a single stage)
         """
+        if emitter_mode not in EMITTER_MODES:
+            raise ValueError(f"Unknown emitter_mode '{emitter_mode}' (expected one of {EMITTER_MODES})")
         self.provider = provider
         self.hydrators = hydrators or []
         self.emitters = emitters or []
         self.transition_registry = transition_registry
-        self.venues: Dict[str, Venue] = {}
+        self.memoize = memoize
+        self.emitter_mode = emitter_mode
+        self.stage_cache: Optional[StageCache] = None
+        self.profile = profile
+        self.profile_memory = profile_memory
+        self.cprofile_dir = cprofile_dir
+        self.trace: Optional[PipelineTrace] = None
+        self.checkpoint = checkpoint or resume
+        self.resume = resume
+        self.coalesce_patches = coalesce_patches
+        # Index of the hydrator whose checkpoint the last run resumed after
+        self.resumed_after: Optional[int] = None
+        # Number of events written by the last execute_streaming() run
+        self.events_streamed = 0
+        self.venues: Mapping[str, Venue] = {}
         self.config: Dict[str, Any] = {}
     
     def set_transition_registry(self, registry: TransitionRegistry) -> "PipelineOrchestrator[T]":
@@ -63,6 +141,20 @@ class PipelineOrchestrator(Generic[T]):
         self.hydrators.append(hydrator)
         return self
     
+    def add_parallel_hydrators(
+        self, hydrators: List[BaseHydrator[T]], max_workers: Optional[int] = None
+    ) -> "PipelineOrchestrator[T]":
+        """Add a group of independent hydrators that run concurrently.
+        
+        The group occupies a single pipeline position; see ParallelHydrators
+        for the merge rules.
+        
+        Returns:
+            Self for method chaining
+        """
+        self.hydrators.append(ParallelHydrators(hydrators, max_workers=max_workers))
+        return self
+    
     def add_emitter(self, emitter: BaseEmitter[T]) -> "PipelineOrchestrator[T]":
         """Add an emitter to the pipeline.
         
@@ -85,42 +177,399 @@ class PipelineOrchestrator(Generic[T]):
             ValueError: If no emitters are configured
             RuntimeError: If any component fails
         """
-        # Source Stage: Load raw data
+        return self._run(output_dir, emit=True)
+    
+    def hydrate(self, output_dir: Optional[Path] = None) -> List[T]:
+        """Run the Source and Pipeline stages without emitting output.
+        
+        Used when the hydrated data is handed on to further pipelines, e.g. the
+        per-person branches of a FanOutPipeline.
+        
+        Args:
+            output_dir: Base directory for the stage cache when memoizing
+            
+        Returns:
+            The fully hydrated data after all enrichments
+            
+        Raises:
+            RuntimeError: If any component fails
+        """
+        return self._run(output_dir, emit=False)
+    
+    def _run(self, output_dir: Optional[Path], emit: bool) -> List[T]:
+        profiler = StageProfiler(
+            enabled=self.profile,
+            trace_memory=self.profile_memory,
+            cprofile_dir=self.cprofile_dir,
+        )
+        if self.profile:
+            self.trace = profiler.trace
+        profiler.start()
         try:
-            events = self.provider.get_events()
-            # Load venues and config
-            self.venues = self.provider.get_venues()
-            self.config = self.provider.get_config()
-        except Exception as e:
-            raise RuntimeError(f"Provider failed to load data: {e}") from e
+            return self._execute(output_dir, profiler, emit)
+        finally:
+            profiler.stop()
+    
+    def _execute(self, output_dir: Optional[Path], profiler: StageProfiler, emit: bool) -> List[T]:
+        current_data = self._load(profiler)
+        if output_dir is None:
+            output_dir = Path.cwd()
         
         # Pipeline Stage: Apply hydrators in sequence
-        current_data = events
-        context = PipelineContext(venues=self.venues, config=self.config)
-        for i, hydrator in enumerate(self.hydrators):
-            try:
-                current_data = hydrator.hydrate(current_data, context)
-            except Exception as e:
-                raise RuntimeError(f"Hydrator {i} ({type(hydrator).__name__}) failed: {e}") from e
+        context, stage_cache, context_fp = self._hydration_context(output_dir)
+        stages = self._stages()
+        store, keys, start, current_data = self._restore_checkpoint(stages, current_data, context, output_dir, profiler)
+        for pos in range(start, len(stages)):
+            i, _, hydrator = stages[pos]
+            current_data = self._hydrate_stage(i, hydrator, current_data, context, stage_cache, context_fp, profiler)
+            self._save_checkpoint(store, keys, pos, hydrator, current_data, profiler)
+        
+        if not emit:
+            return current_data
+        self._emit_all(current_data, output_dir, profiler)
+        return current_data
+    
+    async def execute_async(self, output_dir: Optional[Path] = None) -> List[T]:
+        """Execute the complete SPE pipeline on the running event loop.
+        
+        AsyncBaseHydrators are awaited on the loop, so their client calls run
+        concurrently up to each client's per-service limit. Sync hydrators,
+        memoized stages, the provider and emitters run in a worker thread so
+        the loop stays responsive (e.g. to other pipelines gathered alongside).
+        
+        Args:
+            output_dir: Base directory for emitters to write output
+            
+        Returns:
+            The fully hydrated data after all enrichments
+            
+        Raises:
+            ValueError: If no emitters are configured
+            RuntimeError: If any component fails
+        """
+        profiler = StageProfiler(
+            enabled=self.profile,
+            trace_memory=self.profile_memory,
+            cprofile_dir=self.cprofile_dir,
+        )
+        if self.profile:
+            self.trace = profiler.trace
+        profiler.start()
+        try:
+            current_data = await asyncio.to_thread(self._load, profiler)
+            if output_dir is None:
+                output_dir = Path.cwd()
+            
+            context, stage_cache, context_fp = self._hydration_context(output_dir)
+            stages = self._stages()
+            store, keys, start, current_data = await asyncio.to_thread(
+                self._restore_checkpoint, stages, current_data, context, output_dir, profiler
+            )
+            for pos in range(start, len(stages)):
+                i, _, hydrator = stages[pos]
+                cached = stage_cache is not None and StageCache.supports(hydrator, current_data)
+                if isinstance(hydrator, AsyncBaseHydrator) and not cached:
+                    current_data = await self._hydrate_stage_async(i, hydrator, current_data, context, profiler)
+                else:
+                    current_data = await asyncio.to_thread(
+                        self._hydrate_stage, i, hydrator, current_data, context, stage_cache, context_fp, profiler
+                    )
+                await asyncio.to_thread(self._save_checkpoint, store, keys, pos, hydrator, current_data, profiler)
+            
+            await asyncio.to_thread(self._emit_all, current_data, output_dir, profiler)
+            return current_data
+        finally:
+            profiler.stop()
+    
+    def execute_streaming(self, output_dir: Optional[Path] = None) -> List[str]:
+        """Execute the pipeline one day at a time without materializing the trip.
+        
+        Events come from the provider's iter_events(), pass through the
+        hydrators in day batches (see pipeline.streaming) and are written
+        through each emitter's open_stream() writer, so memory is bounded by a
+        day plus the hydrators' neighbour windows. Emitters without a streaming
+        writer buffer the itinerary and emit it at the end. Emitters always run
+        sequentially, and memoization and checkpoints are not available.
         
-        # Emitter Stage: Generate output
+        Args:
+            output_dir: Base directory for emitters to write output
+            
+        Returns:
+            The path written by each emitter
+            
+        Raises:
+            ValueError: If no emitters are configured, memoization or
+                checkpoints are enabled, or a hydrator needs the whole list
+            RuntimeError: If any component fails
+        """
+        if self.memoize or self.checkpoint:
+            raise ValueError("Streaming runs do not support memoization or checkpoints")
         if not self.emitters:
             raise ValueError("No emitters configured - nothing to output")
-        
+        stages = self._stages()
+        streaming = StreamingHydration([(i, hydrator) for i, _, hydrator in stages])
         if output_dir is None:
             output_dir = Path.cwd()
         
+        profiler = StageProfiler(
+            enabled=self.profile,
+            trace_memory=self.profile_memory,
+            cprofile_dir=self.cprofile_dir,
+        )
+        if self.profile:
+            self.trace = profiler.trace
+        profiler.start()
+        try:
+            self._load_context(profiler)
+            context = PipelineContext(venues=self.venues, config=self.config)
+            writers = []
+            for i, emitter in enumerate(self.emitters):
+                try:
+                    writers.append(emitter.open_stream(str(output_dir / f"output_{i}")))
+                except Exception as e:
+                    raise RuntimeError(f"Emitter {i} ({type(emitter).__name__}) failed: {e}") from e
+            
+            self.events_streamed = 0
+            with profiler.stage("stream", f"{type(self.provider).__name__}.iter_events") as record:
+                for day in streaming.run(iter_days(self._iter_source()), context):
+                    for i, writer in enumerate(writers):
+                        try:
+                            writer.write_day(day)
+                        except Exception as e:
+                            raise RuntimeError(f"Emitter {i} ({type(self.emitters[i]).__name__}) failed: {e}") from e
+                    self.events_streamed += len(day)
+                record.items_out = self.events_streamed
+            for i, _, hydrator in stages:
+                wall, cpu = streaming.stage_seconds[i]
+                profiler.add(StageRecord(
+                    kind="hydrator", name=f"{i}.{_stage_name(hydrator)}", wall_seconds=wall, cpu_seconds=cpu
+                ))
+            
+            results = []
+            for i, (emitter, writer) in enumerate(zip(self.emitters, writers)):
+                try:
+                    with profiler.stage("emitter", f"{i}.{type(emitter).__name__}"):
+                        results.append(writer.close())
+                except Exception as e:
+                    raise RuntimeError(f"Emitter {i} ({type(emitter).__name__}) failed: {e}") from e
+            return results
+        finally:
+            profiler.stop()
+    
+    def _iter_source(self) -> Iterator[T]:
+        """Stream events from the provider, wrapping its failures like _load()."""
+        try:
+            yield from self.provider.iter_events()
+        except Exception as e:
+            raise RuntimeError(f"Provider failed to load data: {e}") from e
+    
+    def _load(self, profiler: StageProfiler) -> List[T]:
+        """Source Stage: load events, venues and config from the provider."""
+        provider_name = type(self.provider).__name__
+        try:
+            with profiler.stage("provider", f"{provider_name}.get_events") as record:
+                events = self.provider.get_events()
+                record.items_out = count_items(events)
+        except Exception as e:
+            raise RuntimeError(f"Provider failed to load data: {e}") from e
+        self._load_context(profiler)
+        return events
+    
+    def _load_context(self, profiler: StageProfiler) -> None:
+        """Load venues and config from the provider."""
+        provider_name = type(self.provider).__name__
+        try:
+            with profiler.stage("provider", f"{provider_name}.get_venues") as record:
+                self.venues = self.provider.get_venues()
+                record.items_out = count_items(self.venues)
+            with profiler.stage("provider", f"{provider_name}.get_config"):
+                self.config = self.provider.get_config()
+        except Exception as e:
+            raise RuntimeError(f"Provider failed to load data: {e}") from e
+    
+    def _hydration_context(self, output_dir: Path) -> Tuple[PipelineContext, Optional[StageCache], Optional[str]]:
+        context = PipelineContext(venues=self.venues, config=self.config)
+        stage_cache: Optional[StageCache] = None
+        context_fp = None
+        if self.memoize:
+            stage_cache = self.stage_cache = StageCache(output_dir / CACHE_DIR_NAME)
+            context_fp = fingerprint_context(context)
+        return context, stage_cache, context_fp
+    
+    def _stages(self) -> List[Tuple[int, int, BaseHydrator[T]]]:
+        """Return (first index, last index, hydrator) for each stage to run.
+        
+        With coalesce_patches, runs of consecutive PatchHydrators become one
+        PatchSegment stage that materializes its events once.
+        """
+        if self.coalesce_patches:
+            return coalesce(self.hydrators)
+        return [(i, i, hydrator) for i, hydrator in enumerate(self.hydrators)]
+    
+    def _restore_checkpoint(
+        self,
+        stages: List[Tuple[int, int, BaseHydrator[T]]],
+        events: List[T],
+        context: PipelineContext,
+        output_dir: Path,
+        profiler: StageProfiler,
+    ) -> Tuple[Optional[CheckpointStore], List[str], int, List[T]]:
+        """Open the checkpoint store and, when resuming, restore the latest valid stage.
+        
+        Returns:
+            The store (None when checkpointing is off), the stage keys, the
+            position of the first stage to run, and that stage's input
+        """
+        self.resumed_after = None
+        if not self.checkpoint or not events or not CheckpointStore.supports(events):
+            return None, [], 0, events
+        
+        store = CheckpointStore(output_dir / CHECKPOINT_DIR_NAME)
+        keys = chain_keys(source_key(events, fingerprint_context(context)), [h for _, _, h in stages])
+        if not self.resume:
+            return store, keys, 0, events
+        
+        pos = store.find_resume_point(keys)
+        if pos is None:
+            return store, keys, 0, events
+        first, last, hydrator = stages[pos]
+        name = f"{first}.{_stage_name(hydrator)}"
+        try:
+            with profiler.stage("checkpoint", f"restore {name}") as record:
+                data = store.load(pos, type(events[0]))
+                record.items_out = len(data)
+        except Exception as e:
+            raise RuntimeError(f"Failed to restore checkpoint for hydrator {name}: {e}") from e
+        self.resumed_after = last
+        return store, keys, pos + 1, data
+    
+    def _save_checkpoint(
+        self,
+        store: Optional[CheckpointStore],
+        keys: List[str],
+        pos: int,
+        hydrator: BaseHydrator[T],
+        data: List[T],
+        profiler: StageProfiler,
+    ) -> None:
+        if store is None or not CheckpointStore.supports(data):
+            return
+        name = _stage_name(hydrator)
+        with profiler.stage("checkpoint", f"save {pos}.{name}", items_in=len(data)):
+            store.save(pos, name, keys[pos], data)
+    
+    def _hydrate_stage(
+        self,
+        i: int,
+        hydrator: BaseHydrator[T],
+        data: List[T],
+        context: PipelineContext,
+        stage_cache: Optional[StageCache],
+        context_fp: Optional[str],
+        profiler: StageProfiler,
+    ) -> List[T]:
+        name = _stage_name(hydrator)
+        try:
+            with profiler.stage("hydrator", f"{i}.{name}", items_in=count_items(data)) as record:
+                if stage_cache is not None and StageCache.supports(hydrator, data):
+                    data = stage_cache.run(i, hydrator, data, context, context_fp)
+                else:
+                    data = hydrator.hydrate(data, context)
+                record.items_out = count_items(data)
+                record.stats = hydrator.run_stats()
+        except Exception as e:
+            raise RuntimeError(f"Hydrator {i} ({name}) failed: {e}") from e
+        return data
+    
+    async def _hydrate_stage_async(
+        self,
+        i: int,
+        hydrator: AsyncBaseHydrator[T],
+        data: List[T],
+        context: PipelineContext,
+        profiler: StageProfiler,
+    ) -> List[T]:
+        name = f"{i}.{type(hydrator).__name__}"
+        try:
+            with profiler.stage("hydrator", name, items_in=count_items(data)) as record:
+                data = await hydrator.hydrate_async(data, context)
+                record.items_out = count_items(data)
+                record.stats = hydrator.run_stats()
+        except Exception as e:
+            raise RuntimeError(f"Hydrator {i} ({type(hydrator).__name__}) failed: {e}") from e
+        return data
+    
+    def _emit_all(self, data: List[T], output_dir: Path, profiler: StageProfiler) -> List[str]:
+        """Emitter Stage: generate output with every emitter."""
+        if not self.emitters:
+            raise ValueError("No emitters configured - nothing to output")
+        
+        if self.emitter_mode == "parallel":
+            return self._emit_parallel(data, output_dir, profiler)
+        
         results = []
         for i, emitter in enumerate(self.emitters):
             try:
                 # Determine output path for this emitter
                 emitter_path = str(output_dir / f"output_{i}")
-                actual_path = emitter.emit(current_data, emitter_path)
+                with profiler.stage("emitter", f"{i}.{type(emitter).__name__}", items_in=count_items(data)):
+                    actual_path = emitter.emit(data, emitter_path)
                 results.append(actual_path)
             except Exception as e:
                 raise RuntimeError(f"Emitter {i} ({type(emitter).__name__}) failed: {e}") from e
+        return results
+    
+    def _emit_parallel(self, data: List[T], output_dir: Path, profiler: StageProfiler) -> List[str]:
+        """Run all emitters concurrently, collecting failures per emitter.
         
-        return current_data
+        Emitters declaring execution="process" run in a process pool when they
+        can be pickled (CPU-bound ReportLab builds); the rest share a thread pool.
+        Timings are measured inside each worker; peak memory is not tracked.
+        
+        Raises:
+            RuntimeError: Listing every emitter that failed
+        """
+        process_jobs: List[Tuple[int, BaseEmitter[T]]] = []
+        thread_jobs: List[Tuple[int, BaseEmitter[T]]] = []
+        for i, emitter in enumerate(self.emitters):
+            if getattr(emitter, "execution", "thread") == "process" and _is_picklable(emitter):
+                process_jobs.append((i, emitter))
+            else:
+                thread_jobs.append((i, emitter))
+        
+        futures: Dict[int, Future] = {}
+        process_pool = ProcessPoolExecutor(max_workers=len(process_jobs)) if process_jobs else None
+        thread_pool = ThreadPoolExecutor(max_workers=len(thread_jobs)) if thread_jobs else None
+        try:
+            # Submit process work first so workers are forked before threads start
+            for i, emitter in process_jobs:
+                futures[i] = process_pool.submit(_emit, emitter, data, str(output_dir / f"output_{i}"))
+            for i, emitter in thread_jobs:
+                futures[i] = thread_pool.submit(_emit, emitter, data, str(output_dir / f"output_{i}"))
+            
+            results: List[str] = []
+            failures: List[Tuple[int, BaseEmitter[T], Exception]] = []
+            for i, emitter in enumerate(self.emitters):
+                record = StageRecord(kind="emitter", name=f"{i}.{type(emitter).__name__}", items_in=len(data))
+                try:
+                    path, record.wall_seconds, record.cpu_seconds = futures[i].result()
+                    results.append(path)
+                except Exception as e:
+                    record.error = f"{type(e).__name__}: {e}"
+                    failures.append((i, emitter, e))
+                profiler.add(record)
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
+            if thread_pool is not None:
+                thread_pool.shutdown()
+        
+        if failures:
+            message = "; ".join(
+                f"Emitter {i} ({type(emitter).__name__}) failed: {e}" for i, emitter, e in failures
+            )
+            raise RuntimeError(message) from failures[0][2]
+        return results
     
     def validate(self) -> List[str]:
         """Validate the pipeline configuration.
@@ -0,0 +1,127 @@
+"""Concurrent execution of independent hydrators.
+
+AIDEV-NOTE: Enrichment stages such as MapsHydrator, WeatherHydrator,
+NarrativeHydrator and ImageHydrator each write a disjoint set of fields and
+spend most of their time waiting on the network. ParallelHydrators runs such a
+group on a thread pool against the same input list, then merges each
+hydrator's per-event field changes back onto the input in declaration order.
+
+AIDEV-DECISION: Two hydrators in a group writing different values to the same
+field is a configuration error and raises ValueError instead of letting one
+silently win; the merge result must not depend on thread scheduling. The
+merge pairs outputs with inputs by position, so members declaring
+``reorders_items`` (sorters) are rejected up front, and an output that puts an
+input object at another position raises ValueError.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, TypeVar
+
+from itingen.core.base import BaseHydrator, PipelineContext, effective_window
+
+T = TypeVar("T")
+
+
+def changed_fields(before: Any, after: Any) -> Dict[str, Any]:
+    """Return the fields (declared and extra) whose value differs between two models."""
+    if after is before:
+        return {}
+    base = dict(before)
+    return {
+        name: value
+        for name, value in after
+        if name not in base or base[name] != value
+    }
+
+
+class ParallelHydrators(BaseHydrator[T]):
+    """Runs a group of independent hydrators concurrently with a field-level merge.
+
+    Every hydrator in the group receives the same input list and must return a
+    list of the same length and order (no filtering or sorting). The group can
+    be placed anywhere in the pipeline like a single hydrator.
+    """
+
+    def __init__(self, hydrators: List[BaseHydrator[T]], max_workers: Optional[int] = None):
+        """Initialize the group.
+
+        Args:
+            hydrators: Hydrators that read only fields none of the others write
+            max_workers: Thread pool size (defaults to one thread per hydrator)
+        """
+        if not hydrators:
+            raise ValueError("ParallelHydrators requires at least one hydrator")
+        for hydrator in hydrators:
+            if hydrator.reorders_items:
+                raise ValueError(
+                    f"{type(hydrator).__name__} reorders items and cannot run in a parallel group"
+                )
+        self.hydrators = list(hydrators)
+        self.max_workers = max_workers or len(self.hydrators)
+        self.memoizable = all(getattr(h, "memoizable", True) for h in self.hydrators)
+        self.memo_scope = (
+            "item" if all(getattr(h, "memo_scope", "list") == "item" for h in self.hydrators) else "list"
+        )
+        windows = [effective_window(h) for h in self.hydrators]
+        self.neighbour_window = None if None in windows else max(windows)
+
+    def run_stats(self) -> Optional[Dict[str, Any]]:
+        """Merged run statistics of the group's members."""
+        stats: Dict[str, Any] = {}
+        for hydrator in self.hydrators:
+            stats.update(hydrator.run_stats() or {})
+        return stats or None
+
+    def cache_config(self) -> Dict[str, Any]:
+        """Fingerprint the group as the ordered configs of its members."""
+        return {
+            "hydrator": f"{type(self).__module__}.{type(self).__qualname__}",
+            "members": [h.cache_config() for h in self.hydrators],
+        }
+
+    def hydrate(self, items: List[T], context: Optional[PipelineContext] = None) -> List[T]:
+        """Run all member hydrators concurrently and merge their updates."""
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(h.hydrate, items, context) for h in self.hydrators]
+            outputs = []
+            # Collect in declaration order so the reported failure is deterministic
+            for hydrator, future in zip(self.hydrators, futures):
+                try:
+                    outputs.append(future.result())
+                except Exception as e:
+                    raise RuntimeError(f"{type(hydrator).__name__} failed: {e}") from e
+
+        positions = {id(item): i for i, item in enumerate(items)}
+        for hydrator, output in zip(self.hydrators, outputs):
+            if len(output) != len(items):
+                raise ValueError(
+                    f"{type(hydrator).__name__} returned {len(output)} items for {len(items)} inputs; "
+                    "hydrators run in parallel must not add, drop or reorder items"
+                )
+            for i, (item, result) in enumerate(zip(items, output)):
+                if result is not item and id(result) in positions:
+                    raise ValueError(
+                        f"{type(hydrator).__name__} returned input item {positions[id(result)]} at position {i}; "
+                        "hydrators run in parallel must not add, drop or reorder items"
+                    )
+
+        merged_items = []
+        for i, item in enumerate(items):
+            updates: Dict[str, Any] = {}
+            owners: Dict[str, str] = {}
+            for hydrator, output in zip(self.hydrators, outputs):
+                name = type(hydrator).__name__
+                for field, value in changed_fields(item, output[i]).items():
+                    if field in updates and updates[field] != value:
+                        raise ValueError(
+                            f"Field '{field}' written with different values by "
+                            f"{owners[field]} and {name}"
+                        )
+                    updates[field] = value
+                    owners.setdefault(field, name)
+            merged_items.append(item.model_copy(update=updates) if updates else item)
+
+        return merged_items
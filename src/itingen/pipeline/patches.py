@@ -0,0 +1,141 @@
+"""Coalesced execution of patch-producing hydrators.
+
+AIDEV-NOTE: A run of consecutive PatchHydrators (wrap-up timing, emotional
+annotations, transitions, maps) used to cost one pydantic model_copy per
+event per stage. PatchSegment runs such a run as one pipeline stage: each
+member computes sparse patches against overlay views of the input, the
+patches are merged per event, and every changed event is copied exactly once
+at the end of the segment. Non-patch hydrators, async hydrators and the end
+of the chain are the materialization points.
+
+AIDEV-DECISION: PatchedView is a read-only attribute overlay rather than a
+model subclass or dict: constructing one is two slot writes, and the existing
+hydrators and transition handlers only read attributes. Anything needing a
+real model (model_dump, isinstance checks) belongs in a regular hydrator.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
+
+from itingen.core.base import AsyncBaseHydrator, BaseHydrator, PatchHydrator, PipelineContext, effective_window
+
+T = TypeVar("T")
+
+
+class PatchedView:
+    """Read-only view of an item with a patch of field updates layered on top."""
+
+    __slots__ = ("_base", "_patch")
+
+    def __init__(self, base: Any, patch: Dict[str, Any]):
+        object.__setattr__(self, "_base", base)
+        object.__setattr__(self, "_patch", patch)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._patch[name]
+        except KeyError:
+            return getattr(self._base, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("PatchedView is read-only; return a patch instead")
+
+    def __repr__(self) -> str:
+        return f"PatchedView({self._base!r}, {self._patch!r})"
+
+
+def overlay(item: Any, patch: Optional[Dict[str, Any]]) -> Any:
+    """Return item as seen after patch (the item itself when patch is empty)."""
+    if not patch:
+        return item
+    if isinstance(item, PatchedView):
+        return PatchedView(item._base, {**item._patch, **patch})
+    return PatchedView(item, patch)
+
+
+class PatchSegment(BaseHydrator[T]):
+    """Runs consecutive PatchHydrators with a single materialization at the end."""
+
+    def __init__(self, hydrators: List[PatchHydrator[T]]):
+        if not hydrators:
+            raise ValueError("PatchSegment requires at least one hydrator")
+        self.hydrators = list(hydrators)
+        self.memoizable = all(getattr(h, "memoizable", True) for h in self.hydrators)
+        self.memo_scope = (
+            "item" if all(getattr(h, "memo_scope", "list") == "item" for h in self.hydrators) else "list"
+        )
+        windows = [effective_window(h) for h in self.hydrators]
+        # Each member may look at neighbours already patched by earlier members
+        self.neighbour_window = None if None in windows else sum(windows)
+
+    @property
+    def name(self) -> str:
+        return "+".join(type(h).__name__ for h in self.hydrators)
+
+    def run_stats(self) -> Optional[Dict[str, Any]]:
+        """Merged run statistics of the segment's members."""
+        stats: Dict[str, Any] = {}
+        for hydrator in self.hydrators:
+            stats.update(hydrator.run_stats() or {})
+        return stats or None
+
+    def cache_config(self) -> Dict[str, Any]:
+        """Fingerprint the segment as the ordered configs of its members."""
+        return {
+            "hydrator": f"{type(self).__module__}.{type(self).__qualname__}",
+            "members": [h.cache_config() for h in self.hydrators],
+        }
+
+    def hydrate(self, items: List[T], context: Optional[PipelineContext] = None) -> List[T]:
+        """Run every member on overlay views, then copy each changed item once."""
+        if not items:
+            return []
+
+        merged: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        views: List[Any] = list(items)
+        for hydrator in self.hydrators:
+            try:
+                patches = hydrator.compute_patches(views, context)
+            except Exception as e:
+                raise RuntimeError(f"{type(hydrator).__name__} failed: {e}") from e
+            if len(patches) != len(items):
+                raise ValueError(
+                    f"{type(hydrator).__name__} returned {len(patches)} patches for {len(items)} items"
+                )
+            for i, patch in enumerate(patches):
+                if not patch:
+                    continue
+                if merged[i] is None:
+                    merged[i] = dict(patch)
+                    views[i] = PatchedView(items[i], merged[i])
+                else:
+                    # The view shares this dict, so it sees the update without a new view
+                    merged[i].update(patch)
+
+        return [item.model_copy(update=patch) if patch else item for item, patch in zip(items, merged)]
+
+
+def coalesce(hydrators: List[BaseHydrator[T]]) -> List[Tuple[int, int, BaseHydrator[T]]]:
+    """Group runs of two or more consecutive sync PatchHydrators into PatchSegments.
+
+    Returns:
+        (first index, last index, stage) for every stage, indices referring to
+        the original hydrator list
+    """
+    stages: List[Tuple[int, int, BaseHydrator[T]]] = []
+    i = 0
+    while i < len(hydrators):
+        j = i
+        while j < len(hydrators) and _coalescible(hydrators[j]):
+            j += 1
+        if j - i >= 2:
+            stages.append((i, j - 1, PatchSegment(hydrators[i:j])))
+            i = j
+        else:
+            stages.append((i, i, hydrators[i]))
+            i += 1
+    return stages
+
+
+def _coalescible(hydrator: BaseHydrator) -> bool:
+    # Async patch hydrators are awaited on their own so their calls stay concurrent
+    return isinstance(hydrator, PatchHydrator) and not isinstance(hydrator, AsyncBaseHydrator)
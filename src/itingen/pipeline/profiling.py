@@ -0,0 +1,202 @@
+"""Per-stage timing and profiling instrumentation for the SPE pipeline.
+
+AIDEV-NOTE: The orchestrator wraps every provider, hydrator and emitter call
+in StageProfiler.stage(). When profiling is disabled the context manager is a
+cheap no-op, so the orchestrator code path is the same either way.
+
+Recorded per stage: wall time, CPU time of the calling thread (stages running
+concurrently on other threads are not counted), item counts and (optionally)
+the peak memory allocated during the stage via tracemalloc. The trace's own
+wall_seconds is the elapsed time of the whole run; stages can overlap
+(parallel emitters, fan-out branches), so it may be less than
+summed_stage_seconds. Hydrator stages also carry whatever the hydrator
+reports through BaseHydrator.run_stats() (e.g. route cache canonicalization
+hit rates). Each stage can also be run under cProfile with its stats dumped
+to a directory for snakeviz/pstats.
+"""
+
+import cProfile
+import json
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class StageRecord:
+    """Measurements for one provider, hydrator or emitter call."""
+    kind: str
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    items_in: Optional[int] = None
+    items_out: Optional[int] = None
+    peak_memory_bytes: Optional[int] = None
+    cprofile_path: Optional[str] = None
+    error: Optional[str] = None
+    # Hydrator-reported statistics (BaseHydrator.run_stats), e.g. cache hit rates
+    stats: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class PipelineTrace:
+    """Structured trace of a pipeline run."""
+    started_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    stages: List[StageRecord] = field(default_factory=list)
+    wall_seconds: Optional[float] = None
+
+    @property
+    def total_wall_seconds(self) -> Optional[float]:
+        """Elapsed wall time of the run (None if it was not measured)."""
+        return self.wall_seconds
+
+    @property
+    def summed_stage_seconds(self) -> float:
+        """Sum of stage wall times; overlapping stages are counted twice."""
+        return sum(stage.wall_seconds for stage in self.stages)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "total_wall_seconds": self.total_wall_seconds,
+            "summed_stage_seconds": self.summed_stage_seconds,
+            "stages": [asdict(stage) for stage in self.stages],
+        }
+
+    def write_json(self, path: str | Path) -> Path:
+        """Write the trace as JSON, creating parent directories as needed."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def format_table(self) -> str:
+        """Render a compact human-readable summary, one line per stage."""
+        lines = [f"{'stage':<48} {'wall s':>9} {'cpu s':>9} {'items':>13} {'peak MiB':>9}"]
+        for stage in self.stages:
+            items = ""
+            if stage.items_in is not None or stage.items_out is not None:
+                items = f"{_fmt_count(stage.items_in)}->{_fmt_count(stage.items_out)}"
+            peak = "" if stage.peak_memory_bytes is None else f"{stage.peak_memory_bytes / 2**20:.1f}"
+            label = f"{stage.kind}:{stage.name}"
+            lines.append(
+                f"{label:<48} {stage.wall_seconds:>9.3f} {stage.cpu_seconds:>9.3f} {items:>13} {peak:>9}"
+            )
+            for key, value in (stage.stats or {}).items():
+                lines.append(f"  {key}: {_fmt_stats(value)}")
+        lines.append(f"{'stages (summed)':<48} {self.summed_stage_seconds:>9.3f}")
+        if self.total_wall_seconds is not None:
+            lines.append(f"{'total (elapsed)':<48} {self.total_wall_seconds:>9.3f}")
+        return "\n".join(lines)
+
+
+def _fmt_count(value: Optional[int]) -> str:
+    return "?" if value is None else str(value)
+
+
+def _fmt_stats(value: Any) -> str:
+    if isinstance(value, dict):
+        return ", ".join(f"{k}={_fmt_stats(v)}" for k, v in value.items())
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
+
+
+def count_items(value: Any) -> Optional[int]:
+    """Return len(value) for sized results, None otherwise."""
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+class StageProfiler:
+    """Collects StageRecords into a PipelineTrace.
+
+    Args:
+        enabled: When False, stage() records nothing.
+        trace_memory: Track per-stage peak allocations with tracemalloc
+            (noticeably slows allocation-heavy stages).
+        cprofile_dir: If set, run each stage under cProfile and dump its stats here.
+    """
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = True, cprofile_dir: Optional[str | Path] = None):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.cprofile_dir = Path(cprofile_dir) if cprofile_dir else None
+        self.trace = PipelineTrace()
+        self._started_tracemalloc = False
+        self._run_start: Optional[float] = None
+
+    def start(self) -> None:
+        """Begin a run (starts tracemalloc if needed)."""
+        self._run_start = time.perf_counter()
+        if self.enabled and self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """End a run (stops tracemalloc if this profiler started it)."""
+        if self.enabled and self._run_start is not None:
+            self.trace.wall_seconds = time.perf_counter() - self._run_start
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, kind: str, name: str, items_in: Optional[int] = None) -> Iterator[StageRecord]:
+        """Measure the enclosed block as one stage.
+
+        The caller may set ``items_out`` on the yielded record. Exceptions are
+        recorded on the record and re-raised.
+        """
+        record = StageRecord(kind=kind, name=name, items_in=items_in)
+        if not self.enabled:
+            yield record
+            return
+
+        profiler = None
+        if self.cprofile_dir is not None:
+            profiler = cProfile.Profile()
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield record
+        except Exception as e:
+            record.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            record.wall_seconds = time.perf_counter() - wall_start
+            record.cpu_seconds = time.thread_time() - cpu_start
+            if tracing:
+                record.peak_memory_bytes = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+            if profiler is not None:
+                record.cprofile_path = str(self._dump(profiler, record))
+            self.trace.stages.append(record)
+
+    def add(self, record: StageRecord) -> None:
+        """Append a record measured elsewhere (e.g. in a worker thread or process)."""
+        if self.enabled:
+            self.trace.stages.append(record)
+
+    def _dump(self, profiler: cProfile.Profile, record: StageRecord) -> Path:
+        self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{record.kind}_{record.name}")
+        path = self.cprofile_dir / f"{len(self.trace.stages):02d}_{slug}.prof"
+        profiler.dump_stats(str(path))
+        return path
@@ -1,29 +1,40 @@
 """Chronological sorting logic for the pipeline.
 
-AIDEV-NOTE: This hydrator ensures events are ordered by their UTC time.
-Events without time information are moved to the end of the list.
+AIDEV-NOTE: This hydrator ensures events are ordered by their absolute time
+(time_epoch, see utils.times): time_utc where set, otherwise time_local or
+no_later_than in the event's or the trip's timezone. Events without time
+information are moved to the end of the list.
+In streaming runs the sorter is applied per day: day files already arrive in
+date order, so only the order within each day needs fixing (events without a
+time then move to the end of their day rather than of the trip).
 """
 
 from typing import List, TypeVar
 from itingen.core.base import BaseHydrator
 from itingen.core.domain.events import Event
+from itingen.utils.times import epochs_for
 
 T = TypeVar('T', bound=Event)
 
 class ChronologicalSorter(BaseHydrator[T]):
-    """Sorts events chronologically by time_utc."""
+    """Sorts events chronologically by their absolute time."""
+
+    memoizable = False
+    day_local = True
+    reorders_items = True
 
     def hydrate(self, items: List[T], context=None) -> List[T]:
-        """Sort the given items by time_utc.
+        """Sort the given items by time_epoch.
         
-        Events with time_utc=None are placed after events with timestamps.
+        Events without a resolvable time are placed after events with timestamps.
         Original relative order is preserved for events with identical or missing timestamps.
         """
         if not items:
             return []
 
+        default_timezone = context.config.get("timezone") if context is not None else None
+        # Integer epochs; events not normalized upstream are converted in one bulk pass
+        keys = epochs_for(items, default_timezone)
         # Use a stable sort to preserve relative order for identical/missing times
-        return sorted(
-            items,
-            key=lambda x: (x.time_utc is None, x.time_utc)
-        )
+        order = sorted(range(len(items)), key=lambda i: (keys[i] is None, keys[i] or 0))
+        return [items[i] for i in order]
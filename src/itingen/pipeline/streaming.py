@@ -0,0 +1,178 @@
+"""Day-by-day streaming execution of the hydrator chain.
+
+AIDEV-NOTE: A streaming run never materializes the whole trip. The provider's
+iter_events() is grouped into same-day batches (iter_days), and each stage is
+a generator from day batches to day batches:
+- day-local stages (BaseHydrator.day_local, or item-scoped hydrators) hydrate
+  one day at a time;
+- runs of windowed stages (BaseHydrator.neighbour_window) hold back just
+  enough following events to fill the run's halo, then hydrate each day
+  together with ``halo`` events on either side and keep only the day's slice.
+This is the same window argument IncrementalHydration relies on, so a
+streamed day is identical to the corresponding slice of a whole-list run,
+while memory stays bounded by a day plus the halo per stage.
+
+AIDEV-DECISION: Day files are not guaranteed to hold only their own day's
+events (an event can be misfiled into the next day's file). iter_days holds
+``lookahead`` finished days back and merges a late item into its day while
+that day is still held; an item for a day that has already been yielded
+raises ValueError naming the date instead of emitting the day twice.
+
+Hydrators that need the whole list (and are not declared
+day_local) are rejected up front with ValueError rather than silently
+buffering the trip, which would defeat the point of streaming.
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from itingen.core.base import BaseHydrator, PipelineContext, effective_window
+from itingen.pipeline.patches import PatchSegment
+from itingen.utils.grouping import event_date
+
+Days = Iterator[List[Any]]
+
+
+def iter_days(
+    items: Iterable[Any], key: Callable[[Any], str] = event_date, lookahead: int = 1
+) -> Days:
+    """Group a stream of items into lists of items with the same key, in key order.
+
+    Up to ``lookahead`` finished days are held back, so an item that arrives
+    after later days have started is merged into its own day.
+
+    Raises:
+        ValueError: If an item's day was already yielded, i.e. it arrived more
+            than ``lookahead`` days late
+    """
+    pending: Dict[str, List[Any]] = {}
+    last_yielded: Optional[str] = None
+    for item in items:
+        item_key = key(item)
+        if item_key in pending:
+            pending[item_key].append(item)
+            continue
+        if last_yielded is not None and item_key <= last_yielded:
+            raise ValueError(
+                f"Item dated {item_key} arrived after days up to {last_yielded} were streamed; "
+                "move it to its own day's file or run without streaming"
+            )
+        pending[item_key] = [item]
+        if len(pending) > lookahead + 1:
+            last_yielded = min(pending)
+            yield pending.pop(last_yielded)
+    for day_key in sorted(pending):
+        yield pending[day_key]
+
+
+def streamable(hydrator: BaseHydrator) -> bool:
+    """Return True if a hydrator can run on day batches."""
+    return effective_window(hydrator) is not None or getattr(hydrator, "day_local", False)
+
+
+class StreamingHydration:
+    """Runs a hydrator chain over a stream of day batches.
+
+    Args:
+        stages: (pipeline index, hydrator) pairs in order; the index is only
+            used to name failing stages like the batch orchestrator does
+
+    Raises:
+        ValueError: If a hydrator needs the whole list to produce its output
+    """
+
+    def __init__(self, stages: List[Tuple[int, BaseHydrator]]):
+        for i, hydrator in stages:
+            if not streamable(hydrator):
+                raise ValueError(
+                    f"Hydrator {i} ({_name(hydrator)}) needs the whole itinerary and cannot run in "
+                    "streaming mode (declare day_local or neighbour_window if it is local)"
+                )
+        self.stages = list(stages)
+        # Accumulated per-stage (wall, cpu) seconds across all days
+        self.stage_seconds: Dict[int, List[float]] = {i: [0.0, 0.0] for i, _ in self.stages}
+
+    def run(self, days: Iterable[List[Any]], context: Optional[PipelineContext] = None) -> Days:
+        """Yield each hydrated, non-empty day in order."""
+        stream: Days = (day for day in days if day)
+        for group in self._groups():
+            halo = sum(effective_window(h) or 0 for _, h in group)
+            if halo:
+                stream = self._windowed(stream, group, halo, context)
+            else:
+                stream = self._day_local(stream, group, context)
+        return stream
+
+    def _groups(self) -> List[List[Tuple[int, BaseHydrator]]]:
+        """Split the chain into runs of windowed and of day-local stages."""
+        groups: List[List[Tuple[int, BaseHydrator]]] = []
+        previous: Optional[bool] = None
+        for i, hydrator in self.stages:
+            windowed = bool(effective_window(hydrator))
+            if not groups or windowed != previous:
+                groups.append([])
+            groups[-1].append((i, hydrator))
+            previous = windowed
+        return groups
+
+    def _hydrate(self, group: List[Tuple[int, BaseHydrator]], items: List[Any], context, keep_length: bool) -> List[Any]:
+        for i, hydrator in group:
+            wall_start = time.perf_counter()
+            cpu_start = time.thread_time()
+            try:
+                result = hydrator.hydrate(items, context)
+            except Exception as e:
+                raise RuntimeError(f"Hydrator {i} ({_name(hydrator)}) failed: {e}") from e
+            finally:
+                seconds = self.stage_seconds[i]
+                seconds[0] += time.perf_counter() - wall_start
+                seconds[1] += time.thread_time() - cpu_start
+            if keep_length and len(result) != len(items):
+                raise ValueError(
+                    f"{_name(hydrator)} declares a neighbour window but changed the number of items"
+                )
+            items = result
+        return items
+
+    def _day_local(self, days: Days, group, context) -> Days:
+        for day in days:
+            day = self._hydrate(group, day, context, keep_length=False)
+            if day:
+                yield day
+
+    def _windowed(self, days: Days, group, halo: int, context) -> Days:
+        pending: Deque[List[Any]] = deque()
+        ahead = 0  # items queued after the first pending day
+        left: List[Any] = []  # up to ``halo`` input items preceding the first pending day
+
+        def flush_first() -> List[Any]:
+            nonlocal ahead, left
+            day = pending.popleft()
+            if pending:
+                ahead -= len(pending[0])
+            right: List[Any] = []
+            for following in pending:
+                right.extend(following[:halo - len(right)])
+                if len(right) >= halo:
+                    break
+            start = len(left)
+            outputs = self._hydrate(group, left + day + right, context, keep_length=True)
+            left = (left + day)[-halo:]
+            return outputs[start:start + len(day)]
+
+        for day in days:
+            pending.append(day)
+            if len(pending) > 1:
+                ahead += len(day)
+            # The first pending day is final once ``halo`` following items are known
+            while len(pending) > 1 and ahead >= halo:
+                yield flush_first()
+        while pending:
+            yield flush_first()
+
+
+def _name(hydrator: BaseHydrator) -> str:
+    if isinstance(hydrator, PatchSegment):
+        return hydrator.name
+    return type(hydrator).__name__
@@ -5,15 +5,16 @@ how to move from one event to the next. The registry allows trip-specific
 transition logic to be plugged into the core pipeline.
 """
 
-from typing import List, Optional, TypeVar
-from itingen.core.base import BaseHydrator
+from typing import Any, Dict, List, Optional, TypeVar
+from itingen.core.base import PatchHydrator
 from itingen.core.domain.events import Event
+from itingen.pipeline.patches import overlay
 from itingen.pipeline.transitions import TransitionRegistry
 
 T = TypeVar('T')
 
 
-class TransitionHydrator(BaseHydrator[Event]):
+class TransitionHydrator(PatchHydrator[Event]):
     """Enriches events with descriptive transition logistics from the previous event.
 
     This hydrator uses a TransitionRegistry to find appropriate handlers for
@@ -21,6 +22,8 @@ class TransitionHydrator(BaseHydrator[Event]):
     generic location-based transition description.
     """
 
+    neighbour_window = 1
+
     def __init__(self, registry: TransitionRegistry):
         """Initialize with a TransitionRegistry.
 
@@ -29,12 +32,9 @@ class TransitionHydrator(BaseHydrator[Event]):
         """
         self.registry = registry
 
-    def hydrate(self, items: List[Event], context=None) -> List[Event]:
-        """Add transition descriptions to events based on their predecessor."""
-        if not items:
-            return []
-
-        new_items = []
+    def compute_patches(self, items: List[Event], context=None) -> List[Optional[Dict[str, Any]]]:
+        """Compute transition descriptions for events based on their predecessor."""
+        patches: List[Optional[Dict[str, Any]]] = []
         prev_ev: Optional[Event] = None
         for ev in items:
             updates = {}
@@ -45,15 +45,10 @@ class TransitionHydrator(BaseHydrator[Event]):
                     if transition:
                         updates["transition_from_prev"] = transition
             
-            if updates:
-                new_ev = ev.model_copy(update=updates)
-            else:
-                new_ev = ev
-                
-            new_items.append(new_ev)
-            prev_ev = new_ev  # Use the newly created event as the previous event for the next iteration
-
-        return new_items
+            patches.append(updates)
+            prev_ev = overlay(ev, updates)  # The previous event as updated by this stage
+
+        return patches
 
     def _describe_transition(self, prev_ev: Event, ev: Event) -> Optional[str]:
         """Generate transition description using the registry.
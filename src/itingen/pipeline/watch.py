@@ -0,0 +1,188 @@
+"""Watch mode: keep a trip pipeline warm and regenerate on file changes.
+
+AIDEV-NOTE: WatchSession polls the trip's event day files, venue files and
+config.yaml by (mtime_ns, size). Only changed day files are re-parsed; the
+rest of the event list is reused object-for-object, which lets
+IncrementalHydration skip every day whose neighbourhood is unchanged. Venue
+or config changes rebuild the hydration context and therefore recompute all
+days.
+
+AIDEV-DECISION: Polling instead of inotify/watchdog keeps the feature free of
+new dependencies and behaves the same on every platform; a trip is a few
+dozen files, so a stat() sweep every half second is negligible. Emitters
+still write whole documents (the Markdown and PDF outputs are single files),
+so only hydration is day-scoped; the affected days are reported.
+"""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from itingen.core.base import BaseEmitter, BaseHydrator, PipelineContext
+from itingen.core.domain.events import Event
+from itingen.pipeline.incremental import IncrementalHydration
+from itingen.providers.file_provider import LocalFileProvider
+from itingen.utils.grouping import event_date
+
+FileStamp = Tuple[int, int]
+
+
+def file_stamp(path: Path) -> Optional[FileStamp]:
+    """Return (mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass
+class WatchUpdate:
+    """Outcome of one regeneration."""
+    changed_files: List[str] = field(default_factory=list)
+    affected_dates: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+    days_reused: int = 0
+    days_recomputed: int = 0
+    seconds: float = 0.0
+
+
+class WatchSession:
+    """Incrementally regenerates a trip's output as its source files change.
+
+    Args:
+        provider: File provider for the trip
+        hydrators: Hydrator chain, in pipeline order
+        emitters: Emitters to re-run after each change
+        output_dir: Directory for emitter output
+    """
+
+    def __init__(
+        self,
+        provider: LocalFileProvider,
+        hydrators: List[BaseHydrator[Event]],
+        emitters: List[BaseEmitter[Event]],
+        output_dir: Path,
+    ):
+        if not emitters:
+            raise ValueError("No emitters configured - nothing to output")
+        self.provider = provider
+        self.emitters = list(emitters)
+        self.output_dir = Path(output_dir)
+        self.hydration = IncrementalHydration(hydrators)
+        self.context: Optional[PipelineContext] = None
+        self._day_files: Dict[str, Tuple[Optional[FileStamp], List[Event]]] = {}
+        self._context_stamp: Optional[Tuple] = None
+        self._by_date: Dict[str, List[Event]] = {}
+
+    def _context_files(self) -> Tuple:
+        venue_files = sorted(self.provider.venues_dir.glob("*.json")) if self.provider.venues_dir.exists() else []
+        return tuple((str(p), file_stamp(p)) for p in [self.provider.config_path, *venue_files])
+
+    def refresh(self) -> Optional[WatchUpdate]:
+        """Regenerate if any source file changed since the last call.
+
+        The first call always builds the full output (and reports no changed files).
+
+        Returns:
+            The update, or None when nothing changed
+        """
+        start = time.perf_counter()
+        changed: List[str] = []
+
+        context = self.context
+        context_stamp = self._context_files()
+        if context_stamp != self._context_stamp:
+            context = PipelineContext(
+                venues=self.provider.get_venues(), config=self.provider.get_config()
+            )
+            if self._context_stamp is not None:
+                changed.extend(
+                    path for path, stamp in context_stamp if (path, stamp) not in self._context_stamp
+                )
+                changed.extend(
+                    path for path, _ in self._context_stamp if path not in dict(context_stamp)
+                )
+
+        day_files: Dict[str, Tuple[Optional[FileStamp], List[Event]]] = {}
+        for path in self.provider.list_day_files():
+            stamp = file_stamp(Path(path))
+            previous = self._day_files.get(path)
+            if previous is not None and previous[0] == stamp:
+                day_files[path] = previous
+            else:
+                day_files[path] = (stamp, self.provider.parse_day_file(path))
+                changed.append(path)
+        changed.extend(path for path in self._day_files if path not in day_files)
+        first_run = self._context_stamp is None
+
+        if not changed and not first_run:
+            return None
+
+        events = [event for _, day_events in day_files.values() for event in day_events]
+        try:
+            data = self.hydration.run(events, context)
+        except Exception as e:
+            raise RuntimeError(f"Hydration failed: {e}") from e
+        # Only commit the new file state once it hydrated, so a failed edit is retried
+        self.context, self._context_stamp, self._day_files = context, context_stamp, day_files
+
+        by_date: Dict[str, List[Event]] = {}
+        for event in data:
+            by_date.setdefault(event_date(event), []).append(event)
+        affected = sorted(
+            date for date in set(by_date) | set(self._by_date)
+            if not _same_items(by_date.get(date), self._by_date.get(date))
+        )
+        self._by_date = by_date
+
+        outputs = []
+        for i, emitter in enumerate(self.emitters):
+            try:
+                outputs.append(emitter.emit(data, str(self.output_dir / f"output_{i}")))
+            except Exception as e:
+                raise RuntimeError(f"Emitter {i} ({type(emitter).__name__}) failed: {e}") from e
+
+        return WatchUpdate(
+            changed_files=[] if first_run else changed,
+            affected_dates=affected,
+            outputs=outputs,
+            days_reused=self.hydration.segments_reused,
+            days_recomputed=self.hydration.segments_recomputed,
+            seconds=time.perf_counter() - start,
+        )
+
+    def watch(
+        self,
+        interval: float = 0.5,
+        on_update: Optional[Callable[[WatchUpdate], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        max_polls: Optional[int] = None,
+    ) -> None:
+        """Poll for changes until interrupted (or max_polls sweeps have run).
+
+        Errors from a regeneration are passed to on_error (or raised when it is
+        not set) and the session keeps watching, so a half-saved file does not
+        end the session.
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            try:
+                update = self.refresh()
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(e)
+                update = None
+            if update is not None and on_update is not None:
+                on_update(update)
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(interval)
+
+
+def _same_items(a: Optional[List[Event]], b: Optional[List[Event]]) -> bool:
+    if a is None or b is None:
+        return a is b
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
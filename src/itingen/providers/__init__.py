@@ -2,8 +2,11 @@
 
 from itingen.core.base import BaseProvider
 from .file_provider import LocalFileProvider
+from .memory import InMemoryProvider
+from .sqlite_provider import SqliteProvider
+from .bundle import BundleProvider
 
 # Alias for backward compatibility or simpler import in CLI
 FileProvider = LocalFileProvider
 
-__all__ = ["BaseProvider", "LocalFileProvider", "FileProvider"]
+__all__ = ["BaseProvider", "LocalFileProvider", "FileProvider", "InMemoryProvider", "SqliteProvider", "BundleProvider"]
@@ -0,0 +1,297 @@
+"""Compiled single-file trip bundles, opened with mmap.
+
+AIDEV-NOTE: compile_trip() parses a trip once and writes events, venues and
+config into one binary file. BundleProvider maps the file read-only and
+decodes nothing up front: opening a bundle reads a fixed-size header, and an
+event is decoded only when it is accessed (BundleEvents[i], iter_events()).
+No YAML, JSON or Markdown is parsed at load time, which takes the provider
+stage out of rendering workers' cold-start latency.
+
+Layout (little-endian; offsets are absolute byte positions):
+
+    header       MAGIC, version, string/event/venue counts, section offsets
+    string index n_strings x (u32 offset into string data, u32 byte length)
+    string data  UTF-8 bytes of every distinct string, each stored once
+    event index  n_events x u64 offset of the event's record
+    venue index  n_venues x u64 offset of the venue's record
+    records      tagged values (below); config is one more record
+
+A record is a tagged value: one tag byte, then NONE/FALSE/TRUE (nothing),
+INT (i64), FLOAT (f64), STR (u32 string id), LIST (u32 count + values) or
+DICT (u32 count + (u32 key string id, value) pairs). Events and venues are
+DICT records of their model_dump(mode="json").
+
+AIDEV-DECISION: Events are rebuilt with Event.model_construct(), skipping
+validation: they were validated when the bundle was compiled and every Event
+field is a JSON primitive or list of strings, so the rebuilt model equals the
+parsed one. Venues have nested models and go through model_validate().
+Strings are interned per bundle, so repeated values (people, kinds,
+locations, keys) share one Python object across all decoded events.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from itingen.core.base import BaseProvider
+from itingen.core.domain.events import Event
+from itingen.core.domain.venues import Venue
+from itingen.providers.file_provider import LocalFileProvider
+
+MAGIC = b"ITGNBNDL"
+BUNDLE_VERSION = 1
+BUNDLE_SUFFIX = ".itb"
+
+# magic, version, n_strings, n_events, n_venues,
+# string index, string data, event index, venue index, config offsets
+_HEADER = struct.Struct("<8sIIII5Q")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_STRING_ENTRY = struct.Struct("<II")
+_KEY_TAG = struct.Struct("<IB")
+
+TAG_NONE, TAG_FALSE, TAG_TRUE, TAG_INT, TAG_FLOAT, TAG_STR, TAG_LIST, TAG_DICT = range(8)
+
+
+class _Encoder:
+    """Builds the string table and record area of a bundle."""
+
+    def __init__(self):
+        self.string_ids: Dict[str, int] = {}
+        self.records = bytearray()
+
+    def intern(self, value: str) -> int:
+        string_id = self.string_ids.get(value)
+        if string_id is None:
+            string_id = self.string_ids[value] = len(self.string_ids)
+        return string_id
+
+    def record(self, value: Any) -> int:
+        """Append a record and return its offset within the record area."""
+        offset = len(self.records)
+        self._value(value)
+        return offset
+
+    def _value(self, value: Any) -> None:
+        out = self.records
+        if value is None:
+            out.append(TAG_NONE)
+        elif value is True:
+            out.append(TAG_TRUE)
+        elif value is False:
+            out.append(TAG_FALSE)
+        elif isinstance(value, int):
+            out.append(TAG_INT)
+            out += _I64.pack(value)
+        elif isinstance(value, float):
+            out.append(TAG_FLOAT)
+            out += _F64.pack(value)
+        elif isinstance(value, str):
+            out.append(TAG_STR)
+            out += _U32.pack(self.intern(value))
+        elif isinstance(value, (list, tuple)):
+            out.append(TAG_LIST)
+            out += _U32.pack(len(value))
+            for item in value:
+                self._value(item)
+        elif isinstance(value, dict):
+            out.append(TAG_DICT)
+            out += _U32.pack(len(value))
+            for key, item in value.items():
+                out += _U32.pack(self.intern(str(key)))
+                self._value(item)
+        elif isinstance(value, (date, datetime)):
+            # YAML config may hold dates; bundles store them as ISO strings
+            self._value(value.isoformat())
+        else:
+            raise TypeError(f"Cannot store {type(value).__name__} value in a trip bundle")
+
+
+def compile_trip(trip_dir: str | Path, bundle_path: str | Path) -> Dict[str, int]:
+    """Parse a trip directory and write it as a bundle at bundle_path.
+
+    Returns:
+        Counts of compiled events, venues and interned strings, plus the size in bytes
+    """
+    provider = LocalFileProvider(trip_dir)
+    events = provider.get_events()
+    venues = provider.get_venues()
+    config = provider.get_config()
+
+    encoder = _Encoder()
+    event_offsets = [encoder.record(event.model_dump(mode="json")) for event in events]
+    venue_offsets = [encoder.record(venue.model_dump(mode="json")) for venue in venues.values()]
+    config_offset = encoder.record(config)
+
+    strings = [s.encode("utf-8") for s in encoder.string_ids]
+    string_index = bytearray()
+    position = 0
+    for data in strings:
+        string_index += _STRING_ENTRY.pack(position, len(data))
+        position += len(data)
+
+    string_index_off = _HEADER.size
+    string_data_off = string_index_off + len(string_index)
+    event_index_off = string_data_off + position
+    venue_index_off = event_index_off + _U64.size * len(event_offsets)
+    records_off = venue_index_off + _U64.size * len(venue_offsets)
+
+    header = _HEADER.pack(
+        MAGIC, BUNDLE_VERSION, len(strings), len(event_offsets), len(venue_offsets),
+        string_index_off, string_data_off, event_index_off, venue_index_off, records_off + config_offset,
+    )
+    bundle_path = Path(bundle_path)
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = bundle_path.with_name(bundle_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(string_index)
+        for data in strings:
+            f.write(data)
+        f.write(b"".join(_U64.pack(records_off + offset) for offset in event_offsets))
+        f.write(b"".join(_U64.pack(records_off + offset) for offset in venue_offsets))
+        f.write(encoder.records)
+    # Replacing (not rewriting) keeps workers that still map the old file valid
+    os.replace(tmp_path, bundle_path)
+    return {
+        "events": len(event_offsets),
+        "venues": len(venue_offsets),
+        "strings": len(strings),
+        "bytes": bundle_path.stat().st_size,
+    }
+
+
+class _Bundle:
+    """A mapped bundle file with lazy string and record decoding."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.buf) < _HEADER.size:
+            raise ValueError(f"Not a trip bundle: {path}")
+        (
+            magic, version, self.n_strings, self.n_events, self.n_venues,
+            self.string_index_off, self.string_data_off, self.event_index_off,
+            self.venue_index_off, self.config_off,
+        ) = _HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a trip bundle: {path}")
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"Trip bundle {path} has version {version}, expected {BUNDLE_VERSION}; recompile it")
+        self._strings: List[Optional[str]] = [None] * self.n_strings
+
+    def string(self, string_id: int) -> str:
+        value = self._strings[string_id]
+        if value is None:
+            offset, length = _STRING_ENTRY.unpack_from(self.buf, self.string_index_off + string_id * _STRING_ENTRY.size)
+            start = self.string_data_off + offset
+            value = self._strings[string_id] = self.buf[start:start + length].decode("utf-8")
+        return value
+
+    def event_offset(self, index: int) -> int:
+        return _U64.unpack_from(self.buf, self.event_index_off + index * _U64.size)[0]
+
+    def venue_offset(self, index: int) -> int:
+        return _U64.unpack_from(self.buf, self.venue_index_off + index * _U64.size)[0]
+
+    def decode(self, offset: int) -> Any:
+        return self._value(offset)[0]
+
+    def _value(self, pos: int) -> Tuple[Any, int]:
+        buf = self.buf
+        tag = buf[pos]
+        pos += 1
+        if tag == TAG_STR:
+            return self.string(_U32.unpack_from(buf, pos)[0]), pos + 4
+        if tag == TAG_DICT:
+            (count,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            result: Dict[str, Any] = {}
+            strings = self._strings
+            for _ in range(count):
+                key_id, value_tag = _KEY_TAG.unpack_from(buf, pos)
+                key = strings[key_id] or self.string(key_id)
+                # Inline the common scalar cases; recurse for everything else
+                if value_tag == TAG_NONE:
+                    result[key] = None
+                    pos += 5
+                elif value_tag == TAG_STR:
+                    value_id = _U32.unpack_from(buf, pos + 5)[0]
+                    result[key] = strings[value_id] or self.string(value_id)
+                    pos += 9
+                else:
+                    result[key], pos = self._value(pos + 4)
+            return result, pos
+        if tag == TAG_NONE:
+            return None, pos
+        if tag == TAG_LIST:
+            (count,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            items = []
+            for _ in range(count):
+                item, pos = self._value(pos)
+                items.append(item)
+            return items, pos
+        if tag == TAG_TRUE:
+            return True, pos
+        if tag == TAG_FALSE:
+            return False, pos
+        if tag == TAG_INT:
+            return _I64.unpack_from(buf, pos)[0], pos + 8
+        if tag == TAG_FLOAT:
+            return _F64.unpack_from(buf, pos)[0], pos + 8
+        raise ValueError(f"Corrupt trip bundle: unknown tag {tag} at offset {pos - 1}")
+
+
+class BundleEvents(Sequence):
+    """Read-only sequence of a bundle's events, each decoded on first access."""
+
+    def __init__(self, bundle: _Bundle):
+        self._bundle = bundle
+
+    def __len__(self) -> int:
+        return self._bundle.n_events
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("bundle event index out of range")
+        return Event.model_construct(**self._bundle.decode(self._bundle.event_offset(index)))
+
+
+class BundleProvider(BaseProvider[Event]):
+    """Provider that serves a compiled trip bundle from a memory map."""
+
+    def __init__(self, bundle_path: str | Path):
+        self.bundle_path = Path(bundle_path)
+        if not self.bundle_path.exists():
+            raise ValueError(f"Trip bundle not found: {self.bundle_path}")
+        self._bundle = _Bundle(self.bundle_path)
+        self.events = BundleEvents(self._bundle)
+
+    def get_events(self) -> List[Event]:
+        """Decode and return every event."""
+        return list(self.events)
+
+    def iter_events(self) -> Iterator[Event]:
+        """Yield events one at a time, decoding each as it is reached."""
+        return iter(self.events)
+
+    def get_venues(self) -> Dict[str, Venue]:
+        venues: Dict[str, Venue] = {}
+        for i in range(self._bundle.n_venues):
+            venue = Venue.model_validate(self._bundle.decode(self._bundle.venue_offset(i)))
+            venues[venue.venue_id] = venue
+        return venues
+
+    def get_config(self) -> Dict[str, Any]:
+        return self._bundle.decode(self._bundle.config_off)
@@ -1,23 +1,67 @@
+"""Provider that loads trips from the on-disk Markdown/JSON layout.
+
+AIDEV-NOTE: Day files are independent, so with ``workers`` > 1 they are parsed
+and validated on a process pool. Parsing lives in module-level functions so the
+pool can pickle them; results are collected in list_day_files() order, which
+keeps the event order identical to a serial load. Worker processes cannot call
+methods of this provider, so a subclass that overrides parse_day_file,
+_parse_markdown_file or _create_event is always parsed serially.
+
+With ``cache_dir`` set, parsed Events and Venues are kept in a ParseCache and
+only new or edited files are parsed again (see parse_cache.py). With
+``lazy_venues`` set, get_venues() returns a LazyVenueMapping backed by the
+trip's venue index, so startup no longer scales with the number of venues
+(see venue_index.py).
+"""
+
 import yaml
 import json
 import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
 from itingen.core.base import BaseProvider
 from itingen.core.domain.events import Event
 from itingen.core.domain.venues import Venue
+from itingen.providers.parse_cache import ParseCache
+from itingen.providers.venue_index import LazyVenueMapping
 from itingen.utils.duration import parse_duration
 
+# Builds an Event from an event block's lines, its heading and the day metadata
+EventFactory = Callable[[List[str], Optional[str], Dict[str, Any]], Event]
+
 class LocalFileProvider(BaseProvider[Event]):
     """Provider that loads trip data from the local filesystem."""
 
-    def __init__(self, trip_dir: str | Path):
+    def __init__(
+        self,
+        trip_dir: str | Path,
+        workers: Optional[int] = None,
+        cache_dir: Optional[str | Path] = None,
+        lazy_venues: bool = False,
+    ):
+        """Initialize the provider.
+
+        Args:
+            trip_dir: Trip directory containing config.yaml, events/ and venues/
+            workers: Parse day files on this many processes (0 = one per CPU;
+                None or 1 = serial in this process)
+            cache_dir: Keep parsed events and venues here and re-parse only
+                files that changed since the previous load
+            lazy_venues: Return venues as a LazyVenueMapping that parses each
+                venue on first access instead of loading them all up front
+        """
         self.trip_dir = Path(trip_dir)
+        self.workers = (os.cpu_count() or 1) if workers == 0 else workers
         if not self.trip_dir.exists():
             raise ValueError(f"Trip directory not found: {self.trip_dir}")
         self.events_dir = self.trip_dir / "events"
         self.venues_dir = self.trip_dir / "venues"
         self.config_path = self.trip_dir / "config.yaml"
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache: Optional[ParseCache] = None
+        self.lazy_venues = lazy_venues
 
     def get_config(self) -> Dict[str, Any]:
         """Load and return trip-level configuration."""
@@ -31,104 +75,195 @@ class LocalFileProvider(BaseProvider[Event]):
         if not self.events_dir.exists():
             return []
         
+        day_files = self.list_day_files()
+        cache = self._open_cache()
+        if cache is None:
+            parsed = self._parse_day_files(day_files)
+        else:
+            parsed = [cache.lookup("events", path) for path in day_files]
+            stale = [i for i, events in enumerate(parsed) if events is None]
+            for i, events in zip(stale, self._parse_day_files([day_files[i] for i in stale])):
+                parsed[i] = events
+                cache.store("events", day_files[i], events)
+            cache.retain("events", day_files)
+            cache.save()
+
         all_events = []
-        # Find all .md files in the events directory
-        day_files = sorted(glob.glob(str(self.events_dir / "*.md")))
-        
-        for day_file in day_files:
-            all_events.extend(self._parse_markdown_file(day_file))
+        for events in parsed:
+            all_events.extend(events)
             
         return all_events
 
-    def get_venues(self) -> Dict[str, Venue]:
+    def iter_events(self) -> Iterator[Event]:
+        """Yield events one day file at a time (always parsed in this process)."""
+        day_files = self.list_day_files()
+        cache = self._open_cache()
+        for path in day_files:
+            events = cache.lookup("events", path) if cache is not None else None
+            if events is None:
+                events = self.parse_day_file(path)
+                if cache is not None:
+                    cache.store("events", path, events)
+            yield from events
+        if cache is not None:
+            cache.retain("events", day_files)
+            cache.save()
+
+    def _parse_day_files(self, day_files: List[str]) -> List[List[Event]]:
+        """Parse day files, on a process pool when workers > 1, preserving order."""
+        workers = min(self.workers or 1, len(day_files))
+        if workers <= 1 or self._overrides_parsing():
+            return [self.parse_day_file(path) for path in day_files]
+        # Batch files per task so per-task IPC stays small next to parsing cost
+        chunksize = max(1, len(day_files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(parse_markdown_file, day_files, chunksize=chunksize))
+
+    def list_day_files(self) -> List[str]:
+        """Return the event day files in load order."""
+        if not self.events_dir.exists():
+            return []
+        # Find all .md files in the events directory
+        return sorted(glob.glob(str(self.events_dir / "*.md")))
+
+    def parse_day_file(self, path: str | Path) -> List[Event]:
+        """Parse the events of a single day file."""
+        return self._parse_markdown_file(str(path))
+
+    def get_venues(self) -> Mapping[str, Venue]:
         """Load and return venue information from JSON files."""
+        if self.lazy_venues:
+            return LazyVenueMapping.for_trip(self.trip_dir)
         venues = {}
         if not self.venues_dir.exists():
             return venues
             
-        for venue_file in self.venues_dir.glob("*.json"):
-            with open(venue_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                venue = Venue(**data)
-                venues[venue.venue_id] = venue
-                
+        cache = self._open_cache()
+        venue_files = list(self.venues_dir.glob("*.json"))
+        for venue_file in venue_files:
+            cached = cache.lookup("venues", venue_file) if cache is not None else None
+            if cached is not None:
+                venue = cached[0]
+            else:
+                with open(venue_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                    venue = Venue(**data)
+                if cache is not None:
+                    cache.store("venues", venue_file, [venue])
+            venues[venue.venue_id] = venue
+
+        if cache is not None:
+            cache.retain("venues", venue_files)
+            cache.save()
         return venues
 
+    def _open_cache(self) -> Optional[ParseCache]:
+        """Return the parse cache, reloading its manifest for this load."""
+        if self.cache_dir is None:
+            return None
+        self.cache = ParseCache(self.cache_dir)
+        return self.cache
+
+    def _overrides_parsing(self) -> bool:
+        """Return True if a subclass customizes parsing (which the process pool cannot run)."""
+        cls = type(self)
+        return any(
+            getattr(cls, name) is not getattr(LocalFileProvider, name)
+            for name in ("parse_day_file", "_parse_markdown_file", "_create_event")
+        )
+
     def _parse_markdown_file(self, path: str) -> List[Event]:
         """Parse a single Markdown file for events."""
-        events: List[Event] = []
-        day_metadata: Dict[str, Any] = {}
-        current_header: Optional[str] = None
-        current_block: List[str] = []
-
-        with open(path, "r", encoding="utf-8") as f:
-            for raw in f:
-                line = raw.rstrip("\n")
-
-                # Parse day-level metadata (before first event)
-                if current_header is None and line.startswith("- "):
-                    body = line[2:]
-                    if ":" in body:
-                        k, v = body.split(":", 1)
-                        day_metadata[k.strip()] = v.strip()
-                    continue
-
-                if line.startswith("### Event:"):
-                    # Flush previous event block
-                    if current_header is not None:
-                        events.append(self._create_event(current_block, current_header, day_metadata))
-                        current_block = []
+        return parse_markdown_file(path, self._create_event)
 
-                    current_header = line[len("### Event:") :].strip()
-                    continue
+    def _create_event(self, lines: List[str], header: Optional[str], metadata: Dict[str, Any]) -> Event:
+        """Create an Event object from a block of lines and metadata."""
+        return create_event(lines, header, metadata)
 
-                # Collect lines inside current event block
-                if current_header is not None:
-                    if line.startswith("## "):
-                        if current_header is not None:
-                            events.append(self._create_event(current_block, current_header, day_metadata))
-                            current_block = []
-                        current_header = None
-                    else:
-                        current_block.append(raw)
 
-        # Flush final block
-        if current_header is not None:
-            events.append(self._create_event(current_block, current_header, day_metadata))
+def parse_markdown_file(path: str, make_event: Optional[EventFactory] = None) -> List[Event]:
+    """Parse a single Markdown file for events.
 
-        return events
+    Args:
+        path: Day file to parse
+        make_event: Builds an Event from an event block (defaults to create_event)
+    """
+    if make_event is None:
+        make_event = create_event
+    events: List[Event] = []
+    day_metadata: Dict[str, Any] = {}
+    current_header: Optional[str] = None
+    current_block: List[str] = []
 
-    def _create_event(self, lines: List[str], header: Optional[str], metadata: Dict[str, Any]) -> Event:
-        """Create an Event object from a block of lines and metadata."""
-        event_data = metadata.copy()
-        if header:
-            event_data["event_heading"] = header
-            
-        for raw in lines:
-            line = raw.strip("\n")
-            if not line.startswith("- "):
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            line = raw.rstrip("\n")
+
+            # Parse day-level metadata (before first event)
+            if current_header is None and line.startswith("- "):
+                body = line[2:]
+                if ":" in body:
+                    k, v = body.split(":", 1)
+                    day_metadata[k.strip()] = v.strip()
                 continue
-            body = line[2:]
-            if ":" not in body:
+
+            if line.startswith("### Event:"):
+                # Flush previous event block
+                if current_header is not None:
+                    events.append(make_event(current_block, current_header, day_metadata))
+                    current_block = []
+
+                current_header = line[len("### Event:") :].strip()
                 continue
-            key, value = body.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-            
-            # Simple normalization matching scaffold logic
-            if key in {"who", "depends_on"}:
-                event_data[key] = [p.strip() for p in value.split(",") if p.strip()]
-            elif key in {"coordination_point", "hard_stop", "inferred"}:
-                v = value.lower()
-                event_data[key] = v in {"true", "yes", "y", "1"}
-            elif key == "duration":
-                # Parse duration string (e.g., "1h30m") into duration_seconds
-                try:
-                    event_data["duration_seconds"] = parse_duration(value)
-                except ValueError as e:
-                    # Fail fast on malformed duration
-                    raise ValueError(f"Invalid duration in event '{header}': {e}") from e
-            else:
-                event_data[key] = value
-                
-        return Event(**event_data)
+
+            # Collect lines inside current event block
+            if current_header is not None:
+                if line.startswith("## "):
+                    if current_header is not None:
+                        events.append(make_event(current_block, current_header, day_metadata))
+                        current_block = []
+                    current_header = None
+                else:
+                    current_block.append(raw)
+
+    # Flush final block
+    if current_header is not None:
+        events.append(make_event(current_block, current_header, day_metadata))
+
+    return events
+
+
+def create_event(lines: List[str], header: Optional[str], metadata: Dict[str, Any]) -> Event:
+    """Create an Event object from a block of lines and metadata."""
+    event_data = metadata.copy()
+    if header:
+        event_data["event_heading"] = header
+
+    for raw in lines:
+        line = raw.strip("\n")
+        if not line.startswith("- "):
+            continue
+        body = line[2:]
+        if ":" not in body:
+            continue
+        key, value = body.split(":", 1)
+        key = key.strip()
+        value = value.strip()
+
+        # Simple normalization matching scaffold logic
+        if key in {"who", "depends_on"}:
+            event_data[key] = [p.strip() for p in value.split(",") if p.strip()]
+        elif key in {"coordination_point", "hard_stop", "inferred"}:
+            v = value.lower()
+            event_data[key] = v in {"true", "yes", "y", "1"}
+        elif key == "duration":
+            # Parse duration string (e.g., "1h30m") into duration_seconds
+            try:
+                event_data["duration_seconds"] = parse_duration(value)
+            except ValueError as e:
+                # Fail fast on malformed duration
+                raise ValueError(f"Invalid duration in event '{header}': {e}") from e
+        else:
+            event_data[key] = value
+
+    return Event(**event_data)
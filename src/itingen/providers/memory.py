@@ -0,0 +1,37 @@
+"""In-memory provider for data that has already been loaded.
+
+AIDEV-NOTE: Used to hand pre-loaded (and possibly pre-hydrated) events to a
+further PipelineOrchestrator without touching the filesystem again, e.g. the
+per-person branches of a FanOutPipeline.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, TypeVar
+
+from itingen.core.base import BaseProvider
+from itingen.core.domain.venues import Venue
+
+T = TypeVar("T")
+
+
+class InMemoryProvider(BaseProvider[T]):
+    """Provider that serves events, venues and config held in memory."""
+
+    def __init__(
+        self,
+        events: List[T],
+        venues: Optional[Mapping[str, Venue]] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ):
+        self.events = events
+        self.venues = venues if venues is not None else {}
+        self.config = config if config is not None else {}
+
+    def get_events(self) -> List[T]:
+        """Return a shallow copy so callers cannot reorder the shared list."""
+        return list(self.events)
+
+    def get_venues(self) -> Dict[str, Venue]:
+        return self.venues
+
+    def get_config(self) -> Dict[str, Any]:
+        return self.config
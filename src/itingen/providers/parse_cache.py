@@ -0,0 +1,147 @@
+"""Persistent cache of parsed trip files for LocalFileProvider.
+
+AIDEV-NOTE: The manifest records each source file's mtime, size and SHA-256
+alongside the pickle holding the Events or Venue parsed from it. A file is
+re-parsed only when its manifest entry no longer matches: matching mtime and
+size is trusted outright; a changed mtime with the same size falls back to the
+content hash, so a touched but unedited file is still a hit. Entries for
+deleted files are dropped on save.
+
+AIDEV-DECISION: Parsed objects are pickled rather than dumped to JSON like the
+stage checkpoints: loading a pickle skips pydantic validation, which is the
+dominant cost of a load. Pickles are only valid for the code that wrote them,
+so the whole cache is discarded whenever PARSER_VERSION, the Event/Venue
+schemas or the pydantic version change.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pydantic
+
+from itingen.core.domain.events import Event
+from itingen.core.domain.venues import Venue
+from itingen.utils.fingerprint import compute_fingerprint
+
+PARSE_CACHE_DIR_NAME = ".parse_cache"
+MANIFEST_NAME = "manifest.json"
+
+# Bump whenever parse_markdown_file/create_event or venue loading change output
+PARSER_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def schema_fingerprint() -> str:
+    """Fingerprint everything that decides whether a cached pickle is still valid."""
+    return compute_fingerprint({
+        "parser": PARSER_VERSION,
+        "pydantic": pydantic.VERSION,
+        "event": Event.model_json_schema(),
+        "venue": Venue.model_json_schema(),
+    })
+
+
+def file_digest(path: str | Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class ParseCache:
+    """Manifest plus per-file pickles of parsed objects, under one directory."""
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+        self.manifest_path = self.cache_dir / MANIFEST_NAME
+        self.hits = 0
+        self.misses = 0
+        self._version = schema_fingerprint()
+        self._entries = self._load_manifest()
+        self._digests: Dict[str, str] = {}
+        self._dirty = False
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if manifest.get("version") != self._version:
+            # Parser or schema changed: every pickle is stale
+            return {}
+        return manifest.get("files", {})
+
+    @staticmethod
+    def _key(kind: str, path: str | Path) -> str:
+        return f"{kind}/{Path(path).name}"
+
+    def lookup(self, kind: str, path: str | Path) -> Optional[List[Any]]:
+        """Return the cached objects for path, or None if it must be parsed."""
+        key = self._key(kind, path)
+        entry = self._entries.get(key)
+        stat = os.stat(path)
+        if entry is None or entry["size"] != stat.st_size:
+            self.misses += 1
+            return None
+        if entry["mtime_ns"] != stat.st_mtime_ns:
+            digest = file_digest(path)
+            self._digests[key] = digest
+            if digest != entry["sha256"]:
+                self.misses += 1
+                return None
+            entry["mtime_ns"] = stat.st_mtime_ns
+            self._dirty = True
+        try:
+            with open(self.cache_dir / entry["blob"], "rb") as f:
+                items = pickle.load(f)
+        except Exception:
+            # A missing or unreadable pickle is a miss, never a failed load
+            self.misses += 1
+            return None
+        self.hits += 1
+        return items
+
+    def store(self, kind: str, path: str | Path, items: List[Any]) -> None:
+        """Record freshly parsed objects for path."""
+        key = self._key(kind, path)
+        stat = os.stat(path)
+        digest = self._digests.pop(key, None) or file_digest(path)
+        blob = f"{key}.pkl"
+        blob_path = self.cache_dir / blob
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(items, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(blob_path)
+        self._entries[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "blob": blob,
+        }
+        self._dirty = True
+
+    def retain(self, kind: str, paths: Iterable[str | Path]) -> None:
+        """Forget entries of this kind whose source file no longer exists."""
+        live = {self._key(kind, path) for path in paths}
+        for key in [k for k in self._entries if k.startswith(f"{kind}/") and k not in live]:
+            entry = self._entries.pop(key)
+            (self.cache_dir / entry["blob"]).unlink(missing_ok=True)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest if anything changed since it was loaded."""
+        if not self._dirty:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self._version, "files": self._entries}, f, indent=2)
+        tmp_path.replace(self.manifest_path)
+        self._dirty = False
@@ -0,0 +1,224 @@
+"""SQLite-backed trip provider plus import/export for the file layout.
+
+AIDEV-NOTE: import_trip() loads a trips/<trip>/ directory into one SQLite
+file. Parsed events are stored as JSON rows in load order, with indexed columns
+for date, kind and venue_id and an event_people table indexed by person, so
+SqliteProvider can push person, date-range and kind filters down into SQL.
+Venues and config are stored alongside.
+
+AIDEV-DECISION: The raw text of every day file, venue file and config.yaml is
+kept in a source_files table, and export_trip() writes those texts back
+verbatim. The round trip is therefore byte-exact, including comments and
+prose that the Markdown parser ignores. The structured tables are derived from
+the same texts at import time and are what the provider reads.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from itingen.core.base import BaseProvider
+from itingen.core.domain.events import Event
+from itingen.core.domain.venues import Venue
+from itingen.providers.file_provider import LocalFileProvider, parse_markdown_file
+from itingen.utils.grouping import event_date
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS source_files (path TEXT PRIMARY KEY, content TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    time_utc TEXT,
+    kind TEXT,
+    venue_id TEXT,
+    day_file TEXT NOT NULL,
+    has_people INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS event_people (
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    person TEXT NOT NULL,
+    PRIMARY KEY (person, event_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS venues (venue_id TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS events_date ON events(date);
+CREATE INDEX IF NOT EXISTS events_kind ON events(kind);
+CREATE INDEX IF NOT EXISTS events_venue ON events(venue_id);
+"""
+
+
+def connect(db_path: str | Path) -> sqlite3.Connection:
+    """Open a trip database, creating the schema if needed."""
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is None:
+        conn.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        conn.commit()
+    elif int(row[0]) != SCHEMA_VERSION:
+        conn.close()
+        raise ValueError(
+            f"Trip database {db_path} has schema version {row[0]}, expected {SCHEMA_VERSION}; re-import it"
+        )
+    return conn
+
+
+def import_trip(trip_dir: str | Path, db_path: str | Path) -> Dict[str, int]:
+    """Load a trip directory into db_path, replacing any previous contents.
+
+    Returns:
+        Counts of imported events, venues and source files
+    """
+    provider = LocalFileProvider(trip_dir)
+    trip_dir = provider.trip_dir
+    conn = connect(db_path)
+    try:
+        with conn:
+            for table in ("event_people", "events", "venues", "source_files"):
+                conn.execute(f"DELETE FROM {table}")
+            conn.execute("DELETE FROM meta WHERE key != 'schema_version'")
+
+            sources: List[Path] = []
+            if provider.config_path.exists():
+                sources.append(provider.config_path)
+            conn.execute(
+                "INSERT INTO meta VALUES ('config', ?)", (json.dumps(provider.get_config(), default=str),)
+            )
+
+            events = 0
+            for day_file in provider.list_day_files():
+                sources.append(Path(day_file))
+                name = Path(day_file).name
+                for event in parse_markdown_file(day_file):
+                    cursor = conn.execute(
+                        "INSERT INTO events (date, time_utc, kind, venue_id, day_file, has_people, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            event_date(event), event.time_utc, event.kind, event.venue_id, name,
+                            1 if event.who else 0, json.dumps(event.model_dump(mode="json")),
+                        ),
+                    )
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO event_people VALUES (?, ?)",
+                        [(cursor.lastrowid, person) for person in event.who],
+                    )
+                    events += 1
+
+            venues = provider.get_venues()
+            conn.executemany(
+                "INSERT INTO venues VALUES (?, ?)",
+                [(venue_id, venue.model_dump_json()) for venue_id, venue in venues.items()],
+            )
+            if provider.venues_dir.exists():
+                sources.extend(sorted(provider.venues_dir.glob("*.json")))
+
+            conn.executemany(
+                "INSERT INTO source_files VALUES (?, ?)",
+                [(path.relative_to(trip_dir).as_posix(), path.read_text(encoding="utf-8")) for path in sources],
+            )
+    finally:
+        conn.close()
+    return {"events": events, "venues": len(venues), "files": len(sources)}
+
+
+def export_trip(db_path: str | Path, trip_dir: str | Path) -> int:
+    """Write the trip files stored in db_path back out under trip_dir.
+
+    Returns:
+        The number of files written
+    """
+    trip_dir = Path(trip_dir)
+    conn = connect(db_path)
+    try:
+        rows = conn.execute("SELECT path, content FROM source_files ORDER BY path").fetchall()
+    finally:
+        conn.close()
+    for rel_path, content in rows:
+        path = trip_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+    return len(rows)
+
+
+class SqliteProvider(BaseProvider[Event]):
+    """Provider that reads a trip database written by import_trip().
+
+    Args:
+        db_path: Path to the SQLite file
+        person: Only events for this person slug (plus events with no 'who',
+            which apply to everyone, matching PersonFilter)
+        start_date: Only events on or after this YYYY-MM-DD date
+        end_date: Only events on or before this YYYY-MM-DD date
+        kinds: Only events of these kinds
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        person: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        kinds: Optional[Sequence[str]] = None,
+    ):
+        self.db_path = Path(db_path)
+        if not self.db_path.exists():
+            raise ValueError(f"Trip database not found: {self.db_path}")
+        self.person = person
+        self.start_date = start_date
+        self.end_date = end_date
+        self.kinds = list(kinds) if kinds else None
+
+    def _query(self) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if self.person:
+            clauses.append(
+                "(has_people = 0 OR id IN (SELECT event_id FROM event_people WHERE person = ?))"
+            )
+            params.append(self.person)
+        if self.start_date:
+            clauses.append("date >= ?")
+            params.append(self.start_date)
+        if self.end_date:
+            clauses.append("date <= ?")
+            params.append(self.end_date)
+        if self.kinds:
+            clauses.append(f"kind IN ({', '.join('?' for _ in self.kinds)})")
+            params.extend(self.kinds)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return f"SELECT data FROM events{where} ORDER BY id", params
+
+    def iter_events(self) -> Iterator[Event]:
+        """Yield matching events in import order straight from the cursor."""
+        sql, params = self._query()
+        conn = connect(self.db_path)
+        try:
+            for (data,) in conn.execute(sql, params):
+                yield Event.model_validate_json(data)
+        finally:
+            conn.close()
+
+    def get_events(self) -> List[Event]:
+        """Load and return the events matching the provider's filters."""
+        return list(self.iter_events())
+
+    def get_venues(self) -> Dict[str, Venue]:
+        conn = connect(self.db_path)
+        try:
+            rows = conn.execute("SELECT venue_id, data FROM venues").fetchall()
+        finally:
+            conn.close()
+        return {venue_id: Venue.model_validate_json(data) for venue_id, data in rows}
+
+    def get_config(self) -> Dict[str, Any]:
+        conn = connect(self.db_path)
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'config'").fetchone()
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else {}
@@ -0,0 +1,139 @@
+"""Venue index file and lazily loaded venue mapping.
+
+AIDEV-NOTE: ``<trip>/.venue_index.json`` maps every venue_id to its file under
+venues/ together with the file's size, mtime, SHA-256, canonical name and
+aliases. Refreshing the index costs one directory scan; only files whose
+size or mtime changed are read again, and then only as raw JSON (no pydantic
+validation). LazyVenueMapping serves PipelineContext.venues from the index and
+validates a Venue the first time it is looked up, so a run that touches ten
+venues parses ten files however many the trip has.
+
+AIDEV-DECISION: The index lives in the trip directory, not in venues/, so the
+``venues/*.json`` glob used by the eager loader and the import tools never
+picks it up. A lazy mapping reports invalid venue data on first access rather
+than at load time; JSON syntax errors still surface while refreshing the index.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from itingen.core.domain.venues import Venue
+from itingen.utils.fingerprint import compute_fingerprint
+
+VENUE_INDEX_NAME = ".venue_index.json"
+VENUE_INDEX_VERSION = 1
+
+
+def _entry(path: Path, stat: os.stat_result) -> Dict[str, Any]:
+    raw = path.read_bytes()
+    data = json.loads(raw)
+    return {
+        "venue_id": data.get("venue_id"),
+        "file": path.name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "canonical_name": data.get("canonical_name"),
+        "aliases": list(data.get("aliases") or []),
+    }
+
+
+def refresh_venue_index(trip_dir: str | Path) -> List[Dict[str, Any]]:
+    """Bring the trip's venue index up to date and return its entries.
+
+    Raises:
+        json.JSONDecodeError: If a new or changed venue file is not valid JSON
+        ValueError: If two venue files declare the same venue_id
+    """
+    trip_dir = Path(trip_dir)
+    venues_dir = trip_dir / "venues"
+    index_path = trip_dir / VENUE_INDEX_NAME
+
+    previous: Dict[str, Dict[str, Any]] = {}
+    if index_path.exists():
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == VENUE_INDEX_VERSION:
+                previous = {entry["file"]: entry for entry in index.get("venues", [])}
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            previous = {}
+
+    entries: List[Dict[str, Any]] = []
+    changed = False
+    if venues_dir.exists():
+        with os.scandir(venues_dir) as scan:
+            files = sorted(
+                (e for e in scan if e.name.endswith(".json") and e.is_file()), key=lambda e: e.name
+            )
+        for dir_entry in files:
+            stat = dir_entry.stat()
+            entry = previous.pop(dir_entry.name, None)
+            if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+                entry = _entry(Path(dir_entry.path), stat)
+                changed = True
+            entries.append(entry)
+    changed = changed or bool(previous) or not index_path.exists()
+
+    seen: Dict[str, str] = {}
+    for entry in entries:
+        venue_id = entry["venue_id"]
+        if venue_id in seen:
+            raise ValueError(f"Duplicate venue_id '{venue_id}' in {seen[venue_id]} and {entry['file']}")
+        seen[venue_id] = entry["file"]
+
+    if changed:
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": VENUE_INDEX_VERSION, "venues": entries}, f, indent=1, ensure_ascii=False)
+        tmp_path.replace(index_path)
+    return entries
+
+
+class LazyVenueMapping(Mapping):
+    """Read-only venue_id -> Venue mapping that parses each venue on first access."""
+
+    def __init__(self, venues_dir: str | Path, entries: List[Dict[str, Any]]):
+        self.venues_dir = Path(venues_dir)
+        self._entries: Dict[str, Dict[str, Any]] = {entry["venue_id"]: entry for entry in entries}
+        self._loaded: Dict[str, Venue] = {}
+
+    @classmethod
+    def for_trip(cls, trip_dir: str | Path) -> "LazyVenueMapping":
+        """Refresh the trip's venue index and map it."""
+        return cls(Path(trip_dir) / "venues", refresh_venue_index(trip_dir))
+
+    def __getitem__(self, venue_id: str) -> Venue:
+        venue = self._loaded.get(venue_id)
+        if venue is None:
+            entry = self._entries[venue_id]
+            with open(self.venues_dir / entry["file"], "r", encoding="utf-8") as f:
+                venue = Venue(**json.load(f))
+            self._loaded[venue_id] = venue
+        return venue
+
+    def __contains__(self, venue_id: object) -> bool:
+        return venue_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def loaded_count(self) -> int:
+        """Number of venues parsed so far."""
+        return len(self._loaded)
+
+    def entry(self, venue_id: str) -> Optional[Dict[str, Any]]:
+        """Index entry (file, canonical_name, aliases, ...) without parsing the venue."""
+        return self._entries.get(venue_id)
+
+    def fingerprint(self) -> str:
+        """Fingerprint of every venue file's content, computed from the index alone."""
+        return compute_fingerprint(sorted((venue_id, e["sha256"]) for venue_id, e in self._entries.items()))
@@ -5,9 +5,10 @@ JSON output is useful for programmatic consumption and integration with other to
 """
 
 import json
-from typing import List
+import textwrap
+from typing import List, TextIO
 from pathlib import Path
-from itingen.core.base import BaseEmitter
+from itingen.core.base import BaseEmitter, DayStreamWriter
 from itingen.core.domain.events import Event
 
 
@@ -52,3 +53,38 @@ class JsonEmitter(BaseEmitter[Event]):
             json.dump(output, f, indent=2, ensure_ascii=False)
 
         return str(path)
+
+    def open_stream(self, output_path: str) -> "JsonDayWriter":
+        """Write the JSON file event by event as a streaming run produces it."""
+        return JsonDayWriter(output_path)
+
+
+class JsonDayWriter(DayStreamWriter[Event]):
+    """Streams events into the same document layout JsonEmitter.emit() writes.
+
+    Each event is dumped on its own and indented to its nesting level, so the
+    file is byte-identical to a whole-list emit() of the same events.
+    """
+
+    def __init__(self, output_path: str):
+        path = Path(output_path)
+        if not path.suffix:
+            path = path.with_suffix(".json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._file: TextIO = open(path, "w", encoding="utf-8")
+        self._file.write('{\n  "events": [')
+        self._count = 0
+
+    def write_day(self, items: List[Event]) -> None:
+        for event in items:
+            dumped = json.dumps(event.model_dump(mode='json'), indent=2, ensure_ascii=False)
+            self._file.write(",\n" if self._count else "\n")
+            self._file.write(textwrap.indent(dumped, "    ", lambda line: True))
+            self._count += 1
+
+    def close(self) -> str:
+        if not self._file.closed:
+            self._file.write("\n  ]\n}" if self._count else "]\n}")
+            self._file.close()
+        return str(self.path)
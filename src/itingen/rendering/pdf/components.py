@@ -13,6 +13,7 @@ from reportlab.lib import colors
 from itingen.rendering.pdf.themes import PDFTheme
 from itingen.core.domain.events import Event
 from itingen.rendering.timeline import TimelineDay
+from itingen.utils.times import local_clock
 
 class PDFComponent:
     """Base class for PDF layout components."""
@@ -29,17 +30,7 @@ class EventComponent(PDFComponent):
         """Render the event block by appending flowables to the story."""
         
         # Format time
-        time_str = "TBD"
-        if event.time_local:
-            try:
-                if " " in event.time_local:
-                    time_str = event.time_local.split(" ")[1]
-                else:
-                    time_str = event.time_local
-                if time_str.count(":") == 2:
-                    time_str = ":".join(time_str.split(":")[:2])
-            except Exception:
-                pass
+        time_str = local_clock(event, seconds=False) or "TBD"
         
         # Build event content
         heading = event.event_heading or "Untitled Event"
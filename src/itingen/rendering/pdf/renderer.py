@@ -22,8 +22,12 @@ class PDFEmitter(BaseEmitter[Event]):
     
     AIDEV-NOTE: Uses ReportLab (not FPDF2) with Unicode font support.
     Supports daily aggregation, banners, and thumbnails via TimelineProcessor.
+    ReportLab builds are CPU-bound, so parallel emitter mode runs this emitter
+    in a worker process.
     """
 
+    execution = "process"
+
     def __init__(
         self,
         theme: Optional[PDFTheme] = None,
@@ -37,6 +41,12 @@ class PDFEmitter(BaseEmitter[Event]):
         # Register Unicode fonts on initialization
         register_fonts()
 
+    def __setstate__(self, state):
+        # Font registration is per-process ReportLab state; redo it when the
+        # emitter is unpickled in a worker process.
+        self.__dict__.update(state)
+        register_fonts()
+
     def emit(self, itinerary: List[Event], output_path: str) -> str:
         """Write the itinerary to a PDF file using ReportLab."""
         path = Path(output_path)
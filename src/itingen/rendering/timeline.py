@@ -3,6 +3,7 @@ import datetime
 from dataclasses import dataclass
 from itingen.core.domain.events import Event
 from itingen.utils.grouping import group_events_by_date
+from itingen.utils.times import target_clock
 
 @dataclass
 class TimelineDay:
@@ -48,10 +49,9 @@ class TimelineProcessor:
             # Determine First Event Target Time
             target_time = None
             first_title = None
-            if first_event and (first_event.time_local or first_event.no_later_than):
-                target_time = first_event.time_local or first_event.no_later_than
-                if target_time and " " in target_time:
-                    target_time = target_time.split(" ")[1]
+            if first_event:
+                target_time = target_clock(first_event)
+            if target_time:
                 first_title = first_event.event_heading or first_event.description or 'your first event'
 
             # Determine Sleep Location for THIS day (to be used next day or printed at end)
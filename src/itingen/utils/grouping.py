@@ -8,6 +8,7 @@ import datetime
 from typing import Dict, List
 
 from itingen.core.domain.events import Event
+from itingen.utils.times import parse_local, utc_date
 
 
 def group_events_by_date(events: List[Event]) -> Dict[str, List[Event]]:
@@ -15,8 +16,9 @@ def group_events_by_date(events: List[Event]) -> Dict[str, List[Event]]:
 
     Determines the date for each event using the following priority:
     1. Explicit 'date' field (from extra fields)
-    2. Parsed from 'time_utc' field
-    3. Falls back to 'TBD' if neither available
+    2. Local calendar date of 'time_local'
+    3. Parsed from 'time_utc' field
+    4. Falls back to 'TBD' if none available
 
     Args:
         events: List of Event objects to group
@@ -28,7 +30,7 @@ def group_events_by_date(events: List[Event]) -> Dict[str, List[Event]]:
     events_by_date: Dict[str, List[Event]] = {}
 
     for event in events:
-        date_str = _extract_date(event)
+        date_str = event_date(event)
 
         if date_str not in events_by_date:
             events_by_date[date_str] = []
@@ -37,7 +39,7 @@ def group_events_by_date(events: List[Event]) -> Dict[str, List[Event]]:
     return events_by_date
 
 
-def _extract_date(event: Event) -> str:
+def event_date(event: Event) -> str:
     """Extract date string from an event.
 
     Args:
@@ -51,8 +53,18 @@ def _extract_date(event: Event) -> str:
     if date_str:
         return date_str
 
-    # Priority 2: Parse from time_utc
+    # Priority 2: Local calendar date. TimeNormalizationHydrator fills time_utc
+    # for zoned local times, and its UTC date can be the day before (east of UTC)
+    local = getattr(event, "time_local_dt", None) or parse_local(event.time_local)
+    if local is not None:
+        return local.date().isoformat()
+
+    # Priority 3: Parse from time_utc (or its precomputed epoch, which always
+    # describes time_utc when both are set)
     if event.time_utc:
+        epoch = getattr(event, "time_epoch", None)
+        if epoch is not None:
+            return utc_date(epoch)
         try:
             dt = datetime.datetime.fromisoformat(
                 event.time_utc.replace("Z", "+00:00")
@@ -0,0 +1,208 @@
+"""Parsing and formatting of event times.
+
+AIDEV-DECISION: Event times arrive as strings (time_utc "2025-12-30T16:00Z",
+time_local / no_later_than "2026-01-03 08:00"). TimeNormalizationHydrator
+parses them once into typed Event fields:
+- time_local_dt / no_later_than_dt: naive local wall-clock datetimes
+- time_epoch: integer UTC epoch seconds of time_utc, else of the local time
+  (or no_later_than) in the event's timezone or the trip's default timezone
+Local times are converted in bulk by localize_many(), one UTC offset per
+(zone, local day); see its docstring for DST handling.
+Consumers read those fields through the helpers below, which fall back to
+parsing the strings when an event was not normalized (e.g. in unit tests or
+after a memoized stage reloaded it), so output never depends on the hydrator
+having run.
+"""
+
+import datetime
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_DAY = 86400
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: Optional[str]) -> Optional[ZoneInfo]:
+    """Return the ZoneInfo for an IANA name, or None if it is empty or unknown."""
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def parse_local(value: Optional[str]) -> Optional[datetime.datetime]:
+    """Parse a 'YYYY-MM-DD HH:MM[:SS]' local time; None for clock-only or invalid values."""
+    # fromisoformat is far cheaper than strptime; the length and separator
+    # checks keep it to the date-and-time forms parsed here
+    if not value or len(value) < 16 or value[10] not in " T":
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is None else None
+
+
+def parse_utc(value: Optional[str]) -> Optional[datetime.datetime]:
+    """Parse an ISO 8601 UTC time such as '2025-12-30T16:00Z' into an aware datetime."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+
+def utc_epoch(value: Optional[str]) -> Optional[int]:
+    """Integer epoch seconds of an ISO 8601 UTC time."""
+    parsed = parse_utc(value)
+    return None if parsed is None else int(parsed.timestamp())
+
+
+def wall_seconds(local: datetime.datetime) -> int:
+    """Seconds since 1970-01-01 00:00 of a naive wall-clock time, ignoring zones."""
+    return (local.toordinal() - _EPOCH_ORDINAL) * _DAY + local.hour * 3600 + local.minute * 60 + local.second
+
+
+@lru_cache(maxsize=65536)
+def _day_offset(zone_name: str, ordinal: int) -> Optional[int]:
+    """UTC offset in seconds in force for a whole local day, or None on a transition day."""
+    zone = get_zone(zone_name)
+    start = datetime.datetime.fromordinal(ordinal).replace(tzinfo=zone)
+    end = start.replace(hour=23, minute=59, second=59)
+    offset = start.utcoffset()
+    if offset != end.utcoffset():
+        return None
+    return int(offset.total_seconds())
+
+
+def localize_many(
+    locals_: Sequence[Optional[datetime.datetime]], zones: Sequence[Optional[str]]
+) -> List[Optional[int]]:
+    """Epoch seconds of naive local times, each in its own IANA zone.
+
+    Times are grouped by zone and converted with one UTC offset per local
+    day, taken from a cached per-zone table, so a trip costs one zone lookup
+    per distinct (zone, day) rather than per event. Days containing a DST
+    transition fall back to per-time conversion, which resolves gaps and
+    overlaps exactly like ``local.replace(tzinfo=zone).timestamp()`` (fold=0).
+    Entries without a time or with an unknown zone are None.
+    """
+    result: List[Optional[int]] = [None] * len(locals_)
+    groups: Dict[str, List[int]] = defaultdict(list)
+    for i, (local, zone_name) in enumerate(zip(locals_, zones)):
+        if local is not None and zone_name:
+            groups[zone_name].append(i)
+    for zone_name, indices in groups.items():
+        zone = get_zone(zone_name)
+        if zone is None:
+            continue
+        for i in indices:
+            local = locals_[i]
+            offset = _day_offset(zone_name, local.toordinal())
+            if offset is None:
+                result[i] = int(local.replace(tzinfo=zone).timestamp())
+            else:
+                result[i] = wall_seconds(local) - offset
+    return result
+
+
+def to_epoch(local: Optional[datetime.datetime], timezone: Optional[str]) -> Optional[int]:
+    """Epoch seconds of a naive local time in the named timezone."""
+    return localize_many([local], [timezone])[0]
+
+
+def compute_epoch(event: Any, default_timezone: Optional[str] = None) -> Optional[int]:
+    """Compute an event's time_epoch from its time strings."""
+    return epochs_for([event], default_timezone, precomputed=False)[0]
+
+
+def epochs_for(
+    events: Sequence[Any], default_timezone: Optional[str] = None, precomputed: bool = True
+) -> List[Optional[int]]:
+    """time_epoch of every event, converting all local times in one bulk pass.
+
+    Args:
+        precomputed: Use an event's time_epoch when it is already set
+    """
+    epochs: List[Optional[int]] = [None] * len(events)
+    pending: List[int] = []
+    locals_: List[Optional[datetime.datetime]] = []
+    zones: List[Optional[str]] = []
+    for i, event in enumerate(events):
+        epoch = getattr(event, "time_epoch", None) if precomputed else None
+        if epoch is None:
+            epoch = utc_epoch(event.time_utc)
+        if epoch is not None:
+            epochs[i] = epoch
+            continue
+        local = getattr(event, "time_local_dt", None) if precomputed else None
+        if local is None:
+            local = parse_local(event.time_local)
+        if local is None:
+            local = getattr(event, "no_later_than_dt", None) if precomputed else None
+        if local is None:
+            local = parse_local(event.no_later_than)
+        if local is not None:
+            pending.append(i)
+            locals_.append(local)
+            zones.append(event.timezone or default_timezone)
+    for i, epoch in zip(pending, localize_many(locals_, zones)):
+        epochs[i] = epoch
+    return epochs
+
+
+def event_epoch(event: Any, default_timezone: Optional[str] = None) -> Optional[int]:
+    """The event's time_epoch, computed from its time strings if not normalized."""
+    epoch = getattr(event, "time_epoch", None)
+    if epoch is not None:
+        return epoch
+    return compute_epoch(event, default_timezone)
+
+
+def format_utc(epoch: int) -> str:
+    """ISO 8601 UTC text of epoch seconds, in the trips' '2025-12-30T16:00Z' style."""
+    days, seconds = divmod(epoch, _DAY)
+    day = datetime.date.fromordinal(_EPOCH_ORDINAL + days).isoformat()
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if seconds:
+        return f"{day}T{hours:02d}:{minutes:02d}:{seconds:02d}Z"
+    return f"{day}T{hours:02d}:{minutes:02d}Z"
+
+
+def utc_date(epoch: int) -> str:
+    """YYYY-MM-DD UTC date of epoch seconds."""
+    return datetime.date.fromordinal(_EPOCH_ORDINAL + epoch // _DAY).isoformat()
+
+
+def local_clock(event: Any, field: str = "time_local", seconds: bool = True) -> Optional[str]:
+    """Clock text ('HH:MM', or 'HH:MM:SS' if the source has seconds) of time_local or no_later_than.
+
+    Args:
+        seconds: Keep seconds when the source time has them
+    """
+    value = getattr(event, field, None)
+    if not value:
+        return None
+    parsed = getattr(event, f"{field}_dt", None)
+    if parsed is not None:
+        clock = parsed.strftime("%H:%M:%S" if value.count(":") == 2 else "%H:%M")
+    else:
+        clock = value.split(" ")[1] if " " in value else value
+    if not seconds and clock.count(":") == 2:
+        clock = ":".join(clock.split(":")[:2])
+    return clock
+
+
+def target_clock(event: Any) -> Optional[str]:
+    """Clock text of the time an event must be ready by (time_local, else no_later_than)."""
+    return local_clock(event, "time_local") or local_clock(event, "no_later_than")
@@ -0,0 +1,164 @@
+"""Precomputed lookup from free-text place names to venue ids.
+
+AIDEV-NOTE: VenueLookup indexes every venue's canonical_name and aliases three
+ways, tried in order:
+1. exact: the casefolded, whitespace-collapsed name;
+2. tokens: the sorted set of normalized word tokens (accents, punctuation and
+   filler words such as "the" dropped), so "Airport, Auckland" finds
+   "Auckland Airport";
+3. fuzzy: character trigrams scored with the Dice coefficient over an
+   inverted index, so only names sharing a trigram with the query are scored.
+Names and queries are also indexed and tried by their leading segment
+("Hotel Indigo Auckland, 53 St Patrick's Square" -> "Hotel Indigo Auckland"),
+and every result is memoized per query string, so resolving a trip costs one
+lookup per distinct location rather than per event.
+
+AIDEV-DECISION: A name claimed by two venues resolves to nothing rather than
+to an arbitrary one, and a fuzzy match must beat the runner-up venue; a wrong
+venue_id is worse than a missing one because it poisons downstream caches.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+_AMBIGUOUS = ""
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_SEGMENT = re.compile(r"[,(;]")
+_ROUTE = re.compile(r"→|->|^\s*from\s.+\sto\s", re.IGNORECASE)
+STOPWORDS = frozenset({"the", "a", "an", "of", "at", "and"})
+
+
+def exact_key(name: str) -> str:
+    """Casefold and collapse whitespace."""
+    return " ".join(name.casefold().split())
+
+
+def normalize_tokens(name: str) -> List[str]:
+    """Lowercase ASCII word tokens of name, without accents, punctuation or filler words."""
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    text = text.replace("&", " and ").replace("'", "")
+    return [token for token in _NON_WORD.split(text) if token and token not in STOPWORDS]
+
+
+def token_key(name: str) -> str:
+    return " ".join(sorted(set(normalize_tokens(name))))
+
+
+def _variants(name: str) -> List[str]:
+    """The name itself plus its leading segment, if it has one."""
+    head = _SEGMENT.split(name, 1)[0]
+    return [name, head] if head.strip() and head != name else [name]
+
+
+def trigrams(name: str) -> Set[str]:
+    text = f"  {' '.join(normalize_tokens(name))} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class VenueLookup:
+    """Exact, token and trigram indexes over venue names.
+
+    Args:
+        names: (venue_id, name) pairs; a venue contributes its canonical name
+            and each alias
+        min_score: Lowest Dice coefficient accepted for a fuzzy match
+    """
+
+    def __init__(self, names: Iterable[Tuple[str, str]], min_score: float = 0.7):
+        self.min_score = min_score
+        self.exact: Dict[str, str] = {}
+        self.tokens: Dict[str, str] = {}
+        self._names: List[Tuple[str, int]] = []  # (venue_id, trigram count)
+        self._grams: Dict[str, List[int]] = defaultdict(list)
+        self._memo: Dict[str, Optional[str]] = {}
+        for venue_id, name in names:
+            if not name or not name.strip():
+                continue
+            for variant in _variants(name):
+                self._claim(self.exact, exact_key(variant), venue_id)
+                key = token_key(variant)
+                if key:
+                    self._claim(self.tokens, key, venue_id)
+            grams = trigrams(name)
+            for gram in grams:
+                self._grams[gram].append(len(self._names))
+            self._names.append((venue_id, len(grams)))
+
+    @staticmethod
+    def _claim(index: Dict[str, str], key: str, venue_id: str) -> None:
+        if index.get(key, venue_id) != venue_id:
+            venue_id = _AMBIGUOUS
+        index[key] = venue_id
+
+    @classmethod
+    def from_venues(cls, venues: Mapping[str, Any], min_score: float = 0.7) -> "VenueLookup":
+        """Build a lookup from a venue mapping.
+
+        Lazy venue mappings are read from their index entries, so no venue
+        file is parsed.
+        """
+        names: List[Tuple[str, str]] = []
+        entry = getattr(venues, "entry", None)
+        for venue_id in venues:
+            if entry is not None:
+                record = entry(venue_id) or {}
+                canonical, aliases = record.get("canonical_name"), record.get("aliases") or []
+            else:
+                venue = venues[venue_id]
+                canonical, aliases = venue.canonical_name, venue.aliases
+            names.append((venue_id, canonical or ""))
+            names.extend((venue_id, alias) for alias in aliases)
+        return cls(names, min_score=min_score)
+
+    def resolve(self, text: Optional[str]) -> Optional[str]:
+        """Return the venue_id text refers to, or None if there is no confident match."""
+        if not text or _ROUTE.search(text):
+            # "A → B" or "From A to B" describes a journey, not a place
+            return None
+        try:
+            return self._memo[text]
+        except KeyError:
+            pass
+        queries = _variants(text)
+        venue_id = None
+        for match in (self._exact, self._token, self._fuzzy):
+            for query in queries:
+                venue_id = match(query)
+                if venue_id is not None:
+                    break
+            if venue_id is not None:
+                break
+        self._memo[text] = venue_id or None
+        return venue_id or None
+
+    def resolve_many(self, texts: Iterable[Optional[str]]) -> List[Optional[str]]:
+        return [self.resolve(text) for text in texts]
+
+    def _exact(self, query: str) -> Optional[str]:
+        return self.exact.get(exact_key(query))
+
+    def _token(self, query: str) -> Optional[str]:
+        return self.tokens.get(token_key(query))
+
+    def _fuzzy(self, query: str) -> Optional[str]:
+        grams = trigrams(query)
+        if len(grams) < 3:
+            return None
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for name_index in self._grams.get(gram, ()):
+                shared[name_index] += 1
+        best: Dict[str, float] = {}
+        for name_index, common in shared.items():
+            venue_id, size = self._names[name_index]
+            score = 2.0 * common / (len(grams) + size)
+            if score > best.get(venue_id, 0.0):
+                best[venue_id] = score
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        if not ranked or ranked[0][1] < self.min_score:
+            return None
+        if len(ranked) > 1 and ranked[1][1] == ranked[0][1]:
+            return _AMBIGUOUS
+        return ranked[0][0]
@@ -85,3 +85,70 @@ def test_cli_venues_create_success(tmp_path):
         assert data["canonical_name"] == "New Venue Name"
         assert data["address"] == "123 New St"
         assert data["kind"] == "restaurant"
+
+def test_cli_generate_all_people_matches_per_person_runs(tmp_path):
+    """--all-people output is identical to separate --person runs."""
+    single_dir = tmp_path / "single"
+    batch_dir = tmp_path / "batch"
+
+    assert main([
+        "generate", "--trip", "nz_2026", "--person", "diego",
+        "--format", "markdown", "--output-dir", str(single_dir),
+    ]) == 0
+    assert main([
+        "generate", "--trip", "nz_2026", "--all-people",
+        "--format", "markdown", "--output-dir", str(batch_dir),
+    ]) == 0
+
+    for slug in ["david", "diego", "john", "clara", "alex", "stephanie"]:
+        assert (batch_dir / "nz_2026" / slug / "output_0.md").exists()
+    assert (
+        (batch_dir / "nz_2026" / "diego" / "output_0.md").read_text()
+        == (single_dir / "nz_2026" / "diego" / "output_0.md").read_text()
+    )
+
+
+def _write_trip(trips_dir, name, duration="1h"):
+    events_dir = trips_dir / name / "events"
+    events_dir.mkdir(parents=True)
+    (events_dir / "day1.md").write_text(
+        "- date: 2024-01-01\n\n### Event: Walk\n- kind: activity\n"
+        f"- duration: {duration}\n"
+    )
+
+
+def test_cli_generate_all_builds_every_trip(tmp_path, capsys):
+    trips_dir = tmp_path / "trips"
+    _write_trip(trips_dir, "alpha")
+    _write_trip(trips_dir, "beta")
+    (trips_dir / "not_a_trip").mkdir()
+    output_dir = tmp_path / "output"
+
+    result = main([
+        "generate-all", "--trips-dir", str(trips_dir), "--jobs", "2",
+        "--format", "markdown", "--output-dir", str(output_dir),
+    ])
+
+    assert result == 0
+    assert (output_dir / "alpha" / "output_0.md").exists()
+    assert (output_dir / "beta" / "output_0.md").exists()
+    assert not (output_dir / "not_a_trip").exists()
+    out = capsys.readouterr().out
+    assert "alpha" in out and "beta" in out
+
+
+def test_cli_generate_all_fails_if_any_trip_fails(tmp_path, capsys):
+    trips_dir = tmp_path / "trips"
+    _write_trip(trips_dir, "good")
+    _write_trip(trips_dir, "bad", duration="soon")
+
+    result = main([
+        "generate-all", "--trips-dir", str(trips_dir),
+        "--format", "markdown", "--output-dir", str(tmp_path / "output"),
+    ])
+
+    assert result == 1
+    assert (tmp_path / "output" / "good" / "output_0.md").exists()
+    captured = capsys.readouterr()
+    assert "FAILED" in captured.out
+    assert "bad: Error:" in captured.err
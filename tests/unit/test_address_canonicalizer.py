@@ -0,0 +1,105 @@
+"""Tests for canonical route endpoints in Maps cache keys."""
+
+from unittest.mock import patch
+
+from itingen.core.base import BaseEmitter
+from itingen.core.domain.events import Event
+from itingen.core.domain.venues import Venue, VenueAddress
+from itingen.hydrators.maps import MapsHydrator
+from itingen.integrations.maps.canonical import AddressCanonicalizer
+from itingen.integrations.maps.google_maps import GoogleMapsClient
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+from itingen.providers.memory import InMemoryProvider
+
+
+def _venues():
+    venues = [
+        Venue(venue_id="hotel-indigo", canonical_name="Hotel Indigo Auckland", aliases=["Indigo"],
+              address="51 Albert Street, Auckland 1010"),
+        Venue(venue_id="te-papa", canonical_name="Te Papa",
+              address=VenueAddress(street="55 Cable Street", city="Wellington", country="New Zealand")),
+        Venue(venue_id="no-address", canonical_name="Secret Beach"),
+    ]
+    return {venue.venue_id: venue for venue in venues}
+
+
+def test_airport_spellings_share_one_key():
+    canonicalizer = AddressCanonicalizer()
+
+    for text in ("SJC", "sjc", "San Jose Airport (SJC)", "San Jose International Airport",
+                 "Norman Y. Mineta San José International Airport", "SJC Airport"):
+        assert canonicalizer.canonicalize(text) == "iata:sjc", text
+    assert canonicalizer.canonicalize("Auckland Airport (AKL)") == "iata:akl"
+    # Another place at or near an airport is not the airport
+    assert canonicalizer.canonicalize("AKL Airport rental car center") == "akl airport rental car center"
+    assert canonicalizer.canonicalize("San Jose Airport (SFO)") == "san jose airport sfo"
+    assert canonicalizer.canonicalize("Taupo") == "taupo"
+
+
+def test_venues_resolve_to_normalized_addresses_with_stats():
+    canonicalizer = AddressCanonicalizer(_venues())
+
+    assert canonicalizer.canonicalize("Hotel Indigo Auckland") == "51 albert street auckland 1010"
+    assert canonicalizer.canonicalize("Indigo") == "51 albert street auckland 1010"
+    assert canonicalizer.canonicalize("51 Albert  Street, AUCKLAND 1010") == "51 albert street auckland 1010"
+    assert canonicalizer.canonicalize("Te Papa") == "55 cable street wellington new zealand"
+    assert canonicalizer.canonicalize("Secret Beach") == "secret beach"
+    canonicalizer.canonicalize("Indigo")
+
+    stats = canonicalizer.stats
+    assert (stats.lookups, stats.venue_hits, stats.airport_hits) == (6, 4, 0)
+    assert stats.hit_rate == 4 / 6
+    assert (stats.distinct_texts, stats.distinct_keys, stats.keys_saved) == (5, 3, 2)
+
+
+@patch("itingen.integrations.maps.google_maps.googlemaps.Client")
+def test_client_keys_routes_by_canonical_endpoints(mock_googlemaps, tmp_path):
+    api = mock_googlemaps.return_value
+    api.distance_matrix.return_value = {"status": "OK", "rows": [{"elements": [{
+        "status": "OK", "duration": {"value": 600, "text": "10 mins"}, "distance": {"value": 9000, "text": "9 km"},
+    }]}]}
+    client = GoogleMapsClient(api_key="test-key", cache_dir=str(tmp_path),
+                              canonicalizer=AddressCanonicalizer(_venues()))
+    routes = [("SJC", "Hotel Indigo Auckland"), ("San Jose International Airport", "Indigo")]
+
+    results = client.get_routes(routes)
+
+    api.distance_matrix.assert_called_once_with(origins=["SJC"], destinations=["Hotel Indigo Auckland"], mode="driving")
+    assert results[routes[0]] == results[routes[1]]
+    assert client._get_cache_key(*routes[0], "driving") == client._get_cache_key(*routes[1], "driving")
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    assert client.get_directions("San Jose Airport (SJC)", "51 Albert Street, Auckland 1010")["duration_seconds"] == 600
+    api.directions.assert_not_called()
+
+
+class NullEmitter(BaseEmitter):
+    def emit(self, itinerary, output_path):
+        return output_path
+
+
+@patch("itingen.integrations.maps.google_maps.googlemaps.Client")
+def test_maps_hydrator_canonicalizes_with_trip_venues_and_reports_stats(mock_googlemaps, tmp_path):
+    mock_googlemaps.return_value.directions.return_value = [
+        {"legs": [{"duration": {"value": 600, "text": "10 mins"}, "distance": {"value": 9000, "text": "9 km"}}]}
+    ]
+    events = [
+        Event(kind="drive", travel_from="SJC", travel_to="Hotel Indigo Auckland"),
+        Event(kind="drive", travel_from="San Jose Airport (SJC)", travel_to="Indigo"),
+    ]
+    hydrator = MapsHydrator(api_key="test-key", cache_dir=str(tmp_path / "routes"))
+    orchestrator = PipelineOrchestrator(
+        InMemoryProvider(events, venues=_venues()), [hydrator], [NullEmitter()],
+        profile=True, profile_memory=False,
+    )
+
+    hydrated = orchestrator.execute(tmp_path)
+
+    mock_googlemaps.return_value.directions.assert_called_once()
+    assert [ev.duration_seconds for ev in hydrated] == [600, 600]
+    stats = orchestrator.trace.stages[-2].stats["route_canonicalization"]
+    assert (stats["hit_rate"], stats["distinct_texts"], stats["keys_saved"]) == (1.0, 4, 2)
+    assert "route_canonicalization: lookups=" in orchestrator.trace.format_table()
+    # A caller-configured canonicalizer is left alone
+    own = AddressCanonicalizer()
+    client = GoogleMapsClient(api_key="test-key", canonicalizer=own)
+    assert MapsHydrator(client=client).canonicalizer() is own
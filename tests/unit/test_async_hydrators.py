@@ -0,0 +1,165 @@
+"""Tests for async hydrators, async clients and PipelineOrchestrator.execute_async."""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from itingen.core.base import AsyncBaseHydrator, BaseEmitter, BaseHydrator, BaseProvider
+from itingen.core.domain.events import Event
+from itingen.hydrators.ai.narratives import AsyncNarrativeHydrator, NarrativeHydrator
+from itingen.hydrators.maps import AsyncMapsHydrator, MapsHydrator
+from itingen.integrations.ai.gemini import AsyncGeminiClient
+from itingen.integrations.concurrency import ServiceLimit
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+
+
+class StaticProvider(BaseProvider[Event]):
+    def __init__(self, events: List[Event]):
+        self.events = events
+
+    def get_events(self) -> List[Event]:
+        return list(self.events)
+
+    def get_venues(self) -> Dict[str, Any]:
+        return {}
+
+    def get_config(self) -> Dict[str, Any]:
+        return {}
+
+
+class SlowAsyncHydrator(AsyncBaseHydrator[Event]):
+    """Sleeps per event under a shared limit, recording peak concurrency."""
+
+    def __init__(self, limit: ServiceLimit, delay: float = 0.05):
+        self.limit = limit
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def hydrate_async(self, items: List[Event], context=None) -> List[Event]:
+        async def one(event: Event) -> Event:
+            async with self.limit:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(self.delay)
+                self.active -= 1
+            return event.model_copy(update={"slow": True})
+
+        return list(await asyncio.gather(*(one(ev) for ev in items)))
+
+
+class UpperHydrator(BaseHydrator[Event]):
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        return [ev.model_copy(update={"event_heading": ev.event_heading.upper()}) for ev in items]
+
+
+class ListEmitter(BaseEmitter[Event]):
+    def __init__(self):
+        self.items: List[Event] = []
+
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        self.items = itinerary
+        return output_path
+
+
+def _events(n: int) -> List[Event]:
+    return [Event(event_heading=f"event {i}", kind="drive", travel_from=f"A{i}", travel_to=f"B{i}") for i in range(n)]
+
+
+def test_execute_async_mixes_sync_and_async_hydrators_with_limit(tmp_path):
+    hydrator = SlowAsyncHydrator(ServiceLimit("slow", 3))
+    emitter = ListEmitter()
+    orchestrator = PipelineOrchestrator(
+        StaticProvider(_events(12)), hydrators=[UpperHydrator(), hydrator], emitters=[emitter]
+    )
+
+    start = time.perf_counter()
+    result = asyncio.run(orchestrator.execute_async(tmp_path))
+    elapsed = time.perf_counter() - start
+
+    assert [ev.event_heading for ev in result] == [f"EVENT {i}" for i in range(12)]
+    assert all(ev.slow for ev in result)
+    assert emitter.items == result
+    assert hydrator.peak == 3
+    # 12 events at 3 in flight: four rounds instead of twelve
+    assert elapsed < 12 * hydrator.delay
+
+
+def test_async_hydrator_runs_in_sync_pipeline(tmp_path):
+    hydrator = SlowAsyncHydrator(ServiceLimit("slow", 2), delay=0)
+    orchestrator = PipelineOrchestrator(StaticProvider(_events(3)), hydrators=[hydrator], emitters=[ListEmitter()])
+
+    # The same limit is reused across event loops
+    assert all(ev.slow for ev in orchestrator.execute(tmp_path))
+    assert all(ev.slow for ev in orchestrator.execute(tmp_path))
+
+
+def test_execute_async_wraps_hydrator_errors(tmp_path):
+    class Failing(AsyncBaseHydrator[Event]):
+        async def hydrate_async(self, items, context=None):
+            raise ValueError("boom")
+
+    orchestrator = PipelineOrchestrator(StaticProvider(_events(1)), hydrators=[Failing()], emitters=[ListEmitter()])
+    with pytest.raises(RuntimeError, match=r"Hydrator 0 \(Failing\) failed: boom"):
+        asyncio.run(orchestrator.execute_async(tmp_path))
+
+
+def test_async_maps_hydrator_matches_sync_output():
+    directions = lambda origin, destination, mode="driving": {
+        "duration_seconds": len(origin) * 60,
+        "duration_text": "mins",
+        "distance_text": "km",
+    }
+    events = _events(4) + [Event(event_heading="Dinner", kind="activity")]
+    with patch("itingen.hydrators.maps.GoogleMapsClient") as mock:
+        mock.return_value.get_directions.side_effect = directions
+        sync_result = MapsHydrator(api_key="test").hydrate(events)
+        async_result = AsyncMapsHydrator(api_key="test").hydrate(events)
+
+    assert async_result == sync_result
+
+
+def test_async_narrative_hydrator_uses_native_async_client(tmp_path):
+    sync_client = MagicMock()
+    sync_client.model = "test-model"
+    sync_client.client.aio.models.generate_content = AsyncMock(return_value=MagicMock(text="A story."))
+    client = AsyncGeminiClient(sync_client, max_concurrency=2)
+    events = [Event(event_heading=f"Visit {i}", kind="activity") for i in range(3)]
+
+    result = asyncio.run(AsyncNarrativeHydrator(client=client).hydrate_async(events))
+
+    assert [ev.narrative for ev in result] == ["A story."] * 3
+    assert sync_client.client.aio.models.generate_content.await_count == 3
+    assert isinstance(AsyncNarrativeHydrator(client=client), NarrativeHydrator)
+
+
+class RoutesClient:
+    """Stub client exposing only the batch API."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_routes(self, routes, mode="driving"):
+        self.calls.append(list(routes))
+        return {route: {"duration_seconds": len(route[0]) * 60, "duration_text": "mins", "distance_text": "km"}
+                for route in routes}
+
+
+def test_async_maps_hydrator_batch_mode_sync_and_async(tmp_path):
+    events = _events(3) + [Event(event_heading="Dinner", kind="activity")]
+
+    client = RoutesClient()
+    hydrated = AsyncMapsHydrator(client=client, batch=True).hydrate(events)
+    assert [getattr(ev, "duration_seconds", None) for ev in hydrated] == [120, 120, 120, None]
+    assert len(client.calls) == 1
+
+    client = RoutesClient()
+    orchestrator = PipelineOrchestrator(
+        StaticProvider(events), hydrators=[AsyncMapsHydrator(client=client, batch=True)], emitters=[ListEmitter()]
+    )
+    result = asyncio.run(orchestrator.execute_async(tmp_path))
+    assert result == hydrated
+    assert len(client.calls) == 1
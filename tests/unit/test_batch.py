@@ -0,0 +1,159 @@
+"""Tests for fan-out execution of per-person pipeline branches."""
+
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from itingen.core.base import BaseProvider, BaseHydrator, BaseEmitter
+from itingen.core.domain.events import Event
+from itingen.pipeline.batch import FanOutPipeline, PipelineBranch, people_slugs
+from itingen.pipeline.filtering import PersonFilter
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+
+
+class CountingProvider(BaseProvider[Event]):
+    def __init__(self):
+        self.loads = 0
+
+    def get_events(self) -> List[Event]:
+        self.loads += 1
+        return [
+            Event(event_heading="Breakfast", who=["alice", "bob"]),
+            Event(event_heading="Alice solo", who=["alice"]),
+            Event(event_heading="Everyone"),
+        ]
+
+    def get_venues(self) -> Dict[str, Any]:
+        return {}
+
+    def get_config(self) -> Dict[str, Any]:
+        return {"people": [{"name": "Alice", "slug": "alice"}, {"name": "Bob", "slug": "bob"}]}
+
+
+class TagHydrator(BaseHydrator[Event]):
+    def __init__(self):
+        self.calls = 0
+
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        self.calls += 1
+        return [ev.model_copy(update={"tag": "shared"}) for ev in items]
+
+
+class BusyHydrator(BaseHydrator[Event]):
+    """Burns CPU on its own thread and records how many branches ran at once."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        start = time.thread_time()
+        while time.thread_time() - start < 0.1:
+            pass
+        with cls.lock:
+            cls.active -= 1
+        return items
+
+
+class RecordingEmitter(BaseEmitter[Event]):
+    def __init__(self):
+        self.headings = None
+
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        self.headings = [e.event_heading for e in itinerary]
+        return output_path
+
+
+class FailingEmitter(BaseEmitter[Event]):
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        raise RuntimeError("disk full")
+
+
+def test_people_slugs_accepts_dicts_and_strings():
+    assert people_slugs({"people": [{"slug": "a"}, "b", {"name": "no slug"}]}) == ["a", "b"]
+    assert people_slugs({}) == []
+
+
+def test_fanout_loads_once_and_filters_per_branch(tmp_path):
+    provider = CountingProvider()
+    shared_hydrator = TagHydrator()
+    fanout = FanOutPipeline(PipelineOrchestrator(provider, [shared_hydrator]))
+
+    fanout.load(tmp_path)
+    emitters = {slug: RecordingEmitter() for slug in people_slugs(fanout.config)}
+    results = fanout.run([
+        PipelineBranch(slug, tmp_path / slug, [PersonFilter(slug)], [emitters[slug]])
+        for slug in emitters
+    ])
+
+    assert provider.loads == 1
+    assert shared_hydrator.calls == 1
+    assert emitters["alice"].headings == ["Breakfast", "Alice solo", "Everyone"]
+    assert emitters["bob"].headings == ["Breakfast", "Everyone"]
+    assert all(e.tag == "shared" for e in results["bob"])
+
+
+def test_fanout_reports_every_failed_branch(tmp_path):
+    fanout = FanOutPipeline(PipelineOrchestrator(CountingProvider()))
+    fanout.load(tmp_path)
+    ok = RecordingEmitter()
+
+    with pytest.raises(RuntimeError, match="a: .*disk full.*; c: .*disk full"):
+        fanout.run([
+            PipelineBranch("a", tmp_path / "a", emitters=[FailingEmitter()]),
+            PipelineBranch("b", tmp_path / "b", emitters=[ok]),
+            PipelineBranch("c", tmp_path / "c", emitters=[FailingEmitter()]),
+        ])
+    assert ok.headings is not None
+
+
+def test_run_requires_load(tmp_path):
+    fanout = FanOutPipeline(PipelineOrchestrator(CountingProvider()))
+    with pytest.raises(RuntimeError, match="load"):
+        fanout.run([PipelineBranch("a", tmp_path, emitters=[RecordingEmitter()])])
+
+
+def test_combined_trace_prefixes_branch_stages(tmp_path):
+    fanout = FanOutPipeline(PipelineOrchestrator(CountingProvider(), profile=True))
+    fanout.load(tmp_path)
+    fanout.run([PipelineBranch("alice", tmp_path / "alice", [PersonFilter("alice")], [RecordingEmitter()])])
+
+    names = [s.name for s in fanout.trace.stages]
+    assert "CountingProvider.get_events" in names
+    assert "alice/0.PersonFilter" in names
+    assert "alice/0.RecordingEmitter" in names
+
+
+def test_branch_cpu_time_excludes_other_branches(tmp_path):
+    base = PipelineOrchestrator(CountingProvider(), profile=True, profile_memory=False)
+    fanout = FanOutPipeline(base)
+    fanout.load(tmp_path)
+    fanout.run([
+        PipelineBranch(name, tmp_path / name, [BusyHydrator()], [RecordingEmitter()])
+        for name in ("a", "b")
+    ])
+
+    busy = [s for s in fanout.trace.stages if s.name.endswith("BusyHydrator")]
+    assert len(busy) == 2
+    assert all(0.1 <= s.cpu_seconds < 0.15 for s in busy)
+
+
+def test_cprofiled_branches_run_one_at_a_time(tmp_path):
+    BusyHydrator.peak = 0
+    fanout = FanOutPipeline(PipelineOrchestrator(
+        CountingProvider(), profile=True, profile_memory=False, cprofile_dir=tmp_path / "prof"
+    ))
+    fanout.load(tmp_path)
+    fanout.run([
+        PipelineBranch(name, tmp_path / name, [BusyHydrator()], [RecordingEmitter()])
+        for name in ("a", "b", "c")
+    ])
+
+    assert BusyHydrator.peak == 1
+    assert all(list((tmp_path / "prof" / name).glob("*.prof")) for name in ("a", "b", "c"))
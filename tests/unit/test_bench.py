@@ -0,0 +1,41 @@
+"""Tests for the synthetic trip generator and benchmark runner."""
+
+import json
+
+from itingen.bench.__main__ import main
+from itingen.bench.synthetic import SyntheticTripSpec, generate_trip
+from itingen.providers import FileProvider
+
+
+def test_generated_trip_parses_with_file_provider(tmp_path):
+    spec = SyntheticTripSpec(days=3, events_per_day=4, travelers=2, venues=5, seed=7)
+    generate_trip(tmp_path / "trip", spec)
+
+    provider = FileProvider(trip_dir=tmp_path / "trip")
+    events = provider.get_events()
+
+    assert len(events) == spec.total_events
+    assert len(provider.get_venues()) == 5
+    assert [p["slug"] for p in provider.get_config()["people"]] == ["traveler1", "traveler2"]
+    assert all(ev.venue_id in provider.get_venues() for ev in events)
+
+
+def test_generation_is_deterministic(tmp_path):
+    spec = SyntheticTripSpec(days=2, events_per_day=3, seed=42)
+    generate_trip(tmp_path / "a", spec)
+    generate_trip(tmp_path / "b", spec)
+
+    for day_file in sorted((tmp_path / "a" / "events").iterdir()):
+        assert day_file.read_text() == (tmp_path / "b" / "events" / day_file.name).read_text()
+
+
+def test_benchmark_cli_writes_stage_timings(tmp_path):
+    output = tmp_path / "bench.json"
+    assert main(["--sizes", "10,25", "--output", str(output), "--work-dir", str(tmp_path / "work")]) == 0
+
+    report = json.loads(output.read_text())
+    assert [entry["events"] for entry in report["results"]] == [10, 30]
+    names = {stage["name"] for stage in report["results"][0]["stages"]}
+    assert "LocalFileProvider.get_events" in names
+    assert "0.MarkdownEmitter" in names
+    assert any("NarrativeHydrator" in name for name in names)
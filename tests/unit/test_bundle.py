@@ -0,0 +1,54 @@
+"""Tests for compiled trip bundles and BundleProvider."""
+
+import pytest
+
+from itingen.bench.synthetic import SyntheticTripSpec, generate_trip
+from itingen.providers import BundleProvider, FileProvider
+from itingen.providers.bundle import MAGIC, compile_trip
+
+
+@pytest.fixture
+def trip(tmp_path):
+    trip_dir = generate_trip(tmp_path / "trip", SyntheticTripSpec(days=3, events_per_day=4, seed=2))
+    day = trip_dir / "events" / "2026-01-01.md"
+    day.write_text(day.read_text() + "### Event: Ferry – Ōtāutahi\n- hard_stop: yes\n- who:\n- duration: 2h\n")
+    (trip_dir / "config.yaml").write_text((trip_dir / "config.yaml").read_text() + "start: 2026-01-01\nratio: 0.5\n")
+    return trip_dir
+
+
+def test_bundle_round_trips_events_venues_and_config(trip, tmp_path):
+    stats = compile_trip(trip, tmp_path / "trip.itb")
+    files, bundle = FileProvider(trip), BundleProvider(tmp_path / "trip.itb")
+
+    assert stats["events"] == 13
+    assert bundle.get_events() == files.get_events()
+    assert bundle.get_venues() == files.get_venues()
+    assert bundle.get_config() == {**files.get_config(), "start": "2026-01-01"}
+
+
+def test_events_are_decoded_on_access(trip, tmp_path):
+    compile_trip(trip, tmp_path / "trip.itb")
+    expected = FileProvider(trip).get_events()
+    bundle = BundleProvider(tmp_path / "trip.itb")
+
+    assert len(bundle.events) == 13
+    assert bundle.events[-1] == expected[-1]
+    assert bundle.events[2:4] == expected[2:4]
+    ferry = bundle.events[4]
+    assert ferry.event_heading == "Ferry – Ōtāutahi"
+    assert ferry.hard_stop is True and ferry.who == [] and ferry.duration_seconds == 7200
+    # Decoded events are independent objects
+    assert bundle.events[0] is not bundle.events[0]
+    assert list(bundle.iter_events()) == expected
+    with pytest.raises(IndexError):
+        bundle.events[13]
+
+
+def test_invalid_bundles_are_rejected(tmp_path):
+    (tmp_path / "junk.itb").write_bytes(b"not a bundle at all, definitely not" * 4)
+    with pytest.raises(ValueError, match="Not a trip bundle"):
+        BundleProvider(tmp_path / "junk.itb")
+
+    (tmp_path / "future.itb").write_bytes(MAGIC + (99).to_bytes(4, "little") + bytes(60))
+    with pytest.raises(ValueError, match="version 99"):
+        BundleProvider(tmp_path / "future.itb")
@@ -0,0 +1,106 @@
+"""Tests for per-stage checkpoints and resume-after-failure."""
+
+import asyncio
+import gzip
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from itingen.core.base import BaseEmitter, BaseHydrator, BaseProvider
+from itingen.core.domain.events import Event
+from itingen.pipeline.checkpoints import CHECKPOINT_DIR_NAME
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+
+
+class StaticProvider(BaseProvider[Event]):
+    def __init__(self, events: List[Event]):
+        self.events = events
+
+    def get_events(self) -> List[Event]:
+        return list(self.events)
+
+    def get_venues(self) -> Dict[str, Any]:
+        return {}
+
+    def get_config(self) -> Dict[str, Any]:
+        return {}
+
+
+class TagHydrator(BaseHydrator[Event]):
+    def __init__(self, field: str, fail: bool = False):
+        self.field = field
+        self.fail = fail
+        self._calls = 0
+
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        self._calls += 1
+        if self.fail:
+            raise ConnectionError("transient")
+        return [ev.model_copy(update={self.field: f"{self.field}:{ev.event_heading}"}) for ev in items]
+
+
+class FlakyEmitter(BaseEmitter[Event]):
+    def __init__(self, fail: bool):
+        self.fail = fail
+        self.items: List[Event] = []
+
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        if self.fail:
+            raise OSError("disk full")
+        self.items = itinerary
+        return output_path
+
+
+def _pipeline(events, hydrators, emitter, **kwargs) -> PipelineOrchestrator:
+    return PipelineOrchestrator(StaticProvider(events), hydrators=hydrators, emitters=[emitter], **kwargs)
+
+
+def test_resume_after_late_hydrator_failure_skips_completed_stages(tmp_path):
+    events = [Event(event_heading="Hike"), Event(event_heading="Dinner")]
+    first, second = TagHydrator("a"), TagHydrator("b", fail=True)
+    with pytest.raises(RuntimeError, match="Hydrator 1"):
+        _pipeline(events, [first, second], FlakyEmitter(False), checkpoint=True).execute(tmp_path)
+
+    manifest = json.loads((tmp_path / CHECKPOINT_DIR_NAME / "manifest.json").read_text())
+    assert list(manifest["stages"]) == ["0"]
+    with gzip.open(tmp_path / CHECKPOINT_DIR_NAME / "00.json.gz", "rt") as f:
+        assert [ev["a"] for ev in json.load(f)] == ["a:Hike", "a:Dinner"]
+
+    first, second, emitter = TagHydrator("a"), TagHydrator("b"), FlakyEmitter(False)
+    orchestrator = _pipeline(events, [first, second], emitter, resume=True)
+    result = orchestrator.execute(tmp_path)
+
+    assert orchestrator.resumed_after == 0
+    assert first._calls == 0 and second._calls == 1
+    assert [(ev.a, ev.b) for ev in result] == [("a:Hike", "b:Hike"), ("a:Dinner", "b:Dinner")]
+    assert emitter.items == result
+
+
+def test_resume_after_emitter_failure_skips_all_hydrators(tmp_path):
+    events = [Event(event_heading="Hike")]
+    with pytest.raises(RuntimeError, match="disk full"):
+        _pipeline(events, [TagHydrator("a")], FlakyEmitter(True), checkpoint=True).execute(tmp_path)
+
+    hydrator = TagHydrator("a")
+    result = asyncio.run(_pipeline(events, [hydrator], FlakyEmitter(False), resume=True).execute_async(tmp_path))
+
+    assert hydrator._calls == 0
+    assert result[0].a == "a:Hike"
+
+
+def test_changed_inputs_or_config_invalidate_checkpoints(tmp_path):
+    events = [Event(event_heading="Hike")]
+    _pipeline(events, [TagHydrator("a"), TagHydrator("b")], FlakyEmitter(False), checkpoint=True).execute(tmp_path)
+
+    # A different second stage keeps the first checkpoint only
+    orchestrator = _pipeline(events, [TagHydrator("a"), TagHydrator("c")], FlakyEmitter(False), resume=True)
+    orchestrator.execute(tmp_path)
+    assert orchestrator.resumed_after == 0
+
+    # Edited source events invalidate everything
+    hydrator = TagHydrator("a")
+    orchestrator = _pipeline([Event(event_heading="Swim")], [hydrator], FlakyEmitter(False), resume=True)
+    assert orchestrator.execute(tmp_path)[0].a == "a:Swim"
+    assert orchestrator.resumed_after is None
+    assert hydrator._calls == 1
@@ -31,6 +31,15 @@ def test_cli_generate_basic(mock_provider_cls, mock_orchestrator_cls, capsys):
     mock_orchestrator.execute.assert_called_once()
 
 
+@patch("itingen.cli.FanOutPipeline")
+def test_cli_generate_rejects_stream_with_all_people(mock_fanout_cls, capsys):
+    result = main(["generate", "--trip", "nz_2026", "--all-people", "--stream"])
+
+    assert result == 1
+    assert "--stream cannot be combined with --all-people" in capsys.readouterr().err
+    mock_fanout_cls.assert_not_called()
+
+
 @patch("itingen.cli.DayBannerGenerator")
 @patch("itingen.cli.GeminiClient")
 @patch("itingen.cli.PDFEmitter")
@@ -110,3 +119,16 @@ def test_cli_exports_day_banner_generator_symbol():
     from itingen import cli
 
     assert hasattr(cli, "DayBannerGenerator")
+
+
+def test_discover_trips_requires_events_or_config(tmp_path):
+    from itingen.cli import discover_trips
+
+    (tmp_path / "b_trip" / "events").mkdir(parents=True)
+    (tmp_path / "a_trip").mkdir()
+    (tmp_path / "a_trip" / "config.yaml").write_text("trip_name: A\n")
+    (tmp_path / "scratch").mkdir()
+    (tmp_path / "README.md").write_text("not a trip")
+
+    assert [p.name for p in discover_trips(tmp_path)] == ["a_trip", "b_trip"]
+    assert discover_trips(tmp_path / "missing") == []
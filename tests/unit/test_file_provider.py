@@ -96,3 +96,41 @@ def test_local_file_provider_load_venues(trip_dir):
 def test_local_file_provider_invalid_dir():
     with pytest.raises(ValueError, match="Trip directory not found"):
         LocalFileProvider("/non/existent/path")
+
+
+def test_local_file_provider_parallel_parse_matches_serial(tmp_path):
+    """Test that parsing on a process pool returns the serial result in order."""
+    from itingen.bench.synthetic import SyntheticTripSpec, generate_trip
+
+    trip = generate_trip(tmp_path / "trip", SyntheticTripSpec(days=6, events_per_day=3, seed=3))
+
+    serial = LocalFileProvider(trip).get_events()
+    parallel = LocalFileProvider(trip, workers=3).get_events()
+
+    assert parallel == serial
+    assert [ev.event_heading for ev in parallel] == [ev.event_heading for ev in serial]
+
+
+def test_local_file_provider_parallel_parse_surfaces_errors(trip_dir):
+    """Test that a malformed day file fails the parallel load like a serial one."""
+    with open(trip_dir / "events" / "2025-12-30.md", "w") as f:
+        f.write("### Event: Broken\n- duration: soon\n")
+
+    with pytest.raises(ValueError, match="Invalid duration in event 'Broken'"):
+        LocalFileProvider(trip_dir, workers=2).get_events()
+
+
+def test_local_file_provider_create_event_override_applies_with_workers(tmp_path):
+    """Test that a subclass _create_event is used even when workers are requested."""
+    from itingen.bench.synthetic import SyntheticTripSpec, generate_trip
+
+    trip = generate_trip(tmp_path / "trip", SyntheticTripSpec(days=4, events_per_day=2, seed=5))
+
+    class TaggingProvider(LocalFileProvider):
+        def _create_event(self, lines, header, metadata):
+            event = super()._create_event(lines, header, metadata)
+            return event.model_copy(update={"tagged": True})
+
+    for workers in (None, 2):
+        events = TaggingProvider(trip, workers=workers).get_events()
+        assert events and all(ev.tagged for ev in events)
@@ -2,7 +2,7 @@ import json
 import pytest
 from unittest.mock import patch, mock_open, MagicMock
 from pathlib import Path
-from itingen.integrations.maps.google_maps import GoogleMapsClient
+from itingen.integrations.maps.google_maps import GoogleMapsClient, plan_matrix_batches
 
 
 class TestGoogleMapsClient:
@@ -12,7 +12,7 @@ class TestGoogleMapsClient:
     def test_init_with_api_key_only(self, mock_googlemaps):
         """Initialize with API key only (no cache)."""
         client = GoogleMapsClient(api_key="test-key")
-        mock_googlemaps.assert_called_once_with(key="test-key")
+        mock_googlemaps.assert_called_once_with(key="test-key", retry_over_query_limit=False)
         assert client.client is not None
         assert client.cache_dir is None
 
@@ -189,3 +189,61 @@ class TestGoogleMapsClient:
             # The exists() check should be called with the cache file path
             # Note: We can't easily test the exact Path construction without
             # more complex mocking, but the logic is verified by integration tests
+
+
+def _matrix_response(origins, destinations, mode="driving"):
+    """Fake Distance Matrix response: one minute per character of the route."""
+    rows = []
+    for origin in origins:
+        elements = []
+        for destination in destinations:
+            if destination == "Nowhere":
+                elements.append({"status": "ZERO_RESULTS"})
+                continue
+            minutes = len(origin) + len(destination)
+            elements.append({
+                "status": "OK",
+                "duration": {"value": minutes * 60, "text": f"{minutes} mins"},
+                "distance": {"value": minutes * 1000, "text": f"{minutes} km"},
+            })
+        rows.append({"elements": elements})
+    return {"status": "OK", "rows": rows}
+
+
+def test_plan_matrix_batches_respects_limits():
+    routes = [(f"origin-{i}", f"dest-{j}") for i in range(30) for j in range(i % 3, i % 3 + 2)]
+    routes += [("hub", f"spoke-{j}") for j in range(60)]
+
+    batches = plan_matrix_batches(routes)
+
+    covered = {(o, d) for origins, destinations in batches for o in origins for d in destinations}
+    assert set(routes) <= covered
+    for origins, destinations in batches:
+        assert len(origins) <= 25 and len(destinations) <= 25
+        assert len(origins) * len(destinations) <= 100
+    assert len(batches) < len(set(routes)) / 10
+
+
+@patch("itingen.integrations.maps.google_maps.googlemaps.Client")
+def test_get_routes_batches_misses_and_fills_route_cache(mock_googlemaps, tmp_path):
+    api = mock_googlemaps.return_value
+    api.distance_matrix.side_effect = _matrix_response
+    client = GoogleMapsClient(api_key="test-key", cache_dir=str(tmp_path))
+    routes = [("AKL", "Hotel"), ("Hotel", "AKL"), ("AKL", "Hotel"), ("AKL", "Nowhere")]
+
+    results = client.get_routes(routes)
+
+    assert api.distance_matrix.call_count == 1
+    api.directions.assert_not_called()
+    assert results[("AKL", "Hotel")]["duration_seconds"] == 8 * 60
+    assert results[("Hotel", "AKL")]["distance_text"] == "8 km"
+    assert results[("AKL", "Nowhere")] is None
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+    # The per-route cache now answers both the batch and the single-route API
+    assert client.get_directions("Hotel", "AKL") == results[("Hotel", "AKL")]
+    assert client.get_routes([("AKL", "Hotel"), ("Hotel", "AKL")]) == {
+        ("AKL", "Hotel"): results[("AKL", "Hotel")],
+        ("Hotel", "AKL"): results[("Hotel", "AKL")],
+    }
+    assert api.distance_matrix.call_count == 1
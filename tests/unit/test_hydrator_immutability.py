@@ -247,3 +247,29 @@ class TestHydratorImmutability:
             assert result.banner_image_path == str(expected_path)
             assert day.banner_image_path is None
             assert day is not result
+
+    def test_patch_segment_immutability(self):
+        from itingen.pipeline.patches import PatchSegment
+        from itingen.pipeline.timing import WrapUpHydrator
+        from itingen.pipeline.annotations import EmotionalAnnotationHydrator
+        from itingen.pipeline.transitions_logic import TransitionHydrator
+        from itingen.pipeline.transitions import TransitionRegistry
+
+        e1 = Event(kind="drive", location="A", time_local="2023-01-01 09:00")
+        e2 = Event(kind="activity", location="B", time_local="2023-01-01 11:00")
+        events = [e1, e2]
+
+        segment = PatchSegment([
+            WrapUpHydrator(),
+            EmotionalAnnotationHydrator(),
+            TransitionHydrator(TransitionRegistry()),
+        ])
+        results = segment.hydrate(events)
+
+        assert results[0].wrap_up_time == "11:00"
+        assert results[0].emotional_triggers is not None
+        assert results[1].transition_from_prev == "Move from A to B."
+        assert not hasattr(e1, "wrap_up_time"), "Original event should not be mutated"
+        assert e2.transition_from_prev is None
+        assert results[0] is not e1 and results[1] is not e2
+        assert results is not events
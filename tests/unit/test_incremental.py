@@ -0,0 +1,136 @@
+"""Tests for day-windowed incremental hydration and watch mode."""
+
+import argparse
+import os
+import shutil
+from pathlib import Path
+from typing import List
+
+from itingen.cli import _hydrator_chain
+from itingen.core.base import BaseEmitter, BaseHydrator, PipelineContext
+from itingen.core.domain.events import Event
+from itingen.pipeline.annotations import EmotionalAnnotationHydrator
+from itingen.pipeline.incremental import IncrementalHydration, split_chain
+from itingen.pipeline.normalization import TimeNormalizationHydrator
+from itingen.pipeline.sorting import ChronologicalSorter
+from itingen.pipeline.timing import WrapUpHydrator
+from itingen.pipeline.watch import WatchSession
+from itingen.providers.file_provider import LocalFileProvider
+
+
+class PositionHydrator(BaseHydrator[Event]):
+    """Records each event's neighbours, like wrap-up and transition logic."""
+
+    neighbour_window = 1
+
+    def __init__(self):
+        self.seen = 0
+
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        self.seen += len(items)
+        out = []
+        for i, ev in enumerate(items):
+            nxt = items[i + 1].event_heading if i + 1 < len(items) else None
+            out.append(ev.model_copy(update={"next_heading": nxt}))
+        return out
+
+
+class CollectingEmitter(BaseEmitter[Event]):
+    def __init__(self):
+        self.runs: List[List[Event]] = []
+
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        self.runs.append(itinerary)
+        return output_path
+
+
+def _day(date: str, n: int) -> List[Event]:
+    return [Event(event_heading=f"{date} #{i}", date=date) for i in range(n)]
+
+
+def test_split_chain_separates_list_level_prefix():
+    sorter, wrap = ChronologicalSorter(), WrapUpHydrator()
+    assert split_chain([sorter, wrap]) == ([sorter], [wrap], [])
+    # A leading item-scoped stage joins the prefix instead of splitting it off
+    normalizer, annotations = TimeNormalizationHydrator(), EmotionalAnnotationHydrator()
+    chain = [normalizer, sorter, wrap, annotations]
+    assert split_chain(chain) == ([normalizer, sorter], [wrap, annotations], [])
+    assert split_chain([annotations, wrap]) == ([], [annotations, wrap], [])
+
+
+def test_incremental_matches_full_run_and_reuses_unchanged_days():
+    days = [_day(f"2026-01-0{d}", 3) for d in range(1, 6)]
+    events = [ev for day in days for ev in day]
+    hydrator = PositionHydrator()
+    incremental = IncrementalHydration([ChronologicalSorter(), hydrator])
+
+    first = incremental.run(events)
+    assert first == PositionHydrator().hydrate(events)
+    assert incremental.segments_recomputed == 5
+
+    # Edit the last event of day 3: only day 4 sees it through its halo
+    days[2] = days[2][:2] + [Event(event_heading="edited", date="2026-01-03")]
+    edited = [ev for day in days for ev in day]
+    hydrator.seen = 0
+    second = incremental.run(edited)
+
+    assert second == PositionHydrator().hydrate(edited)
+    assert incremental.segments_reused == 3
+    assert incremental.segments_recomputed == 2
+    assert hydrator.seen < len(edited)
+
+
+def test_watch_session_reparses_only_changed_day_files(tmp_path):
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+    for date in ("2026-01-01", "2026-01-02", "2026-01-03", "2026-01-04"):
+        (events_dir / f"{date}.md").write_text(f"- date: {date}\n\n### Event: Walk {date}\n- kind: activity\n")
+
+    provider = LocalFileProvider(tmp_path)
+    parsed = []
+    original = provider.parse_day_file
+    provider.parse_day_file = lambda path: parsed.append(os.path.basename(path)) or original(path)
+    emitter = CollectingEmitter()
+    session = WatchSession(provider, [ChronologicalSorter(), PositionHydrator()], [emitter], tmp_path / "out")
+
+    first = session.refresh()
+    assert first.affected_dates == ["2026-01-01", "2026-01-02", "2026-01-03", "2026-01-04"]
+    assert session.refresh() is None
+
+    parsed.clear()
+    day_file = events_dir / "2026-01-04.md"
+    day_file.write_text("- date: 2026-01-04\n\n### Event: Swim\n- kind: activity\n")
+    os.utime(day_file, ns=(0, 1))
+    update = session.refresh()
+
+    assert parsed == ["2026-01-04.md"]
+    assert update.changed_files == [str(day_file)]
+    assert update.affected_dates == ["2026-01-03", "2026-01-04"]
+    assert update.days_reused == 2
+    assert [ev.event_heading for ev in emitter.runs[-1]][-1] == "Swim"
+    assert emitter.runs[-1][-2].next_heading == "Swim"
+
+
+def test_watch_with_cli_chain_recomputes_only_the_edited_days(tmp_path):
+    trip = tmp_path / "nz_2026"
+    shutil.copytree(Path(__file__).parents[2] / "trips" / "nz_2026", trip)
+    args = argparse.Namespace(person=None, ai_transitions=False)
+    emitter = CollectingEmitter()
+    hydrators = _hydrator_chain(args, tmp_path / "cache", {})
+    session = WatchSession(LocalFileProvider(trip), hydrators, [emitter], tmp_path / "out")
+    session.refresh()
+
+    day_file = trip / "events" / "2026-01-02.md"
+    text = day_file.read_text().replace("### Event: Breakfast", "### Event: Early breakfast")
+    day_file.write_text(text)
+    os.utime(day_file, ns=(0, 1))
+    update = session.refresh()
+
+    assert update.affected_dates == ["2026-01-01", "2026-01-02", "2026-01-03"]
+    assert update.days_recomputed == 3
+    provider = LocalFileProvider(trip)
+    context = PipelineContext(venues=provider.get_venues(), config=provider.get_config())
+    expected = provider.get_events()
+    for hydrator in _hydrator_chain(args, tmp_path / "cache", {}):
+        expected = hydrator.hydrate(expected, context)
+    assert emitter.runs[-1] == expected
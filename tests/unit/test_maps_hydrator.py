@@ -81,3 +81,24 @@ def test_maps_hydrator_bubbles_exceptions(mock_google_maps_client):
     
     with pytest.raises(Exception, match="API Error"):
         hydrator.hydrate([event])
+
+
+def test_maps_hydrator_batch_mode_resolves_unique_routes_once(mock_google_maps_client):
+    result = {"duration_seconds": 1800, "duration_text": "30 mins", "distance_text": "15 km"}
+    mock_google_maps_client.get_routes.return_value = {("Airport", "Hotel"): result, ("Hotel", "Airport"): None}
+    events = [
+        Event(kind="drive", travel_from="Airport", travel_to="Hotel"),
+        Event(kind="activity", location="Museum"),
+        Event(kind="drive", travel_from="Hotel", travel_to="Airport"),
+        Event(kind="drive", travel_from="Airport", travel_to="Hotel", description="Again"),
+    ]
+
+    hydrated = MapsHydrator(api_key="fake-key", batch=True).hydrate(events)
+
+    mock_google_maps_client.get_routes.assert_called_once_with(
+        [("Airport", "Hotel"), ("Hotel", "Airport")], mode="driving"
+    )
+    mock_google_maps_client.get_directions.assert_not_called()
+    assert hydrated[0].duration_seconds == 1800
+    assert hydrated[1] is events[1] and hydrated[2] is events[2]
+    assert hydrated[3].duration_seconds == 1800 and hydrated[3].description == "Again"
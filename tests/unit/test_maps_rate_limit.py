@@ -0,0 +1,198 @@
+"""Tests for rate-limited, concurrent Google Maps lookups against a fake server."""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import googlemaps
+import pytest
+
+from itingen.integrations.concurrency import QuotaExceededError, RateLimiter, call_with_backoff
+from itingen.integrations.maps.google_maps import GoogleMapsClient, is_transient_error
+from itingen.integrations.maps.route_cache import SqliteRouteCache
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeMapsServer(ThreadingHTTPServer):
+    """Serves /maps/api/directions/json, failing the first calls per route on request."""
+
+    daemon_threads = True
+
+    def __init__(self, delay=0.0, failures=None):
+        super().__init__(("127.0.0.1", 0), FakeMapsHandler)
+        self.delay = delay
+        self.failures = dict(failures or {})  # origin -> list of (http status, api status)
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeMapsHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        query = parse_qs(urlparse(self.path).query)
+        origin, destination = query["origin"][0], query["destination"][0]
+        with server.lock:
+            server.requests.append((origin, destination))
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            pending = server.failures.get(origin)
+            http_status, api_status = pending.pop(0) if pending else (200, "OK")
+        time.sleep(server.delay)
+        minutes = len(origin) + len(destination)
+        body = {"status": api_status, "routes": []}
+        if api_status == "OK":
+            body["routes"] = [{"legs": [{
+                "duration": {"value": minutes * 60, "text": f"{minutes} mins"},
+                "distance": {"value": minutes * 1000, "text": f"{minutes} km"},
+            }]}]
+        payload = json.dumps(body).encode()
+        with server.lock:
+            server.active -= 1
+        self.send_response(http_status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@contextmanager
+def fake_maps_server(**kwargs):
+    server = FakeMapsServer(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_rate_limiter_paces_bursts_and_enforces_daily_cap():
+    fake = FakeTime()
+    limiter = RateLimiter("maps", qps=2, burst=2, daily_cap=5, clock=fake.clock, sleep=fake.sleep)
+
+    for _ in range(4):
+        limiter.acquire()
+    # Two calls ride the burst, the next two wait for refills at 2 per second
+    assert fake.sleeps == [0.5, 0.5]
+
+    limiter.acquire()
+    with pytest.raises(QuotaExceededError):
+        limiter.acquire()
+    assert limiter.used_today == 5
+
+    fake.now += 86400 + 60
+    limiter.acquire()
+    assert limiter.used_today == 1
+
+
+def test_rate_limiter_daily_cap_is_a_rolling_window():
+    fake = FakeTime()
+    limiter = RateLimiter("maps", qps=100, daily_cap=5, clock=fake.clock, sleep=fake.sleep)
+    for _ in range(3):
+        limiter.acquire()
+    fake.now = 12 * 3600
+    limiter.acquire()
+    limiter.acquire()
+
+    # A day after the first burst only those three calls have aged out
+    fake.now = 86400 + 60
+    for _ in range(3):
+        limiter.acquire()
+    with pytest.raises(QuotaExceededError):
+        limiter.acquire()
+    assert limiter.used_today == 5
+
+
+def test_backoff_retries_only_transient_errors(monkeypatch):
+    delays = []
+    monkeypatch.setattr("itingen.integrations.concurrency.random.random", lambda: 0.5)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise googlemaps.exceptions.HTTPError(503)
+        return "ok"
+
+    assert call_with_backoff(flaky, is_transient_error, base_delay=1.0, sleep=delays.append) == "ok"
+    assert delays == [1.0, 2.0]
+
+    def denied():
+        raise googlemaps.exceptions.ApiError("REQUEST_DENIED")
+
+    with pytest.raises(googlemaps.exceptions.ApiError):
+        call_with_backoff(denied, is_transient_error, sleep=delays.append)
+    assert delays == [1.0, 2.0]
+
+
+def test_concurrent_lookups_dedupe_in_flight_and_retry_against_fake_server(tmp_path):
+    failures = {"Ferry": [(429, "OK"), (200, "OVER_QUERY_LIMIT")]}
+    with fake_maps_server(delay=0.05, failures=failures) as server:
+        limiter = RateLimiter("google_maps", qps=1000)
+        client = GoogleMapsClient(
+            api_key="AIza-fake", cache_dir=str(tmp_path), limiter=limiter,
+            max_workers=4, backoff_base=0.001, base_url=server.url,
+        )
+        routes = [("AKL", "Hotel"), ("Hotel", "Ferry"), ("Ferry", "AKL"), ("Hotel", "Museum"), ("AKL", "Hotel")]
+
+        # Eight callers asking for the same cold route make one request
+        with ThreadPoolExecutor(8) as pool:
+            same = list(pool.map(lambda _: client.get_directions("AKL", "Hotel"), range(8)))
+        assert server.requests == [("AKL", "Hotel")]
+        assert all(result == same[0] for result in same)
+
+        results = client.get_directions_many(routes)
+        client.close()
+
+    assert results[("Ferry", "AKL")]["duration_seconds"] == 8 * 60
+    assert results[("Hotel", "Museum")]["distance_text"] == "11 km"
+    # The cached route was not refetched; the Ferry leg took two retries
+    assert sorted(server.requests[1:]) == [("Ferry", "AKL")] * 3 + [("Hotel", "Ferry"), ("Hotel", "Museum")]
+    assert server.peak > 1
+    assert limiter.used_today == 6
+    assert len(list(tmp_path.glob("*.json"))) == 4
+
+
+def test_concurrent_cold_lookups_fill_sqlite_cache(tmp_path):
+    def directions(origin, destination, mode):
+        time.sleep(0.001)
+        return [{"legs": [{"duration": {"value": 60, "text": "1 min"}, "distance": {"value": 1000, "text": "1 km"}}]}]
+
+    cache = SqliteRouteCache(tmp_path / "routes.db")
+    with patch("itingen.integrations.maps.google_maps.googlemaps.Client") as mock_googlemaps:
+        mock_googlemaps.return_value.directions.side_effect = directions
+        client = GoogleMapsClient(api_key="test-key", cache=cache, max_workers=8)
+        routes = [(f"origin-{n}", f"destination-{n}") for n in range(200)]
+
+        results = client.get_directions_many(routes)
+        client.close()
+
+    assert all(results[route]["duration_seconds"] == 60 for route in routes)
+    assert len(cache) == 200
@@ -0,0 +1,144 @@
+"""Tests for stage-level memoization in the pipeline orchestrator."""
+
+from typing import Any, Dict, List
+
+from itingen.core.base import BaseProvider, BaseHydrator, BaseEmitter, PipelineContext
+from itingen.core.domain.events import Event
+from itingen.pipeline.memoization import StageCache, fingerprint_context
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+
+
+class StaticProvider(BaseProvider[Event]):
+    def __init__(self, events: List[Event]):
+        self.events = events
+
+    def get_events(self) -> List[Event]:
+        return list(self.events)
+
+    def get_venues(self) -> Dict[str, Any]:
+        return {}
+
+    def get_config(self) -> Dict[str, Any]:
+        return {"trip_name": "Test"}
+
+
+class ListHydrator(BaseHydrator[Event]):
+    """Look-behind hydrator: output depends on the whole list."""
+
+    def __init__(self, label: str = "prev"):
+        self.label = label
+        self._calls = 0
+
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        self._calls += 1
+        new_items = []
+        prev = None
+        for ev in items:
+            new_items.append(ev.model_copy(update={"prev_heading": f"{self.label}:{prev}"}))
+            prev = ev.event_heading
+        return new_items
+
+
+class ItemHydrator(BaseHydrator[Event]):
+    """Per-item hydrator that records which events it was asked to enrich."""
+
+    memo_scope = "item"
+
+    def __init__(self):
+        self._seen: List[str] = []
+
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        self._seen.extend(ev.event_heading for ev in items)
+        return [ev.model_copy(update={"narrative": f"Story of {ev.event_heading}"}) for ev in items]
+
+
+class NullEmitter(BaseEmitter[Event]):
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        return output_path
+
+
+def _events(*headings: str) -> List[Event]:
+    return [Event(event_heading=h, description=f"About {h}") for h in headings]
+
+
+def test_list_scope_hit_skips_hydrator(tmp_path):
+    cache = StageCache(tmp_path)
+    hydrator = ListHydrator()
+    items = _events("A", "B")
+
+    first = cache.run(0, hydrator, items, None, "ctx")
+    second = cache.run(0, hydrator, _events("A", "B"), None, "ctx")
+
+    assert hydrator._calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert [e.prev_heading for e in second] == [e.prev_heading for e in first]
+
+
+def test_list_scope_miss_on_input_change(tmp_path):
+    cache = StageCache(tmp_path)
+    hydrator = ListHydrator()
+
+    cache.run(0, hydrator, _events("A", "B"), None, "ctx")
+    result = cache.run(0, hydrator, _events("A", "C"), None, "ctx")
+
+    assert hydrator._calls == 2
+    assert result[1].prev_heading == "prev:A"
+
+
+def test_config_change_invalidates_stage(tmp_path):
+    cache = StageCache(tmp_path)
+
+    cache.run(0, ListHydrator(label="x"), _events("A"), None, "ctx")
+    result = cache.run(0, ListHydrator(label="y"), _events("A"), None, "ctx")
+
+    assert cache.misses == 2
+    assert result[0].prev_heading == "y:None"
+
+
+def test_item_scope_recomputes_only_changed_items(tmp_path):
+    cache = StageCache(tmp_path)
+    cache.run(0, ItemHydrator(), _events("A", "B", "C"), None, "ctx")
+
+    hydrator = ItemHydrator()
+    result = cache.run(0, hydrator, _events("A", "B2", "C"), None, "ctx")
+
+    assert hydrator._seen == ["B2"]
+    assert [e.narrative for e in result] == ["Story of A", "Story of B2", "Story of C"]
+
+
+def test_unsupported_inputs_bypass_cache():
+    assert not StageCache.supports(ItemHydrator(), [])
+    assert not StageCache.supports(ItemHydrator(), [{"not": "a model"}])
+
+
+def test_context_fingerprint_ignores_venue_metadata():
+    from itingen.core.domain.venues import Venue
+
+    ctx1 = PipelineContext(venues={"v": Venue(venue_id="v", canonical_name="V")}, config={})
+    ctx2 = PipelineContext(venues={"v": Venue(venue_id="v", canonical_name="V")}, config={})
+    assert fingerprint_context(ctx1) == fingerprint_context(ctx2)
+
+
+def test_orchestrator_memoize_reuses_outputs(tmp_path):
+    provider = StaticProvider(_events("A", "B"))
+
+    first = PipelineOrchestrator(provider, [ListHydrator(), ItemHydrator()], [NullEmitter()], memoize=True)
+    first_result = first.execute(output_dir=tmp_path)
+    assert (tmp_path / ".stage_cache").exists()
+
+    list_hydrator, item_hydrator = ListHydrator(), ItemHydrator()
+    second = PipelineOrchestrator(provider, [list_hydrator, item_hydrator], [NullEmitter()], memoize=True)
+    second_result = second.execute(output_dir=tmp_path)
+
+    assert list_hydrator._calls == 0
+    assert item_hydrator._seen == []
+    assert second.stage_cache.misses == 0
+    assert [e.model_dump() for e in second_result] == [e.model_dump() for e in first_result]
+
+
+def test_orchestrator_without_memoize_writes_no_cache(tmp_path):
+    orchestrator = PipelineOrchestrator(StaticProvider(_events("A")), [ListHydrator()], [NullEmitter()])
+    orchestrator.execute(output_dir=tmp_path)
+
+    assert orchestrator.stage_cache is None
+    assert not (tmp_path / ".stage_cache").exists()
@@ -0,0 +1,124 @@
+"""Tests for offline travel-time estimates."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from itingen.core.base import PipelineContext
+from itingen.core.domain.events import Event
+from itingen.core.domain.venues import Venue
+from itingen.hydrators.maps import AsyncMapsHydrator, MapsHydrator
+from itingen.integrations.maps.offline import (
+    OfflineTravelEstimator,
+    SpeedProfile,
+    distance_matrix,
+    format_distance,
+    format_duration,
+    haversine_km,
+    parse_distance_km,
+)
+from itingen.integrations.maps.route_cache import SqliteRouteCache
+
+POINTS = {
+    "hotel": ("Hotel Indigo Auckland", "Auckland", {"lat": -36.8485, "lng": 174.7633}),
+    "piha": ("Piha Beach", "Auckland", [-36.9540, 174.4710]),
+    "matakana": ("Matakana Village", "Auckland", "-36.3520,174.7180"),
+    "huka": ("Huka Falls", "Waikato", {"latitude": -38.6490, "longitude": 176.0900}),
+    "taupo": ("Taupo Lakefront", "Waikato", {"lat": -38.6857, "lon": 176.0702}),
+    "secret": ("Secret Beach", "Auckland", None),
+}
+
+
+def _venues():
+    return {
+        venue_id: Venue(venue_id=venue_id, canonical_name=name,
+                        location={"region": region, "country": "New Zealand", "coordinates": coordinates})
+        for venue_id, (name, region, coordinates) in POINTS.items()
+    }
+
+
+def test_distances_and_maps_style_text():
+    # SFO to LAX is about 543 km great-circle
+    assert haversine_km((37.6213, -122.3790), (33.9416, -118.4085)) == pytest.approx(543, rel=0.01)
+    table = distance_matrix([(0.0, 0.0), (10.0, 10.0)], [(0.0, 0.0), (10.0, 10.0), (0.0, 1.0)])
+    assert table[0][0] == 0 and table[0][1] == pytest.approx(table[1][0])
+    assert table[0][2] == pytest.approx(111.2, rel=0.001)
+
+    assert [parse_distance_km(text) for text in ("15.2 km", "1,204 km", "350 m", "10 mi")] == pytest.approx(
+        [15.2, 1204.0, 0.35, 16.09344])
+    assert parse_distance_km("far") is None
+    assert [format_duration(s) for s in (20, 1500, 3900, 7260)] == ["1 min", "25 mins", "1 hour 5 mins", "2 hours 1 min"]
+    assert [format_distance(km) for km in (0.347, 15.24, 1204.4)] == ["350 m", "15.2 km", "1,204 km"]
+
+
+def test_estimates_and_calibration_from_route_cache(tmp_path):
+    estimator = OfflineTravelEstimator(_venues(), places={"Auckland CBD": (-36.8485, 174.7633)})
+    routes = [("Hotel Indigo Auckland", "Piha Beach"), ("Piha Beach", "AKL"), ("Hotel Indigo Auckland", "Secret Beach"),
+              ("Auckland CBD", "Matakana Village"), ("Huka Falls", "Taupo Lakefront")]
+
+    results = estimator.get_routes(routes)
+    assert results[("Hotel Indigo Auckland", "Secret Beach")] is None
+    assert results[("Auckland CBD", "Matakana Village")]["estimated"] is True
+    piha = results[("Hotel Indigo Auckland", "Piha Beach")]
+    expected = SpeedProfile(1.3, 60.0, 120.0).seconds(haversine_km((-36.8485, 174.7633), (-36.9540, 174.4710)))
+    assert piha["duration_seconds"] == round(expected)
+    assert estimator.get_directions("Piha Beach", "AKL")["duration_seconds"] > 0
+
+    # Routes Google answered earlier, driven at a detour of 1.5 and 45 km/h
+    # plus 5 minutes in Auckland, and at 1.2 and 90 km/h in Waikato
+    truth = {"Auckland": SpeedProfile(1.5, 45.0, 300.0), "Waikato": SpeedProfile(1.2, 90.0, 0.0)}
+    cache = SqliteRouteCache(tmp_path / "routes.db")
+    pairs = [("hotel", "piha"), ("piha", "matakana"), ("matakana", "hotel"), ("huka", "taupo"), ("taupo", "huka"),
+             ("hotel", "huka"), ("hotel", "secret")]
+    for n, (a, b) in enumerate(pairs):
+        (origin, region, _), (destination, _, _) = POINTS[a], POINTS[b]
+        located = [estimator.locate(origin), estimator.locate(destination)]
+        geodesic = haversine_km(located[0][0], located[1][0]) if all(located) else 10.0
+        profile = truth[region]
+        cache.put(str(n), {"origin": origin, "destination": destination, "mode": "driving",
+                           "duration_seconds": round(profile.seconds(geodesic)),
+                           "distance_text": f"{geodesic * profile.detour_factor:.1f} km"})
+
+    assert estimator.calibrate(data for _, data in cache.items()) == 6
+    auckland = estimator.profile("Auckland", "driving")
+    assert auckland.detour_factor == pytest.approx(1.5, rel=0.01)
+    assert auckland.speed_kmh == pytest.approx(45, rel=0.02)
+    assert auckland.overhead_seconds == pytest.approx(300, abs=15)
+    # Waikato has too few routes for its own profile; it gets the pooled fit
+    assert ("Waikato", "driving") not in estimator.profiles
+    assert estimator.profile("Waikato", "driving") == estimator.profiles[(None, "driving")]
+
+
+def test_maps_hydrator_offline_backend_without_api_key(monkeypatch, tmp_path):
+    monkeypatch.delenv("GOOGLE_MAPS_API_KEY", raising=False)
+    events = [
+        Event(kind="drive", travel_from="Hotel Indigo", travel_to="Piha Beach"),
+        Event(kind="drive", travel_from="Hotel Indigo", travel_to="Secret Beach"),
+        Event(kind="activity", location="Piha Beach"),
+    ]
+    context = PipelineContext(venues=_venues(), config={})
+
+    with patch("itingen.hydrators.maps.GoogleMapsClient", side_effect=AssertionError("no API client")):
+        hydrator = MapsHydrator(cache_dir=str(tmp_path), backend="auto")
+        hydrated = hydrator.hydrate(events, context)
+
+    assert hydrator.backend == "offline"
+    assert hydrator.cache_config()["backend"] == "offline"
+    assert hydrated[0].duration_seconds > 0 and hydrated[0].distance_text.endswith("km")
+    assert hydrated[0].description == "Drive from Hotel Indigo to Piha Beach"
+    assert hydrated[1] is events[1] and hydrated[2] is events[2]
+    with pytest.raises(ValueError, match="Unknown maps backend"):
+        MapsHydrator(backend="carrier-pigeon")
+
+
+def test_async_maps_hydrator_offline_backend(monkeypatch, tmp_path):
+    monkeypatch.delenv("GOOGLE_MAPS_API_KEY", raising=False)
+    events = [Event(kind="drive", travel_from="Hotel Indigo", travel_to="Piha Beach")]
+    context = PipelineContext(venues=_venues(), config={})
+    expected = MapsHydrator(backend="offline").hydrate(events, context)
+
+    hydrator = AsyncMapsHydrator(backend="auto")
+    assert hydrator.backend == "offline" and hydrator.async_client is None
+    assert hydrator.hydrate(events, context) == expected
+    assert asyncio.run(hydrator.hydrate_async(events, context)) == expected
@@ -0,0 +1,114 @@
+"""Tests for the orchestrator's parallel emitter mode."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from itingen.core.base import BaseProvider, BaseEmitter
+from itingen.core.domain.events import Event
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+
+
+class StaticProvider(BaseProvider[Event]):
+    def get_events(self) -> List[Event]:
+        return [Event(event_heading="A"), Event(event_heading="B")]
+
+    def get_venues(self) -> Dict[str, Any]:
+        return {}
+
+    def get_config(self) -> Dict[str, Any]:
+        return {}
+
+
+class PidEmitter(BaseEmitter[Event]):
+    """Writes the emitting process id and event count to a file."""
+
+    execution = "process"
+
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        path = Path(output_path).with_suffix(".txt")
+        path.write_text(f"{os.getpid()} {len(itinerary)}")
+        return str(path)
+
+
+class BarrierEmitter(BaseEmitter[Event]):
+    def __init__(self, barrier: threading.Barrier):
+        self.barrier = barrier
+        self.count = None
+
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        self.barrier.wait(timeout=5)
+        self.count = len(itinerary)
+        return output_path
+
+
+class UnpicklableProcessEmitter(BaseEmitter[Event]):
+    execution = "process"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.thread_id = None
+
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        self.thread_id = threading.get_ident()
+        return output_path
+
+
+class FailingEmitter(BaseEmitter[Event]):
+    def __init__(self, message: str):
+        self.message = message
+
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        raise RuntimeError(self.message)
+
+
+def test_invalid_emitter_mode_rejected():
+    with pytest.raises(ValueError, match="Unknown emitter_mode"):
+        PipelineOrchestrator(StaticProvider(), emitter_mode="bogus")
+
+
+def test_thread_emitters_run_concurrently(tmp_path):
+    barrier = threading.Barrier(2)
+    emitters = [BarrierEmitter(barrier), BarrierEmitter(barrier)]
+
+    PipelineOrchestrator(StaticProvider(), emitters=emitters, emitter_mode="parallel").execute(tmp_path)
+
+    assert [e.count for e in emitters] == [2, 2]
+
+
+def test_process_emitter_runs_in_worker_process(tmp_path):
+    orchestrator = PipelineOrchestrator(StaticProvider(), emitters=[PidEmitter()], emitter_mode="parallel")
+    orchestrator.execute(tmp_path)
+
+    pid, count = (tmp_path / "output_0.txt").read_text().split()
+    assert int(pid) != os.getpid()
+    assert int(count) == 2
+
+
+def test_unpicklable_process_emitter_falls_back_to_thread(tmp_path):
+    emitter = UnpicklableProcessEmitter()
+    PipelineOrchestrator(StaticProvider(), emitters=[emitter], emitter_mode="parallel").execute(tmp_path)
+
+    assert emitter.thread_id is not None
+
+
+def test_failures_reported_per_emitter(tmp_path):
+    barrier = threading.Barrier(1)
+    ok = BarrierEmitter(barrier)
+    orchestrator = PipelineOrchestrator(
+        StaticProvider(),
+        emitters=[FailingEmitter("first"), ok, FailingEmitter("second")],
+        emitter_mode="parallel",
+    )
+
+    with pytest.raises(RuntimeError) as exc_info:
+        orchestrator.execute(tmp_path)
+
+    message = str(exc_info.value)
+    assert "Emitter 0 (FailingEmitter) failed: first" in message
+    assert "Emitter 2 (FailingEmitter) failed: second" in message
+    # Successful emitters still complete
+    assert ok.count == 2
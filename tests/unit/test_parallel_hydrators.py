@@ -0,0 +1,131 @@
+"""Tests for concurrent execution of independent hydrators."""
+
+import threading
+from typing import List
+
+import pytest
+
+from itingen.core.base import BaseHydrator
+from itingen.core.domain.events import Event
+from itingen.pipeline.parallel import ParallelHydrators, changed_fields
+from itingen.pipeline.sorting import ChronologicalSorter
+
+
+class FieldHydrator(BaseHydrator[Event]):
+    """Sets a single field on every event, optionally waiting on a barrier."""
+
+    memo_scope = "item"
+
+    def __init__(self, field: str, value, barrier: threading.Barrier = None):
+        self.field = field
+        self.value = value
+        self.barrier = barrier
+
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        if self.barrier is not None:
+            # Deadlocks (and times out) unless all members run concurrently
+            self.barrier.wait(timeout=5)
+        return [ev.model_copy(update={self.field: self.value}) for ev in items]
+
+
+class DroppingHydrator(BaseHydrator[Event]):
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        return items[:-1]
+
+
+class FailingHydrator(BaseHydrator[Event]):
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        raise RuntimeError("boom")
+
+
+@pytest.fixture
+def events():
+    return [Event(event_heading="A"), Event(event_heading="B")]
+
+
+def test_members_run_concurrently_and_merge(events):
+    barrier = threading.Barrier(2)
+    group = ParallelHydrators([
+        FieldHydrator("narrative", "story", barrier),
+        FieldHydrator("weather_conditions", "Sunny", barrier),
+    ])
+
+    result = group.hydrate(events)
+
+    assert [e.narrative for e in result] == ["story", "story"]
+    assert [e.weather_conditions for e in result] == ["Sunny", "Sunny"]
+    # Inputs are not mutated
+    assert events[0].narrative is None
+
+
+def test_untouched_events_are_passed_through(events):
+    class OnlyFirst(BaseHydrator[Event]):
+        def hydrate(self, items, context=None):
+            return [items[0].model_copy(update={"narrative": "x"})] + items[1:]
+
+    result = ParallelHydrators([OnlyFirst()]).hydrate(events)
+
+    assert result[1] is events[1]
+
+
+def test_conflicting_writes_raise(events):
+    group = ParallelHydrators([
+        FieldHydrator("narrative", "one"),
+        FieldHydrator("narrative", "two"),
+    ])
+
+    with pytest.raises(ValueError, match="narrative"):
+        group.hydrate(events)
+
+
+def test_identical_writes_are_not_conflicts(events):
+    group = ParallelHydrators([
+        FieldHydrator("narrative", "same"),
+        FieldHydrator("narrative", "same"),
+    ])
+
+    assert [e.narrative for e in group.hydrate(events)] == ["same", "same"]
+
+
+def test_length_change_is_rejected(events):
+    with pytest.raises(ValueError, match="must not add, drop or reorder"):
+        ParallelHydrators([DroppingHydrator()]).hydrate(events)
+
+
+def test_reordering_is_rejected(events):
+    class Reversing(BaseHydrator[Event]):
+        def hydrate(self, items, context=None):
+            return list(reversed(items))
+
+    with pytest.raises(ValueError, match="returned input item 1 at position 0"):
+        ParallelHydrators([FieldHydrator("narrative", "x"), Reversing()]).hydrate(events)
+    with pytest.raises(ValueError, match="ChronologicalSorter reorders items"):
+        ParallelHydrators([ChronologicalSorter()])
+
+
+def test_member_failure_names_hydrator(events):
+    with pytest.raises(RuntimeError, match="FailingHydrator failed: boom"):
+        ParallelHydrators([FieldHydrator("narrative", "x"), FailingHydrator()]).hydrate(events)
+
+
+def test_memo_scope_follows_members():
+    assert ParallelHydrators([FieldHydrator("narrative", "x")]).memo_scope == "item"
+    assert ParallelHydrators([FieldHydrator("narrative", "x"), DroppingHydrator()]).memo_scope == "list"
+
+
+def test_changed_fields_includes_extras():
+    before = Event(event_heading="A")
+    after = before.model_copy(update={"weather_temp_high": 70, "event_heading": "A"})
+
+    assert changed_fields(before, after) == {"weather_temp_high": 70}
+
+
+def test_orchestrator_add_parallel_hydrators(events):
+    from itingen.pipeline.orchestrator import PipelineOrchestrator
+
+    orchestrator = PipelineOrchestrator(provider=None)
+    result = orchestrator.add_parallel_hydrators([FieldHydrator("narrative", "x")], max_workers=2)
+
+    assert result is orchestrator
+    assert isinstance(orchestrator.hydrators[0], ParallelHydrators)
+    assert orchestrator.hydrators[0].max_workers == 2
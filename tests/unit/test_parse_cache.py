@@ -0,0 +1,78 @@
+"""Tests for the FileProvider parse cache."""
+
+import json
+import os
+
+import pytest
+
+from itingen.bench.synthetic import SyntheticTripSpec, generate_trip
+from itingen.providers import parse_cache
+from itingen.providers.file_provider import LocalFileProvider
+
+
+@pytest.fixture
+def trip(tmp_path):
+    return generate_trip(tmp_path / "trip", SyntheticTripSpec(days=3, events_per_day=2, venues=4))
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    original = LocalFileProvider.parse_day_file
+
+    def counting(self, path):
+        calls.append(os.path.basename(path))
+        return original(self, path)
+
+    monkeypatch.setattr(LocalFileProvider, "parse_day_file", counting)
+    return calls
+
+
+def _load(trip, cache_dir):
+    provider = LocalFileProvider(trip, cache_dir=cache_dir)
+    return provider, provider.get_events(), provider.get_venues()
+
+
+def test_unchanged_trip_loads_entirely_from_cache(trip, tmp_path, parse_calls):
+    _, events, venues = _load(trip, tmp_path / "cache")
+    assert len(parse_calls) == 3
+
+    parse_calls.clear()
+    provider, cached_events, cached_venues = _load(trip, tmp_path / "cache")
+
+    assert parse_calls == []
+    assert cached_events == events
+    assert cached_venues == venues
+    assert provider.cache.misses == 0
+
+
+def test_only_edited_files_are_reparsed(trip, tmp_path, parse_calls):
+    _load(trip, tmp_path / "cache")
+    day_files = sorted((trip / "events").iterdir())
+    day_files[1].write_text(day_files[1].read_text().replace("Synthetic", "Edited"))
+    # Touched but unchanged: same size, new mtime, same content hash
+    os.utime(day_files[2], ns=(0, 0))
+    day_files[0].unlink()
+
+    parse_calls.clear()
+    _, events, _ = _load(trip, tmp_path / "cache")
+
+    assert parse_calls == [day_files[1].name]
+    assert len(events) == 4
+    assert all(ev.description.startswith("Edited") for ev in events[:2])
+    manifest = json.loads((tmp_path / "cache" / parse_cache.MANIFEST_NAME).read_text())
+    assert f"events/{day_files[0].name}" not in manifest["files"]
+
+
+def test_parser_version_change_invalidates_cache(trip, tmp_path, parse_calls, monkeypatch):
+    _load(trip, tmp_path / "cache")
+
+    monkeypatch.setattr(parse_cache, "PARSER_VERSION", parse_cache.PARSER_VERSION + 1)
+    parse_cache.schema_fingerprint.cache_clear()
+    parse_calls.clear()
+    try:
+        _load(trip, tmp_path / "cache")
+    finally:
+        parse_cache.schema_fingerprint.cache_clear()
+
+    assert len(parse_calls) == 3
@@ -0,0 +1,106 @@
+"""Tests for patch-based hydrators and their coalesced execution."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from itingen.core.base import BaseEmitter, BaseHydrator, BaseProvider, PatchHydrator
+from itingen.core.domain.events import Event
+from itingen.pipeline.annotations import EmotionalAnnotationHydrator
+from itingen.pipeline.nz_transitions import create_nz_transition_registry
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+from itingen.pipeline.patches import PatchedView, PatchSegment, coalesce
+from itingen.pipeline.sorting import ChronologicalSorter
+from itingen.pipeline.timing import WrapUpHydrator
+from itingen.pipeline.transitions_logic import TransitionHydrator
+
+
+class StaticProvider(BaseProvider[Event]):
+    def __init__(self, events: List[Event]):
+        self.events = events
+
+    def get_events(self) -> List[Event]:
+        return list(self.events)
+
+    def get_venues(self) -> Dict[str, Any]:
+        return {}
+
+    def get_config(self) -> Dict[str, Any]:
+        return {}
+
+
+class NullEmitter(BaseEmitter[Event]):
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        return output_path
+
+
+class ShoutHydrator(PatchHydrator[Event]):
+    """Reads the field written by the previous member."""
+
+    def compute_patches(self, items, context=None):
+        return [{"shout": (getattr(ev, "wrap_up_time", None) or "none").upper()} for ev in items]
+
+
+class FailingPatchHydrator(PatchHydrator[Event]):
+    def compute_patches(self, items, context=None):
+        raise ValueError("boom")
+
+
+def _trip() -> List[Event]:
+    return [
+        Event(event_heading="Drive", kind="drive", location="Auckland", time_local="2026-01-01 09:00"),
+        Event(event_heading="Ferry", kind="ferry", location="Waiheke", time_local="2026-01-01 12:00"),
+        Event(event_heading="Lunch", kind="meal", location="Oneroa", time_local="2026-01-01 13:30"),
+    ]
+
+
+def _chain() -> List[BaseHydrator[Event]]:
+    return [WrapUpHydrator(), EmotionalAnnotationHydrator(), TransitionHydrator(create_nz_transition_registry())]
+
+
+def test_segment_matches_sequential_hydration_and_copies_each_event_once():
+    events = _trip()
+    expected = events
+    for hydrator in _chain():
+        expected = hydrator.hydrate(expected)
+
+    result = PatchSegment(_chain()).hydrate(events)
+
+    assert [ev.model_dump() for ev in result] == [ev.model_dump() for ev in expected]
+    assert all(type(ev) is Event for ev in result)
+
+
+def test_later_members_see_earlier_patches():
+    result = PatchSegment([WrapUpHydrator(), ShoutHydrator()]).hydrate(_trip())
+    assert [ev.shout for ev in result] == ["12:00", "13:30", "NONE"]
+
+
+def test_patched_view_is_read_only():
+    view = PatchedView(Event(event_heading="Walk"), {"kind": "activity"})
+    assert view.kind == "activity" and view.event_heading == "Walk"
+    with pytest.raises(AttributeError):
+        view.kind = "drive"
+
+
+def test_coalesce_groups_only_runs_of_patch_hydrators():
+    sorter = ChronologicalSorter()
+    stages = coalesce([sorter, *_chain()])
+    assert stages[0] == (0, 0, sorter)
+    first, last, segment = stages[1]
+    assert (first, last) == (1, 3) and isinstance(segment, PatchSegment)
+    assert segment.neighbour_window == 2
+
+
+def test_orchestrator_runs_segment_as_one_stage(tmp_path):
+    orchestrator = PipelineOrchestrator(
+        StaticProvider(_trip()), hydrators=[ChronologicalSorter(), *_chain()], emitters=[NullEmitter()], profile=True
+    )
+    orchestrator.execute(tmp_path)
+    names = [stage.name for stage in orchestrator.trace.stages if stage.kind == "hydrator"]
+    assert names == ["0.ChronologicalSorter", "1.WrapUpHydrator+EmotionalAnnotationHydrator+TransitionHydrator"]
+
+    failing = PipelineOrchestrator(
+        StaticProvider(_trip()), hydrators=[WrapUpHydrator(), FailingPatchHydrator()], emitters=[NullEmitter()]
+    )
+    with pytest.raises(RuntimeError, match=r"Hydrator 0 \(WrapUpHydrator\+FailingPatchHydrator\) failed: FailingPatchHydrator failed: boom"):
+        failing.execute(tmp_path)
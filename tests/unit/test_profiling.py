@@ -0,0 +1,132 @@
+"""Tests for per-stage pipeline profiling."""
+
+import json
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from itingen.core.base import BaseProvider, BaseHydrator, BaseEmitter
+from itingen.core.domain.events import Event
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+from itingen.pipeline.profiling import StageProfiler
+
+
+class StaticProvider(BaseProvider[Event]):
+    def get_events(self) -> List[Event]:
+        return [Event(event_heading="A"), Event(event_heading="B"), Event(event_heading="C")]
+
+    def get_venues(self) -> Dict[str, Any]:
+        return {}
+
+    def get_config(self) -> Dict[str, Any]:
+        return {}
+
+
+class DropFirst(BaseHydrator[Event]):
+    def hydrate(self, items: List[Event], context=None) -> List[Event]:
+        return items[1:]
+
+
+class NullEmitter(BaseEmitter[Event]):
+    def emit(self, itinerary: List[Event], output_path: str) -> str:
+        return output_path
+
+
+def test_stage_records_timing_and_items():
+    profiler = StageProfiler()
+    profiler.start()
+    try:
+        with profiler.stage("hydrator", "work", items_in=3) as record:
+            data = [bytearray(1024) for _ in range(100)]
+            record.items_out = len(data)
+    finally:
+        profiler.stop()
+
+    (stage,) = profiler.trace.stages
+    assert stage.kind == "hydrator"
+    assert (stage.items_in, stage.items_out) == (3, 100)
+    assert stage.wall_seconds >= 0
+    assert stage.peak_memory_bytes >= 100 * 1024
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = StageProfiler(enabled=False)
+    with profiler.stage("hydrator", "work"):
+        pass
+    assert profiler.trace.stages == []
+
+
+def test_failed_stage_is_recorded():
+    profiler = StageProfiler(trace_memory=False)
+    with pytest.raises(ValueError):
+        with profiler.stage("emitter", "broken"):
+            raise ValueError("nope")
+
+    assert profiler.trace.stages[0].error == "ValueError: nope"
+
+
+def test_cprofile_dump_per_stage(tmp_path):
+    profiler = StageProfiler(trace_memory=False, cprofile_dir=tmp_path)
+    with profiler.stage("hydrator", "0.Sorter"):
+        sorted(range(1000), reverse=True)
+
+    path = profiler.trace.stages[0].cprofile_path
+    assert path.endswith("00_hydrator_0.Sorter.prof")
+    assert (tmp_path / "00_hydrator_0.Sorter.prof").exists()
+
+
+def test_orchestrator_trace_covers_every_stage(tmp_path):
+    orchestrator = PipelineOrchestrator(StaticProvider(), [DropFirst()], [NullEmitter()], profile=True)
+    orchestrator.execute(output_dir=tmp_path)
+
+    names = [(s.kind, s.name) for s in orchestrator.trace.stages]
+    assert names == [
+        ("provider", "StaticProvider.get_events"),
+        ("provider", "StaticProvider.get_venues"),
+        ("provider", "StaticProvider.get_config"),
+        ("hydrator", "0.DropFirst"),
+        ("emitter", "0.NullEmitter"),
+    ]
+    hydrator_stage = orchestrator.trace.stages[3]
+    assert (hydrator_stage.items_in, hydrator_stage.items_out) == (3, 2)
+
+    trace_path = orchestrator.trace.write_json(tmp_path / "trace.json")
+    data = json.loads(trace_path.read_text())
+    assert len(data["stages"]) == 5
+    assert "total_wall_seconds" in data
+
+
+def test_orchestrator_without_profile_has_no_trace(tmp_path):
+    orchestrator = PipelineOrchestrator(StaticProvider(), [DropFirst()], [NullEmitter()])
+    orchestrator.execute(output_dir=tmp_path)
+    assert orchestrator.trace is None
+
+
+def test_parallel_emitters_are_traced(tmp_path):
+    orchestrator = PipelineOrchestrator(
+        StaticProvider(), emitters=[NullEmitter(), NullEmitter()], emitter_mode="parallel", profile=True
+    )
+    orchestrator.execute(output_dir=tmp_path)
+
+    emitter_stages = [s for s in orchestrator.trace.stages if s.kind == "emitter"]
+    assert [s.name for s in emitter_stages] == ["0.NullEmitter", "1.NullEmitter"]
+
+
+def test_total_wall_time_is_elapsed_not_summed(tmp_path):
+    class SlowEmitter(BaseEmitter[Event]):
+        def emit(self, itinerary: List[Event], output_path: str) -> str:
+            time.sleep(0.1)
+            return output_path
+
+    orchestrator = PipelineOrchestrator(
+        StaticProvider(), emitters=[SlowEmitter(), SlowEmitter(), SlowEmitter()], emitter_mode="parallel", profile=True
+    )
+    orchestrator.execute(output_dir=tmp_path)
+
+    trace = orchestrator.trace
+    assert trace.summed_stage_seconds >= 0.3
+    # The three emitters overlap, so the run takes about one emitter's time
+    assert trace.total_wall_seconds < trace.summed_stage_seconds - 0.1
+    assert trace.to_dict()["total_wall_seconds"] == trace.total_wall_seconds
+    assert "total (elapsed)" in trace.format_table()
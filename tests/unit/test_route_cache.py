@@ -0,0 +1,93 @@
+"""Tests for the route cache backends."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from itingen.integrations.maps.google_maps import GoogleMapsClient
+from itingen.integrations.maps.route_cache import (
+    JsonDirRouteCache,
+    SqliteRouteCache,
+    migrate_json_dir,
+    open_route_cache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _route(n):
+    return {"duration_seconds": n * 60, "duration_text": f"{n} mins", "distance_text": f"{n} km"}
+
+
+def test_sqlite_cache_expires_entries_per_ttl(tmp_path):
+    clock = FakeClock()
+    cache = SqliteRouteCache(tmp_path / "routes.db", ttl=100, clock=clock)
+    cache.put_many({"a": _route(1), "b": _route(2)})
+    cache.put("forever", _route(3), ttl=10_000)
+
+    assert cache.get_many(["a", "b", "forever", "missing"]) == {"a": _route(1), "b": _route(2), "forever": _route(3)}
+
+    clock.now += 101
+    assert cache.get("a") is None
+    assert cache.get_many(["a", "b", "forever"]) == {"forever": _route(3)}
+    assert cache.compact() == 2
+    assert len(cache) == 1
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path):
+    clock = FakeClock()
+    cache = SqliteRouteCache(tmp_path / "routes.db", max_entries=3, clock=clock)
+    for n, key in enumerate(["a", "b", "c"]):
+        clock.now += 1
+        cache.put(key, _route(n))
+
+    clock.now += 1
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    clock.now += 1
+    cache.put("d", _route(4))
+
+    assert len(cache) == 3
+    assert set(cache.get_many(["a", "b", "c", "d"])) == {"a", "c", "d"}
+
+
+def test_migrate_json_dir_and_client_bulk_lookup(tmp_path):
+    json_dir = tmp_path / "maps"
+    json_dir.mkdir()
+    legacy = JsonDirRouteCache(json_dir)
+    with patch("itingen.integrations.maps.google_maps.googlemaps.Client"):
+        client = GoogleMapsClient(api_key="test-key", cache=legacy)
+        routes = [("AKL", "Hotel"), ("Hotel", "Ferry"), ("Ferry", "AKL")]
+        for n, (origin, destination) in enumerate(routes):
+            legacy.put(client._get_cache_key(origin, destination, "driving"),
+                       dict(_route(n), origin=origin, destination=destination, mode="driving"))
+        (json_dir / "broken.json").write_text("{not json")
+
+        cache = open_route_cache(tmp_path / "routes.sqlite")
+        assert isinstance(cache, SqliteRouteCache)
+        assert migrate_json_dir(json_dir, cache) == 3
+
+        client = GoogleMapsClient(api_key="test-key", cache=cache)
+        with patch.object(cache, "get", side_effect=AssertionError("per-route read")):
+            results = client.get_routes(routes)
+        assert [results[route]["duration_seconds"] for route in routes] == [0, 60, 120]
+        client.client.distance_matrix.assert_not_called()
+
+
+def test_sqlite_cache_is_safe_to_share_between_threads(tmp_path):
+    cache = SqliteRouteCache(tmp_path / "routes.db", max_entries=150)
+
+    def work(worker):
+        for n in range(40):
+            key = f"{worker}-{n}"
+            cache.put(key, _route(n))
+            cache.get_many([key, f"{worker}-{n - 1}"])
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(work, range(8)))
+
+    assert len(cache) == 150
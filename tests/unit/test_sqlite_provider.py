@@ -0,0 +1,65 @@
+"""Tests for the SQLite trip provider and its import/export tool."""
+
+import filecmp
+
+import pytest
+
+from itingen.bench.synthetic import SyntheticTripSpec, generate_trip
+from itingen.cli import main
+from itingen.pipeline.filtering import PersonFilter
+from itingen.providers import FileProvider, SqliteProvider
+from itingen.providers.sqlite_provider import import_trip
+
+
+@pytest.fixture
+def trip(tmp_path):
+    trip_dir = generate_trip(tmp_path / "trip", SyntheticTripSpec(days=4, events_per_day=5, travelers=3, seed=5))
+    (trip_dir / "events" / "2026-01-02.md").write_text(
+        (trip_dir / "events" / "2026-01-02.md").read_text() + "\nFree-form notes the parser ignores.\n"
+    )
+    return trip_dir
+
+
+def test_provider_matches_file_provider(trip, tmp_path):
+    counts = import_trip(trip, tmp_path / "trip.db")
+    files, db = FileProvider(trip), SqliteProvider(tmp_path / "trip.db")
+
+    assert counts["events"] == 20
+    assert db.get_events() == files.get_events()
+    assert db.get_venues() == files.get_venues()
+    assert db.get_config() == files.get_config()
+
+
+def test_filters_are_pushed_down(trip, tmp_path):
+    import_trip(trip, tmp_path / "trip.db")
+    events = FileProvider(trip).get_events()
+
+    person = SqliteProvider(tmp_path / "trip.db", person="traveler3").get_events()
+    assert person == PersonFilter("traveler3").hydrate(events)
+
+    dated = SqliteProvider(tmp_path / "trip.db", start_date="2026-01-02", end_date="2026-01-03", kinds=["meal"])
+    assert dated.get_events() == [
+        ev for ev in events if "2026-01-02" <= ev.date <= "2026-01-03" and ev.kind == "meal"
+    ]
+
+
+def test_import_export_round_trip_is_byte_exact(trip, tmp_path):
+    assert main(["db", "import", "--trip", str(trip), "--db", str(tmp_path / "trip.db")]) == 0
+    assert main(["db", "export", "--db", str(tmp_path / "trip.db"), "--output", str(tmp_path / "copy")]) == 0
+
+    comparison = filecmp.dircmp(trip, tmp_path / "copy")
+    assert not comparison.left_only and not comparison.right_only
+    for sub in ("events", "venues"):
+        names = sorted(p.name for p in (trip / sub).iterdir())
+        match, mismatch, errors = filecmp.cmpfiles(trip / sub, tmp_path / "copy" / sub, names, shallow=False)
+        assert mismatch == [] and errors == []
+    assert (trip / "config.yaml").read_bytes() == (tmp_path / "copy" / "config.yaml").read_bytes()
+
+    # Re-importing over an existing database replaces its contents
+    import_trip(tmp_path / "copy", tmp_path / "trip.db")
+    assert len(SqliteProvider(tmp_path / "trip.db").get_events()) == 20
+
+
+def test_missing_database_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Trip database not found"):
+        SqliteProvider(tmp_path / "missing.db")
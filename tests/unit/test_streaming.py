@@ -0,0 +1,170 @@
+"""Tests for day-by-day streaming execution."""
+
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from itingen.bench.synthetic import SyntheticTripSpec, generate_trip
+from itingen.core.base import BaseEmitter, BaseHydrator, BaseProvider, DayStreamWriter
+from itingen.core.domain.events import Event
+from itingen.pipeline.annotations import EmotionalAnnotationHydrator
+from itingen.pipeline.filtering import PersonFilter
+from itingen.pipeline.nz_transitions import create_nz_transition_registry
+from itingen.pipeline.orchestrator import PipelineOrchestrator
+from itingen.pipeline.sorting import ChronologicalSorter
+from itingen.pipeline.streaming import StreamingHydration, iter_days
+from itingen.pipeline.timing import WrapUpHydrator
+from itingen.pipeline.transitions_logic import TransitionHydrator
+from itingen.providers import FileProvider
+from itingen.rendering.json import JsonEmitter
+from itingen.rendering.markdown import MarkdownEmitter
+
+
+def _day(date: str, *headings: str) -> List[Event]:
+    return [Event(event_heading=h, date=date, time_utc=f"{date}T0{i}:00:00Z") for i, h in enumerate(headings)]
+
+
+class NeighbourHydrator(BaseHydrator[Event]):
+    """Records the headings of the events up to two positions away."""
+
+    neighbour_window = 2
+
+    def hydrate(self, items, context=None):
+        return [
+            ev.model_copy(update={"seen": [x.event_heading for x in items[max(0, i - 2):i + 3]]})
+            for i, ev in enumerate(items)
+        ]
+
+
+class CountingProvider(BaseProvider[Event]):
+    def __init__(self, events: List[Event]):
+        self.events = events
+        self.yielded = 0
+
+    def get_events(self) -> List[Event]:
+        return list(self.events)
+
+    def iter_events(self) -> Iterator[Event]:
+        for event in self.events:
+            self.yielded += 1
+            yield event
+
+    def get_venues(self) -> Dict[str, Any]:
+        return {}
+
+    def get_config(self) -> Dict[str, Any]:
+        return {}
+
+
+class SpyEmitter(BaseEmitter[Event]):
+    def __init__(self, provider: CountingProvider):
+        self.provider = provider
+        self.days: List[List[str]] = []
+        self.yielded_at_write: List[int] = []
+
+    def emit(self, itinerary, output_path):
+        raise AssertionError("streaming runs must use open_stream")
+
+    def open_stream(self, output_path):
+        spy = self
+
+        class Writer(DayStreamWriter[Event]):
+            def write_day(self, items):
+                spy.days.append([ev.event_heading for ev in items])
+                spy.yielded_at_write.append(spy.provider.yielded)
+
+            def close(self):
+                return output_path
+
+        return Writer()
+
+
+def test_iter_days_groups_contiguous_dates():
+    events = _day("2026-01-01", "a", "b") + _day("2026-01-02", "c") + _day("2026-01-03", "d", "e")
+    assert [[ev.event_heading for ev in day] for day in iter_days(events)] == [["a", "b"], ["c"], ["d", "e"]]
+
+
+def test_misfiled_event_is_merged_into_its_day(tmp_path):
+    # The day 2 file also holds a day 1 event, like trips/nz_2026/events/2026-01-07.md
+    misfiled = Event(event_heading="m", date="2026-01-01", time_utc="2026-01-01T05:00:00Z")
+    events = _day("2026-01-01", "a", "b") + _day("2026-01-02", "c") + [misfiled] + _day("2026-01-03", "d")
+    assert [[ev.event_heading for ev in day] for day in iter_days(events)] == [["a", "b", "m"], ["c"], ["d"]]
+
+    def pipeline():
+        return PipelineOrchestrator(
+            CountingProvider(events),
+            hydrators=[ChronologicalSorter(), WrapUpHydrator(), TransitionHydrator(create_nz_transition_registry())],
+            emitters=[MarkdownEmitter()],
+        )
+
+    pipeline().execute(tmp_path / "batch")
+    pipeline().execute_streaming(tmp_path / "stream")
+    assert (tmp_path / "stream" / "output_0.md").read_text() == (tmp_path / "batch" / "output_0.md").read_text()
+
+    # Two days late, day 1 has already been streamed
+    late = _day("2026-01-01", "a") + _day("2026-01-02", "b") + _day("2026-01-03", "c") + [misfiled]
+    with pytest.raises(ValueError, match="dated 2026-01-01 arrived after days up to 2026-01-01"):
+        list(iter_days(late))
+
+
+def test_halo_wider_than_a_day_matches_whole_list():
+    events = [ev for d in range(1, 7) for ev in _day(f"2026-01-0{d}", f"e{d}")]
+    events += _day("2026-01-07", "x", "y", "z")
+
+    expected = NeighbourHydrator().hydrate(events)
+    streamed = [ev for day in StreamingHydration([(0, NeighbourHydrator())]).run(iter_days(events)) for ev in day]
+
+    assert [ev.seen for ev in streamed] == [ev.seen for ev in expected]
+
+
+def test_streaming_reads_the_provider_lazily():
+    events = [ev for d in range(1, 8) for ev in _day(f"2026-01-0{d}", f"a{d}", f"b{d}")]
+    provider = CountingProvider(events)
+    emitter = SpyEmitter(provider)
+    orchestrator = PipelineOrchestrator(provider, hydrators=[WrapUpHydrator()], emitters=[emitter])
+
+    orchestrator.execute_streaming()
+
+    assert orchestrator.events_streamed == 14
+    assert emitter.days[0] == ["a1", "b1"]
+    # Day 1 is written as soon as day 2 (its wrap-up halo) is complete; with
+    # one day held back for misfiled events, that is once day 4 has started
+    assert emitter.yielded_at_write[0] == 7
+
+
+def test_streaming_output_matches_batch_output(tmp_path):
+    trip = generate_trip(tmp_path / "trip", SyntheticTripSpec(days=5, events_per_day=4, travelers=3, seed=11))
+
+    def pipeline(**kwargs):
+        return PipelineOrchestrator(
+            FileProvider(trip),
+            hydrators=[
+                ChronologicalSorter(),
+                PersonFilter("traveler2"),
+                WrapUpHydrator(),
+                EmotionalAnnotationHydrator(),
+                TransitionHydrator(create_nz_transition_registry()),
+            ],
+            emitters=[MarkdownEmitter(), JsonEmitter()],
+            **kwargs,
+        )
+
+    batch = pipeline().execute(tmp_path / "batch")
+    for coalesce in (True, False):
+        out = tmp_path / f"stream_{coalesce}"
+        orchestrator = pipeline(coalesce_patches=coalesce)
+        orchestrator.execute_streaming(out)
+
+        assert orchestrator.events_streamed == len(batch)
+        for name in ("output_0.md", "output_1.json"):
+            assert (out / name).read_text() == (tmp_path / "batch" / name).read_text()
+
+
+def test_whole_list_hydrators_are_rejected():
+    class Dedupe(BaseHydrator[Event]):
+        def hydrate(self, items, context=None):
+            return items
+
+    orchestrator = PipelineOrchestrator(CountingProvider([]), hydrators=[Dedupe()], emitters=[JsonEmitter()])
+    with pytest.raises(ValueError, match=r"Hydrator 0 \(Dedupe\) needs the whole itinerary"):
+        orchestrator.execute_streaming()
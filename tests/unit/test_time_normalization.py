@@ -0,0 +1,103 @@
+"""Tests for typed time fields and their consumers."""
+
+import datetime
+
+from itingen.core.base import PipelineContext
+from itingen.core.domain.events import Event
+from itingen.pipeline.normalization import TimeNormalizationHydrator
+from itingen.pipeline.sorting import ChronologicalSorter
+from itingen.utils.grouping import event_date
+from itingen.utils.times import get_zone, localize_many, local_clock, target_clock
+
+
+def _context(timezone="Pacific/Auckland"):
+    return PipelineContext(venues={}, config={"timezone": timezone})
+
+
+def test_hydrator_parses_times_once():
+    events = [
+        Event(event_heading="Local", time_local="2026-01-03 08:00", no_later_than="2026-01-03 08:30"),
+        Event(event_heading="Zoned", time_local="2026-01-03 08:00", timezone="America/Los_Angeles"),
+        Event(event_heading="UTC", time_utc="2025-12-30T16:00Z", time_local="2025-12-30 08:00"),
+        Event(event_heading="Deadline", no_later_than="2026-01-04 07:15"),
+        Event(event_heading="None"),
+    ]
+    result = TimeNormalizationHydrator().hydrate(events, _context())
+
+    assert result[0].time_local_dt == datetime.datetime(2026, 1, 3, 8, 0)
+    assert result[0].no_later_than_dt == datetime.datetime(2026, 1, 3, 8, 30)
+    # 08:00 NZDT is 19:00 UTC the previous day
+    assert result[0].time_epoch == datetime.datetime(2026, 1, 2, 19, 0, tzinfo=datetime.timezone.utc).timestamp()
+    assert result[1].time_epoch == datetime.datetime(2026, 1, 3, 16, 0, tzinfo=datetime.timezone.utc).timestamp()
+    assert result[2].time_epoch == datetime.datetime(2025, 12, 30, 16, 0, tzinfo=datetime.timezone.utc).timestamp()
+    assert result[3].time_epoch == datetime.datetime(2026, 1, 3, 18, 15, tzinfo=datetime.timezone.utc).timestamp()
+    assert result[4] is events[4]
+    # Only events that name their own timezone get time_utc filled in
+    assert result[0].time_utc is None
+    assert result[1].time_utc == "2026-01-03T16:00Z"
+    assert event_date(result[1]) == "2026-01-03"
+
+    # East of UTC the filled time_utc falls on the previous day; the event stays on its local day
+    breakfast = Event(event_heading="Breakfast", time_local="2026-01-10 08:00", timezone="Pacific/Auckland")
+    (normalized,) = TimeNormalizationHydrator().hydrate([breakfast], _context())
+    assert normalized.time_utc == "2026-01-09T19:00Z"
+    assert event_date(breakfast) == event_date(normalized) == "2026-01-10"
+
+    # Derived fields never reach serialized output
+    dumped = result[0].model_dump(mode="json")
+    assert "time_epoch" not in dumped and "time_local_dt" not in dumped
+
+
+def test_sorter_orders_local_times_across_timezones():
+    events = [
+        Event(event_heading="LA evening", time_local="2026-01-02 18:00", timezone="America/Los_Angeles"),
+        Event(event_heading="No time"),
+        Event(event_heading="NZ morning", time_local="2026-01-03 08:00"),
+        Event(event_heading="UTC flight", time_utc="2026-01-02T20:00Z"),
+    ]
+    # 19:00Z, 20:00Z and 02:00Z the next day
+    expected = ["NZ morning", "UTC flight", "LA evening", "No time"]
+
+    # Normalized and raw events sort the same way
+    normalized = TimeNormalizationHydrator().hydrate(events, _context())
+    for items in (normalized, events):
+        ordered = ChronologicalSorter().hydrate(items, _context())
+        assert [event.event_heading for event in ordered] == expected
+
+
+def test_clock_helpers_match_with_and_without_normalization():
+    events = [
+        Event(time_local="2026-01-03 14:30:00"),
+        Event(time_local="09:15"),
+        Event(no_later_than="2026-01-03 07:45"),
+        Event(),
+    ]
+    normalized = TimeNormalizationHydrator().hydrate(events, _context())
+
+    for raw, event in zip(events, normalized):
+        assert local_clock(raw) == local_clock(event)
+        assert target_clock(raw) == target_clock(event)
+    assert local_clock(normalized[0]) == "14:30:00"
+    assert local_clock(normalized[0], seconds=False) == "14:30"
+    assert local_clock(normalized[1]) == "09:15"
+    assert target_clock(normalized[2]) == "07:45"
+    assert target_clock(normalized[3]) is None
+
+
+def test_bulk_localization_matches_datetime_across_dst_transitions():
+    # Every 15 minutes across both 2026 transitions, including the skipped
+    # and repeated hours, in zones with whole-hour and half-hour DST shifts
+    locals_, zones = [], []
+    for zone, days in (("Pacific/Auckland", ("2026-04-05", "2026-09-27")),
+                       ("America/Los_Angeles", ("2026-03-08", "2026-11-01")),
+                       ("Australia/Lord_Howe", ("2026-04-05", "2026-10-04"))):
+        for day in days:
+            start = datetime.datetime.fromisoformat(day) - datetime.timedelta(days=1)
+            for step in range(3 * 24 * 4):
+                locals_.append(start + datetime.timedelta(minutes=15 * step))
+                zones.append(zone)
+    locals_.append(datetime.datetime(2026, 1, 1))
+    zones.append("Not/AZone")
+
+    expected = [int(local.replace(tzinfo=get_zone(zone)).timestamp()) for local, zone in zip(locals_[:-1], zones)]
+    assert localize_many(locals_, zones) == expected + [None]
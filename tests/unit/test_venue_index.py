@@ -0,0 +1,77 @@
+"""Tests for the venue index and lazy venue mapping."""
+
+import json
+
+import pytest
+
+from itingen.bench.synthetic import SyntheticTripSpec, generate_trip
+from itingen.core.base import PipelineContext
+from itingen.pipeline.memoization import fingerprint_context
+from itingen.providers import venue_index
+from itingen.providers.file_provider import LocalFileProvider
+from itingen.providers.venue_index import VENUE_INDEX_NAME, LazyVenueMapping
+
+
+@pytest.fixture
+def trip(tmp_path):
+    return generate_trip(tmp_path / "trip", SyntheticTripSpec(days=2, events_per_day=2, venues=5))
+
+
+def test_lazy_venues_parse_only_accessed_entries(trip):
+    eager = LocalFileProvider(trip).get_venues()
+    lazy = LocalFileProvider(trip, lazy_venues=True).get_venues()
+
+    assert isinstance(lazy, LazyVenueMapping)
+    assert (trip / VENUE_INDEX_NAME).exists()
+    assert len(lazy) == len(eager) and set(lazy) == set(eager)
+    assert "venue-00001" in lazy and "missing" not in lazy
+    assert lazy.loaded_count == 0
+
+    assert lazy["venue-00001"] == eager["venue-00001"]
+    assert lazy["venue-00001"] is lazy["venue-00001"]
+    assert lazy.loaded_count == 1
+    assert lazy.entry("venue-00002")["canonical_name"] == eager["venue-00002"].canonical_name
+    assert lazy.loaded_count == 1
+
+    with pytest.raises(KeyError):
+        lazy["missing"]
+    assert dict(lazy) == eager
+
+
+def test_index_refresh_reads_only_changed_files(trip, monkeypatch):
+    LazyVenueMapping.for_trip(trip)
+
+    reads = []
+    original = venue_index._entry
+    monkeypatch.setattr(venue_index, "_entry", lambda path, stat: reads.append(path.name) or original(path, stat))
+
+    venues_dir = trip / "venues"
+    LazyVenueMapping.for_trip(trip)
+    assert reads == []
+
+    edited = venues_dir / "venue-00001.json"
+    data = json.loads(edited.read_text(encoding="utf-8"))
+    data["canonical_name"] = "Renamed Venue"
+    edited.write_text(json.dumps(data), encoding="utf-8")
+    (venues_dir / "venue-00002.json").unlink()
+    added = dict(data, venue_id="venue-new", canonical_name="New Venue")
+    (venues_dir / "venue-new.json").write_text(json.dumps(added), encoding="utf-8")
+
+    venues = LazyVenueMapping.for_trip(trip)
+    assert sorted(reads) == ["venue-00001.json", "venue-new.json"]
+    assert "venue-00002" not in venues
+    assert venues["venue-00001"].canonical_name == "Renamed Venue"
+    assert venues.entry("venue-new")["canonical_name"] == "New Venue"
+
+
+def test_context_fingerprint_does_not_load_lazy_venues(trip):
+    venues = LazyVenueMapping.for_trip(trip)
+    before = fingerprint_context(PipelineContext(venues=venues, config={}))
+    assert venues.loaded_count == 0
+    assert fingerprint_context(PipelineContext(venues=LazyVenueMapping.for_trip(trip), config={})) == before
+
+    edited = trip / "venues" / "venue-00003.json"
+    data = json.loads(edited.read_text(encoding="utf-8"))
+    data["aliases"] = data["aliases"] + ["Old Name"]
+    edited.write_text(json.dumps(data), encoding="utf-8")
+    assert fingerprint_context(PipelineContext(venues=LazyVenueMapping.for_trip(trip), config={})) != before
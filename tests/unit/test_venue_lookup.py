@@ -0,0 +1,63 @@
+"""Tests for venue name lookup and the venue resolution hydrator."""
+
+from itingen.core.base import PipelineContext
+from itingen.core.domain.events import Event
+from itingen.core.domain.venues import Venue
+from itingen.hydrators.venues import VenueResolutionHydrator
+from itingen.utils.venue_lookup import VenueLookup
+
+
+def _venues():
+    venues = [
+        Venue(venue_id="akl-airport", canonical_name="Auckland Airport", aliases=["AKL", "Auckland International Airport"]),
+        Venue(venue_id="hotel-indigo", canonical_name="Hotel Indigo Auckland, 51 Albert Street", aliases=["Indigo Auckland"]),
+        Venue(venue_id="te-papa", canonical_name="Museum of New Zealand Te Papa Tongarewa", aliases=["Te Papa"]),
+        Venue(venue_id="cafe-one", canonical_name="Harbour Cafe", aliases=["The Cafe"]),
+        Venue(venue_id="cafe-two", canonical_name="Hill Cafe", aliases=["The Cafe"]),
+    ]
+    return {venue.venue_id: venue for venue in venues}
+
+
+def test_lookup_tiers():
+    lookup = VenueLookup.from_venues(_venues())
+
+    assert lookup.resolve("akl") == "akl-airport"
+    assert lookup.resolve("  Auckland   AIRPORT ") == "akl-airport"
+    assert lookup.resolve("Airport, Auckland") == "akl-airport"
+    assert lookup.resolve("Hotel Indigo Auckland") == "hotel-indigo"
+    assert lookup.resolve("Hotel Indigo Auckland, 53 St Patrick's Square") == "hotel-indigo"
+    assert lookup.resolve("Museum of New Zealand Te Papa Tongarewa, 55 Cable Street") == "te-papa"
+    assert lookup.resolve("Museum of New Zeeland Te Papa") == "te-papa"
+
+
+def test_lookup_rejects_ambiguous_routes_and_unknown_names():
+    lookup = VenueLookup.from_venues(_venues())
+
+    assert lookup.resolve("The Cafe") is None
+    assert lookup.resolve("Harbour Cafe") == "cafe-one"
+    assert lookup.resolve("AKL → Hotel Indigo Auckland") is None
+    assert lookup.resolve("From Te Papa to Hotel Indigo Auckland") is None
+    assert lookup.resolve("Wellington") is None
+    assert lookup.resolve(None) is None
+    assert lookup.resolve_many(["AKL", "", "Te Papa"]) == ["akl-airport", None, "te-papa"]
+
+
+def test_hydrator_attaches_resolved_ids():
+    events = [
+        Event(event_heading="Land", kind="flight", location="Auckland Airport"),
+        Event(event_heading="Drive", kind="drive", travel_from="AKL", travel_to="Indigo Auckland"),
+        Event(event_heading="Museum", location="Te Papa", venue_id="explicit-venue"),
+        Event(event_heading="Walk", location="Somewhere else"),
+    ]
+    hydrator = VenueResolutionHydrator()
+    result = hydrator.hydrate(events, PipelineContext(venues=_venues(), config={}))
+
+    assert result[0].venue_id == "akl-airport"
+    assert result[1].travel_from_venue_id == "akl-airport"
+    assert result[1].travel_to_venue_id == "hotel-indigo"
+    assert result[1].venue_id is None
+    assert result[2].venue_id == "explicit-venue"
+    assert result[3] is events[3]
+    assert events[0].venue_id is None
+
+    assert VenueResolutionHydrator().hydrate(events) == events